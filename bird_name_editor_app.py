@@ -4,22 +4,43 @@ import tkinter.messagebox
 import tkinter.simpledialog
 from tkinter import filedialog
 import customtkinter
-import threading
+import multiprocessing
 import os
 import sys
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, wait
 from functools import partial
 
 # 모듈 임포트
 import name_check
 import thumbnailing
 import main_visualizer
+import ingest
+import thumb_cache
+import wiki_cache
+import wiki_client
+import enrichment
+import rename_plan
+import copy_engine
+from save_journal import SaveJournal
+from progress import MainThreadQueue, ProgressBus
+from jobs import (PRIORITY_ENRICHMENT, PRIORITY_INTERACTIVE, PRIORITY_PREFETCH, JobCancelled, JobContext,
+                  JobScheduler)
+from photo_grid import ImageLRUCache, ThumbnailPrefetcher, VirtualPhotoGrid
+from species_list import SORT_BY_NAME, SORT_OPTIONS, SpeciesRow, VirtualSpeciesList, sort_species_names
+from name_search import FilenameMatcher, KoreanNameSearcher, SpeciesSuggester, SpeciesSuggestion
+from species_index import SpeciesIndex
 
 # 라이브러리들
-import pandas as pd
 from PIL import Image, ImageTk
-import wikipediaapi
+
+PREVIEW_DEBOUNCE_MS = 100  # 이 시간 안에 이어진 키 입력은 한 번의 미리보기 갱신으로 합침
+THUMB_LOADER_WORKERS = 4  # 썸네일 디코딩/정보 보완/미리 읽기가 함께 쓰는 백그라운드 작업자 수
+CHECKSUM_MANIFEST_NAME = "checksums.blake2b"  # b2sum -c로 확인 가능한 형식
+LONG_JOB_WORKERS = 2  # 폴더 로딩, 저장처럼 오래 걸리는 작업
+PREFETCH_PHOTOS_PER_SPECIES = 30  # 이웃 종마다 미리 디코딩할 사진 수 (대략 첫 화면)
+PROGRESS_POLL_MS = 66  # 진행 상황 반영 주기 (약 15Hz, 그 사이 이벤트는 합쳐서 한 번만 그림)
 
 customtkinter.set_appearance_mode("System")
 customtkinter.set_default_color_theme("blue")
@@ -79,11 +100,13 @@ class ReportDialog(customtkinter.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)
         self.title("리포트 형식 선택")
-        self.geometry("450x300")
+        self.geometry("450x550")
         self.transient(parent) # 부모 창 위에 표시
         self.grab_set() # 이 창에만 포커스
 
         self.choice = None
+        self.transfer_mode = copy_engine.MODE_COPY
+        self.verify = False
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
         main_frame = customtkinter.CTkFrame(self)
@@ -111,6 +134,24 @@ class ReportDialog(customtkinter.CTkToplevel):
         for text, value in options.items():
             radio = customtkinter.CTkRadioButton(main_frame, text=text, variable=self.radio_var, value=value)
             radio.pack(anchor="w", padx=30, pady=5)
+
+        # 원본 전송 방식 (링크/이동은 같은 드라이브에서만 가능, 안 되면 일반 복사로 대체)
+        transfer_label = customtkinter.CTkLabel(main_frame, text="원본 전송 방식", font=customtkinter.CTkFont(size=14, weight="bold"))
+        transfer_label.pack(pady=(15, 5))
+        self.transfer_var = tk.StringVar(value=copy_engine.MODE_COPY)
+        transfer_options = {
+            "복사 (원본 유지)": copy_engine.MODE_COPY,
+            "하드링크 (같은 드라이브, 용량 추가 없음)": copy_engine.MODE_HARDLINK,
+            "Reflink 복제 (지원 파일 시스템)": copy_engine.MODE_REFLINK,
+            "이동 (같은 드라이브, 원본 폴더에서 사라짐)": copy_engine.MODE_MOVE,
+        }
+        for text, value in transfer_options.items():
+            radio = customtkinter.CTkRadioButton(main_frame, text=text, variable=self.transfer_var, value=value)
+            radio.pack(anchor="w", padx=30, pady=3)
+        # 보관 전 확인용: 복사본을 BLAKE2b로 대조하고 체크섬 목록을 리포트 폴더에 저장
+        self.verify_var = tk.BooleanVar(value=False)
+        verify_check = customtkinter.CTkCheckBox(main_frame, text="복사 후 체크섬 검증 (BLAKE2b)", variable=self.verify_var)
+        verify_check.pack(anchor="w", padx=30, pady=(10, 0))
             
         button_frame = customtkinter.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(pady=(20, 0))
@@ -123,6 +164,8 @@ class ReportDialog(customtkinter.CTkToplevel):
         
     def _on_ok(self):
         self.choice = self.radio_var.get()
+        self.transfer_mode = self.transfer_var.get()
+        self.verify = self.verify_var.get()
         self.destroy()
 
     def _on_cancel(self):
@@ -149,14 +192,53 @@ class BirdNameEditor(customtkinter.CTk):
         self.bird_name_map: Dict[str, str] = {}
         self.bird_info_map: Dict[str, Dict] = {}
         self.korean_names_list: List[str] = []
-        self.csv_db: Optional[pd.DataFrame] = None
+        self.name_searcher = KoreanNameSearcher([])
+        self.filename_matcher: Optional[FilenameMatcher] = None
+        self.species_suggester: Optional[SpeciesSuggester] = None
+        self.species_suggestions: Dict[str, SpeciesSuggestion] = {}
+        self.species_index: Optional[SpeciesIndex] = None
+        # 종 목록: 그룹별 제안 캐시, 필터 입력 디바운스 타이머, 필터용 검색기 (그룹 이름 집합이 바뀔 때만 다시 만듦)
+        self._group_suggestion_cache: Dict[str, List] = {}
+        self._species_filter_after_id = None
+        self._species_searcher: Optional[KoreanNameSearcher] = None
+        self._species_searcher_names: frozenset = frozenset()
         self.active_entry: Optional[customtkinter.CTkEntry] = None
         self.autocomplete_listbox: Optional[tk.Listbox] = None
-
-        self.wiki = wikipediaapi.Wikipedia(
-            user_agent='BirdRenamerApp/1.0',
-            language='ko',
-            extract_format=wikipediaapi.ExtractFormat.WIKI
+        self.ingest_workers: int = ingest.get_default_workers()
+        self.thumb_cache = thumb_cache.ThumbnailCache(max_bytes=thumb_cache.DEFAULT_MAX_BYTES)
+        self.wiki_cache: Optional[wiki_cache.WikiCache] = None
+
+        # Wiki 조회 클라이언트: 묶음 요청, 연결 재사용, 타임아웃/재시도/차단기 포함
+        self.wiki_client = wiki_client.WikiBatchClient(user_agent=name_check.WIKI_USER_AGENT)
+        # Wiki 보완은 백그라운드에서 처리하여 폴더 로딩이 네트워크를 기다리지 않도록 함
+        self.load_generation = 0
+        self.current_species: Optional[str] = None
+        self.current_entry: Optional[customtkinter.CTkEntry] = None
+        # 작업 스레드는 진행 이벤트만 올리고, 위젯 갱신은 UI 스레드의 타이머가 담당
+        self.progress = ProgressBus()
+        # 작업 스레드의 결과(썸네일 등)를 UI 스레드에서 반영할 함수 큐 (같은 타이머에서 실행)
+        self.ui_queue = MainThreadQueue()
+        # 긴 작업(로딩/저장)은 취소 가능한 작업으로, 짧은 백그라운드 작업은 우선순위 풀에서 실행
+        # (보이는 썸네일 디코딩 > 종 정보 보완 > 이웃 종 미리 읽기)
+        self.jobs = JobScheduler(max_workers=LONG_JOB_WORKERS, name="jobs", progress=self.progress)
+        self.background = JobScheduler(max_workers=THUMB_LOADER_WORKERS, name="background")
+        self.enricher = enrichment.SpeciesEnricher(
+            self._enrich_species_batch, self._on_species_enriched,
+            executor=self.background.executor(PRIORITY_ENRICHMENT)
+        )
+        # 파일명 미리보기: 입력 디바운스 타이머, 국명 → 파일명용 이름 메모, 현재 미리보기 이름
+        self._preview_after_id = None
+        self._preview_name_cache: Dict[str, tuple] = {}
+        self._preview_names = ("", "")
+        # 썸네일 격자: 화면에 보이는 칸의 썸네일을 디코딩하는 작업자 풀
+        self.photo_grid: Optional[VirtualPhotoGrid] = None
+        self.photo_panel: Optional[Dict] = None
+        self.thumb_loader = self.background.executor(PRIORITY_INTERACTIVE)
+        # 표시용 이미지 LRU 캐시 (종을 오가도 다시 디코딩하지 않음) + 목록의 위/아래 종 미리 읽기
+        self.image_cache = ImageLRUCache()
+        self.prefetcher = ThumbnailPrefetcher(
+            self.ui_queue.call, self.background.executor(PRIORITY_PREFETCH),
+            self.image_cache, self.load_grid_image
         )
         
         # --- UI 구성 ---
@@ -175,17 +257,38 @@ class BirdNameEditor(customtkinter.CTk):
         self.btn_save = customtkinter.CTkButton(self.top_frame, text="변경된 이름으로 저장 및 리포트 생성", command=self.save_changes, state="disabled")
         self.btn_save.pack(side="right", padx=10, pady=10)
 
+        self.btn_export_plan = customtkinter.CTkButton(self.top_frame, text="이름 변경 계획 내보내기", command=self.export_rename_plan, state="disabled")
+        self.btn_export_plan.pack(side="right", padx=(10, 0), pady=10)
+
+        self.offline_switch = customtkinter.CTkSwitch(self.top_frame, text="오프라인 모드 (Wiki 캐시만 사용)", command=self.toggle_offline_mode)
+        self.offline_switch.pack(side="right", padx=10, pady=10)
+
         self.main_frame = customtkinter.CTkFrame(self)
         self.main_frame.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
         self.main_frame.grid_columnconfigure(1, weight=1)
         self.main_frame.grid_rowconfigure(0, weight=1)
 
-        self.species_list_frame = customtkinter.CTkScrollableFrame(self.main_frame, width=300)
+        self.species_list_frame = customtkinter.CTkFrame(self.main_frame, width=300)
         self.species_list_frame.grid(row=0, column=0, padx=10, pady=10, sticky="ns")
         self.species_list_label = customtkinter.CTkLabel(self.species_list_frame, text="탐지된 조류 목록", font=customtkinter.CTkFont(size=15, weight="bold"))
         self.species_list_label.pack(pady=5, padx=10, fill="x")
+        # 종 목록 필터 (국명/초성/영명/학명)와 정렬 방식
+        self.species_filter_entry = customtkinter.CTkEntry(self.species_list_frame, placeholder_text="종 검색 (초성, 영명, 학명 가능)")
+        self.species_filter_entry.pack(padx=10, pady=(0, 5), fill="x")
+        self.species_filter_entry.bind("<KeyRelease>", lambda e: self.schedule_species_filter())
+        self.species_sort_button = customtkinter.CTkSegmentedButton(
+            self.species_list_frame, values=SORT_OPTIONS, command=lambda value: self.refresh_species_list(keep_position=False)
+        )
+        self.species_sort_button.set(SORT_BY_NAME)
+        self.species_sort_button.pack(padx=10, pady=(0, 5), fill="x")
+        # 보이는 줄만 버튼을 만드는 가상화 목록 (그룹이 수천 개여도 목록 생성 시간이 일정)
+        self.species_list = VirtualSpeciesList(
+            self.species_list_frame, on_select=self.display_photos_for_species,
+            on_accept_suggestion=self.accept_species_suggestion
+        )
+        self.species_list.pack(fill="both", expand=True, pady=(0, 5))
 
-        self.photo_view_frame = customtkinter.CTkScrollableFrame(self.main_frame)
+        self.photo_view_frame = customtkinter.CTkFrame(self.main_frame)
         self.photo_view_frame.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="nsew")
         self.photo_view_intro_label = customtkinter.CTkLabel(self.photo_view_frame, text="\n\n\n\n폴더를 열면 이곳에 사진이 표시됩니다.", font=customtkinter.CTkFont(size=20))
         self.photo_view_intro_label.pack(expand=True, fill="both")
@@ -193,9 +296,17 @@ class BirdNameEditor(customtkinter.CTk):
         self.status_bar = customtkinter.CTkFrame(self, height=30)
         self.status_bar.grid(row=2, column=0, padx=10, pady=(0, 10), sticky="ew")
         self.status_label = customtkinter.CTkLabel(self.status_bar, text="준비 완료.", anchor="w")
-        self.status_label.pack(side="left", padx=10)
+        self.status_label.pack(side="left", padx=10, fill="x", expand=True)
+        self.progress_bar = customtkinter.CTkProgressBar(self.status_bar, width=200)
+        self.progress_bar.set(0)
+        self.progress_detail_label = customtkinter.CTkLabel(self.status_bar, text="", anchor="e")
+        self.btn_cancel_job = customtkinter.CTkButton(self.status_bar, text="작업 취소", width=80,
+                                                      command=self.jobs.cancel_all, state="disabled")
+        self.btn_cancel_job.pack(side="right", padx=10, pady=2)
+        self.progress_detail_label.pack(side="right", padx=10)
         
         self.load_db()
+        self.after(PROGRESS_POLL_MS, self._poll_progress)
 
     def load_db(self):
         try:
@@ -219,20 +330,20 @@ class BirdNameEditor(customtkinter.CTk):
                 
                 self.update_status("원본 조류 DB 로드 중... (csv_preprocessor.py로 영명을 미리 보완하는 것을 권장합니다)")
 
-            self.csv_db = pd.read_csv(csv_path)
-            
-            # 컬럼 정리 (영명 컬럼이 있을 수도 없을 수도 있음)
-            for col in ['국명', '영명', '학명', '목', '과', 'Wiki목', 'Wiki과']:
-                if col in self.csv_db.columns:
-                    self.csv_db[col] = self.csv_db[col].fillna('')
+            # CSV는 한 번만 읽어 국명/학명/영명 색인으로 만들고, 이후 조회는 모두 색인 사용
+            self.species_index = SpeciesIndex.from_csv(csv_path)
+            self._preview_name_cache.clear()
+            self.open_wiki_cache(os.path.dirname(csv_path))
             
-            self.korean_names_list = sorted(list(self.csv_db['국명'].dropna().unique()))
+            self.korean_names_list = self.species_index.korean_names
+            self.name_searcher = KoreanNameSearcher(self.korean_names_list)
+            self.filename_matcher = FilenameMatcher.from_species_index(self.species_index)
+            self.species_suggester = SpeciesSuggester(self.korean_names_list)
             
             # 영명 보완된 파일인지 확인
-            if '영명' in self.csv_db.columns:
-                filled_english = self.csv_db['영명'].notna() & (self.csv_db['영명'] != '') & (self.csv_db['영명'] != 'nan')
-                english_count = filled_english.sum()
-                total_count = len(self.csv_db)
+            if '영명' in self.species_index.columns:
+                english_count = self.species_index.count_with_english_name()
+                total_count = len(self.species_index)
                 
                 if english_count > 0:
                     self.update_status(f"조류 DB 로드 완료. (영명 {english_count}/{total_count}개 보완됨)")
@@ -251,10 +362,49 @@ class BirdNameEditor(customtkinter.CTk):
                 f"자동완성 기능이 제한됩니다."
             )
             self.korean_names_list = []
+            self.name_searcher = KoreanNameSearcher([])
+
+    def open_wiki_cache(self, csv_dir: str):
+        """CSV 옆(또는 사용자 폴더)의 Wikipedia 조회 캐시 열기"""
+        try:
+            self.wiki_cache = wiki_cache.WikiCache(
+                wiki_cache.get_default_cache_path(csv_dir), offline=bool(self.offline_switch.get())
+            )
+        except Exception as e:
+            print(f"Wiki 캐시 열기 실패: {e}")
+            self.wiki_cache = None
+
+    def toggle_offline_mode(self):
+        offline = bool(self.offline_switch.get())
+        if self.wiki_cache is not None:
+            self.wiki_cache.offline = offline
+        if not offline:
+            # 온라인으로 다시 전환하면 차단기와 재시도 예산을 초기화하여 다시 시도
+            self.wiki_client.reset_stats()
+        self.update_status("오프라인 모드: Wiki 캐시에 있는 정보만 사용합니다." if offline else "온라인 모드: 캐시에 없는 정보는 Wiki에서 조회합니다.")
 
     def update_status(self, msg: str):
-        self.status_label.configure(text=msg)
-        self.update_idletasks()
+        """어느 스레드에서나 호출 가능 (실제 표시는 _poll_progress가 담당)"""
+        self.progress.post(message=msg)
+
+    def _poll_progress(self):
+        """작업 스레드가 넘긴 결과를 반영하고, 쌓인 진행 이벤트를 합쳐 상태 표시줄/진행 막대를 한 번만 갱신"""
+        # 다음 실행을 먼저 예약: 큐의 메시지 상자가 열려 있는 동안에도 진행 표시는 계속 갱신됨
+        self.after(PROGRESS_POLL_MS, self._poll_progress)
+        self.ui_queue.run_pending()
+        snapshot = self.progress.drain()
+        if snapshot is not None:
+            self.status_label.configure(text=snapshot.message)
+            self.progress_detail_label.configure(text=snapshot.detail_text())
+            if snapshot.stage and snapshot.total:
+                if not self.progress_bar.winfo_ismapped():
+                    self.progress_bar.pack(side="right", padx=10, before=self.progress_detail_label)
+                self.progress_bar.set(snapshot.fraction)
+            elif self.progress_bar.winfo_ismapped():
+                self.progress_bar.pack_forget()
+        cancel_state = "normal" if self.jobs.active_jobs() else "disabled"
+        if self.btn_cancel_job.cget("state") != cancel_state:
+            self.btn_cancel_job.configure(state=cancel_state)
 
     def select_folder_and_load(self):
         folder = filedialog.askdirectory()
@@ -263,105 +413,288 @@ class BirdNameEditor(customtkinter.CTk):
         self.source_folder = folder
         self.folder_label.configure(text=f"현재 폴더: {self.source_folder}")
         self.btn_save.configure(state="disabled")
+        self.btn_export_plan.configure(state="disabled")
 
         self.species_photo_map.clear()
         self.bird_name_map.clear()
         self.bird_info_map.clear()
         
-        for widget in self.species_list_frame.winfo_children(): widget.destroy()
+        self.species_suggestions = {}
+        self._group_suggestion_cache.clear()
+        self.species_list.set_rows([], keep_position=False)
+        self.species_list.set_selected(None)
         for widget in self.photo_view_frame.winfo_children(): widget.destroy()
         
-        self.species_list_label = customtkinter.CTkLabel(self.species_list_frame, text="탐지된 조류 목록", font=customtkinter.CTkFont(size=15, weight="bold"))
-        self.species_list_label.pack(pady=5, padx=10, fill="x")
-        
         self.photo_view_intro_label = customtkinter.CTkLabel(self.photo_view_frame, text="\n\n\n\n사진을 불러오는 중입니다...", font=customtkinter.CTkFont(size=20))
         self.photo_view_intro_label.pack(expand=True, fill="both")
 
-        threading.Thread(target=self.load_photos_thread, daemon=True).start()
+        # 이전 폴더의 로딩과 아직 시작하지 않은 정보 보완은 취소하고 새 세대 번호로 시작
+        self.load_generation += 1
+        self.enricher.clear()
+        self.jobs.start(self.load_photos_job, "사진 불러오기", key="load", args=(folder, self.load_generation))
 
-    def load_photos_thread(self):
+    def load_photos_job(self, ctx: JobContext, source_folder: str, generation: int):
+        """작업자 스레드에서 실행: 결과는 지역 맵에 모았다가 메인 스레드에서 한 번에 반영"""
         try:
-            self.update_status("사진 파일 목록을 읽는 중...")
-            image_extensions = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"}
-            all_files = [f for f in os.listdir(self.source_folder) if os.path.splitext(f)[1].lower() in image_extensions]
-            
-            self.thumbnail_folder = os.path.join(self.source_folder, "renamer_thumbnails")
-            os.makedirs(self.thumbnail_folder, exist_ok=True)
-
-            for i, filename in enumerate(all_files):
-                self.update_status(f"파일 분석 중 ({i+1}/{len(all_files)}): {filename}")
-                file_path = os.path.join(self.source_folder, filename)
-                
-                guessed_names = name_check.extract_korean_bird_names_from_filename(filename)
-                initial_bird_name = guessed_names[0] if guessed_names else "미분류"
+            ctx.report("사진 파일 목록을 읽는 중...")
+            all_files = ingest.list_image_files(source_folder)
+            ctx.check()
+
+            # 파일명에서 추정한 종 이름은 CSV 정보로 바로 등록하고,
+            # 부족한 정보는 백그라운드 작업자가 Wiki에서 보완
+            guessed_by_file = name_check.guess_bird_names_from_filenames(all_files, self.filename_matcher)
+            # 체크리스트에 없는 이름으로 분류된 파일은 오타 교정 제안을 한 번에 계산
+            species_suggestions = {}
+            if self.species_suggester is not None:
+                unresolved = [f for f, name in guessed_by_file.items() if name not in self.species_index]
+                species_suggestions = self.species_suggester.suggest_many(unresolved)
+            bird_infos: Dict[str, Dict] = {}
+            needs_enrichment = []
+            for name in dict.fromkeys(guessed_by_file.values()):
+                bird_infos[name], needs_wiki = name_check.resolve_bird_info_csv(name, self.species_index)
+                if needs_wiki: needs_enrichment.append(name)
+            ctx.check()
+            self.enricher.submit(needs_enrichment, tag=generation)
+
+            # 썸네일/EXIF는 작업자 풀에서 병렬 처리, 결과는 파일 순서대로 도착
+            # 썸네일은 공용 캐시에 저장되어 다른 폴더의 같은 사진도 다시 만들지 않음
+            records = ingest.ingest_photos(
+                source_folder, all_files, workers=self.ingest_workers, cache=self.thumb_cache
+            )
+            species_photo_map: Dict[str, List[Dict]] = {}
+            bird_name_map: Dict[str, str] = {}
+            ctx.report("파일 분석 중...", current=0, total=len(all_files))
+            for i, (filename, result) in enumerate(records):
+                # 취소되면 반복을 빠져나오며 ingest 풀의 남은 작업도 정리됨
+                ctx.check()
+                ctx.report(f"파일 분석 중: {filename}", current=i + 1)
+                file_path = os.path.join(source_folder, filename)
                 
-                if initial_bird_name not in self.bird_info_map:
-                    self.bird_info_map[initial_bird_name] = name_check.resolve_bird_info(
-                        initial_bird_name, self.csv_db, self.wiki
-                    )
-
-                thumb_path = os.path.join(self.thumbnail_folder, f"{os.path.splitext(filename)[0]}_thumb.jpg")
-                if not os.path.exists(thumb_path):
-                    thumbnailing.create_single_thumbnail(file_path, thumb_path)
+                initial_bird_name = guessed_by_file[filename]
 
-                dt = None
-                try:
-                    with Image.open(file_path) as img: dt = thumbnailing.get_photo_datetime(img)
-                except Exception: pass
-
-                photo_info = {"original_filename": filename, "path": file_path, "thumbnail_path": thumb_path, "datetime": dt}
+                photo_info = {"original_filename": filename, "path": file_path,
+                              "thumbnail_path": result["thumbnail_path"], "datetime": result["datetime"],
+                              "width": result["width"], "height": result["height"],
+                              "pyramid": result.get("pyramid", {})}
                 
-                if initial_bird_name not in self.species_photo_map:
-                    self.species_photo_map[initial_bird_name] = []
-                self.species_photo_map[initial_bird_name].append(photo_info)
-                self.bird_name_map[filename] = initial_bird_name
+                species_photo_map.setdefault(initial_bird_name, []).append(photo_info)
+                bird_name_map[filename] = initial_bird_name
 
-            self.update_status("종 목록 표시...")
-            self.display_species_list()
-            self.btn_save.configure(state="normal")
-            self.update_status("사진 로딩 완료.")
+            ctx.check()
+            ctx.report("종 목록 표시...")
+            self.ui_queue.call(self._apply_loaded_photos, ctx, generation,
+                       species_photo_map, bird_name_map, bird_infos, species_suggestions)
 
+        except JobCancelled:
+            raise
         except Exception as e:
-            self.update_status(f"오류: {e}")
-            tkinter.messagebox.showerror("오류", f"사진 로딩 중 오류 발생: {e}")
+            self.progress.finish(f"오류: {e}")
+            self.ui_queue.call(tkinter.messagebox.showerror, "오류", f"사진 로딩 중 오류 발생: {e}")
+
+    def _apply_loaded_photos(self, ctx: JobContext, generation: int, species_photo_map: Dict[str, List[Dict]],
+                             bird_name_map: Dict[str, str], bird_infos: Dict[str, Dict],
+                             species_suggestions: Dict[str, SpeciesSuggestion]):
+        """메인 스레드에서 로딩 결과 반영 (그사이 취소되었거나 다른 폴더를 열었으면 버림)"""
+        if ctx.cancelled or generation != self.load_generation: return
+        self.thumbnail_folder = self.thumb_cache.cache_dir
+        self.species_photo_map.update(species_photo_map)
+        self.bird_name_map.update(bird_name_map)
+        # 로딩 중에 백그라운드 보완이 먼저 끝난 종은 보완된 정보를 유지
+        for name, info in bird_infos.items():
+            self.bird_info_map.setdefault(name, info)
+        self.species_suggestions = species_suggestions
+        self.display_species_list()
+        self.btn_save.configure(state="normal")
+        self.btn_export_plan.configure(state="normal")
+        self.progress.finish(f"사진 로딩 완료. ({self.wiki_stats_text()})")
+
+    def _enrich_species_batch(self, names: List[str]) -> Dict[str, Dict]:
+        """백그라운드 작업자에서 실행: 여러 종의 정보를 Wiki에서 일괄 보완"""
+        return name_check.resolve_bird_info_batch(
+            names, self.species_index, self.wiki_client, wiki_cache=self.wiki_cache
+        )
+
+    def _on_species_enriched(self, name: str, info: Optional[Dict], generation: int):
+        """백그라운드 작업자에서 실행: 결과를 UI 스레드 큐에 넣기만 함 (맵은 UI 스레드에서만 변경)"""
+        if info is None: return
+        self.ui_queue.call(self._apply_species_info, name, info, generation)
+
+    def _apply_species_info(self, name: str, info: Dict, generation: int):
+        """UI 스레드에서 보완 결과 반영 (그사이 다른 폴더를 열었으면 버림)"""
+        if generation != self.load_generation: return
+        self.bird_info_map[name] = info
+        self.refresh_species_info(name)
+
+    def _snapshot_maps(self) -> Tuple[Dict[str, str], Dict[str, List[Dict]], Dict[str, Dict]]:
+        """UI 스레드에서 호출: 저장 작업이 읽을 (파일 → 종, 종 → 사진, 종 → 정보) 사본"""
+        return (dict(self.bird_name_map),
+                {name: list(photos) for name, photos in self.species_photo_map.items()},
+                dict(self.bird_info_map))
+
+    def _wait_for_snapshot(self, ctx: JobContext):
+        """작업 스레드에서 호출: UI 스레드 큐에 이미 들어온 결과까지 반영된 맵 사본을 받음"""
+        maps: Future = Future()
+        self.ui_queue.call(lambda: maps.set_result(self._snapshot_maps()))
+        while not wait([maps], timeout=1).done:
+            ctx.check()
+        return maps.result()
+
+    def wiki_stats_text(self) -> str:
+        """Wiki 캐시 적중률과 요청/실패/지연 통계"""
+        parts = [self.wiki_client.stats_text()]
+        if self.wiki_cache: parts.insert(0, self.wiki_cache.stats_text())
+        return ", ".join(parts)
+
+    def refresh_species_info(self, name: str):
+        """현재 보고 있는 종의 정보 패널 갱신"""
+        if name != self.current_species or self.current_entry is None: return
+        if not self.current_entry.winfo_exists(): return
+        self.update_filename_previews(name, self.current_entry.get())
 
     def display_species_list(self):
-        for widget in self.species_list_frame.winfo_children():
-            if isinstance(widget, customtkinter.CTkButton): widget.destroy()
-        
-        sorted_species = sorted(self.species_photo_map.keys())
-        for species_name in sorted_species:
-            btn = customtkinter.CTkButton(
-                self.species_list_frame,
-                text=f"{species_name} ({len(self.species_photo_map[species_name])})",
-                command=partial(self.display_photos_for_species, species_name)
-            )
-            btn.pack(fill="x", padx=5, pady=2)
+        """종 목록 전체 다시 표시 (폴더를 새로 불러왔을 때)"""
+        self.refresh_species_list(keep_position=False)
         
         if self.photo_view_intro_label.winfo_exists():
             self.photo_view_intro_label.configure(text="\n\n\n\n왼쪽 목록에서 편집할 새 종류를 선택하세요.")
 
+    def update_species_entries(self, species_names: List[str]):
+        """이름 변경/병합 후 영향받은 종의 제안만 다시 계산하고 목록 갱신 (보이는 버튼만 다시 그림)"""
+        for species_name in species_names:
+            self._group_suggestion_cache.pop(species_name, None)
+        self.refresh_species_list()
+
+    def schedule_species_filter(self):
+        if self._species_filter_after_id is not None:
+            self.after_cancel(self._species_filter_after_id)
+        self._species_filter_after_id = self.after(PREVIEW_DEBOUNCE_MS, self._run_species_filter)
+
+    def _run_species_filter(self):
+        self._species_filter_after_id = None
+        self.refresh_species_list(keep_position=False)
+
+    def refresh_species_list(self, keep_position: bool = True):
+        """필터와 정렬을 적용해 목록 줄(종 + 제안)을 다시 구성"""
+        names = list(self.species_photo_map.keys())
+        query = self.species_filter_entry.get().strip()
+        if query:
+            names = self.filter_species_names(names, query)
+        counts = {name: len(self.species_photo_map[name]) for name in names}
+        rows = []
+        for species_name in sort_species_names(names, self.species_sort_button.get(), counts, self.get_species_taxonomy):
+            rows.append(SpeciesRow(species_name, counts[species_name]))
+            # 체크리스트에 없는 그룹이면 가까운 종 제안을 줄로 표시 (클릭 한 번으로 적용)
+            for suggested_name, count in self.get_group_suggestions(species_name):
+                rows.append(SpeciesRow(species_name, count, suggested_name))
+        self.species_list.set_rows(rows, keep_position=keep_position)
+
+    def filter_species_names(self, names: List[str], query: str) -> List[str]:
+        """그룹 이름을 국명(자모/초성 포함) 또는 영명/학명으로 걸러냄"""
+        name_set = frozenset(names)
+        if self._species_searcher is None or self._species_searcher_names != name_set:
+            self._species_searcher = KoreanNameSearcher(sorted(name_set))
+            self._species_searcher_names = name_set
+        matched = set(self._species_searcher.search(query, limit=len(names)))
+        folded = query.casefold()
+        for name in names:
+            if name in matched: continue
+            info = self.bird_info_map.get(name, {})
+            if folded in info.get("common_name", "").casefold() or folded in info.get("scientific_name", "").casefold():
+                matched.add(name)
+        return [name for name in names if name in matched]
+
+    def get_species_taxonomy(self, species_name: str) -> tuple:
+        """(목, 과) - 모르면 빈 문자열"""
+        info = self.bird_info_map.get(species_name, {})
+        order = info.get("order", "")
+        family = info.get("family", "")
+        return (order if order != "N/A" else "", family if family != "N/A" else "")
+
+    def get_group_suggestions(self, species_name: str, limit: int = 3) -> List:
+        """그룹 안 사진들의 종 제안을 많이 나온 순으로 [(국명, 사진 수)] 반환 (그룹이 바뀔 때까지 캐시)"""
+        if species_name not in self._group_suggestion_cache:
+            self._group_suggestion_cache[species_name] = self._compute_group_suggestions(species_name, limit)
+        return self._group_suggestion_cache[species_name]
+
+    def _compute_group_suggestions(self, species_name: str, limit: int) -> List:
+        if self.species_index is not None and species_name in self.species_index:
+            return []
+        counts: Dict[str, int] = {}
+        for photo_info in self.species_photo_map.get(species_name, []):
+            suggestion = self.species_suggestions.get(photo_info["original_filename"])
+            if suggestion and suggestion.korean_name != species_name:
+                counts[suggestion.korean_name] = counts.get(suggestion.korean_name, 0) + 1
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def accept_species_suggestion(self, group_name: str, suggested_name: str):
+        """제안된 종으로 해당 사진들을 옮김 (체크리스트 종이므로 CSV 정보로 바로 등록, 부족한 정보는 백그라운드 보완)"""
+        photo_list = [
+            p for p in self.species_photo_map.get(group_name, [])
+            if getattr(self.species_suggestions.get(p["original_filename"]), "korean_name", None) == suggested_name
+        ]
+        if not photo_list: return
+        if suggested_name not in self.bird_info_map:
+            self.bird_info_map[suggested_name], needs_wiki = name_check.resolve_bird_info_csv(suggested_name, self.species_index)
+            if needs_wiki: self.enricher.submit([suggested_name], tag=self.load_generation)
+
+        self.move_photos(group_name, suggested_name, photo_list)
+        self.update_species_entries([group_name, suggested_name])
+        self.display_photos_for_species(suggested_name)
+        self.update_status(f"{len(photo_list)}장을 '{group_name}'에서 '{suggested_name}'(으)로 옮겼습니다.")
+
+    def move_photos(self, old_species_name: str, new_species_name: str, photo_list: List[Dict]):
+        """사진들을 다른 종 그룹으로 이동 (빈 그룹은 삭제)"""
+        moving = {id(p) for p in photo_list}
+        for photo_info in photo_list:
+            self.bird_name_map[photo_info['original_filename']] = new_species_name
+        self.species_photo_map.setdefault(new_species_name, []).extend(photo_list)
+        remaining = [p for p in self.species_photo_map.get(old_species_name, []) if id(p) not in moving]
+        if remaining:
+            self.species_photo_map[old_species_name] = remaining
+        else:
+            self.species_photo_map.pop(old_species_name, None)
+
     def display_photos_for_species(self, species_name: str):
-        for widget in self.photo_view_frame.winfo_children(): widget.destroy()
+        # 사진 패널은 한 번만 만들고, 종을 바꾸거나 이름을 바꿀 때는 글자와 격자 내용만 교체
+        if self.photo_panel is None or not self.photo_panel["grid"].winfo_exists():
+            self._build_photo_panel()
+        panel = self.photo_panel
         photo_list = self.species_photo_map[species_name]
-        
+        self.current_species = species_name
+        self.species_list.set_selected(species_name)
+
+        panel["name_label"].configure(text=f"'{species_name}' 그룹 이름 변경:")
+        entry = panel["entry"]
+        entry.delete(0, tk.END)
+        entry.insert(0, species_name if species_name != "미분류" else "")
+        self.hide_autocomplete()
+
+        self._preview_names = self.get_preview_names(entry.get())
+        self.photo_grid.set_photos(photo_list)
+        self.update_filename_previews(species_name, entry.get())
+        self.prefetch_neighbor_species(species_name)
+
+    def _build_photo_panel(self):
+        """이름 입력줄, 종 정보, 썸네일 격자로 된 사진 패널 생성 (현재 종은 self.current_species로 참조)"""
+        for widget in self.photo_view_frame.winfo_children(): widget.destroy()
+
         control_frame = customtkinter.CTkFrame(self.photo_view_frame)
         control_frame.pack(fill="x", padx=10, pady=10)
         control_frame.grid_columnconfigure(1, weight=1)
 
-        name_label = customtkinter.CTkLabel(control_frame, text=f"'{species_name}' 그룹 이름 변경:", font=customtkinter.CTkFont(size=14, weight="bold"))
+        name_label = customtkinter.CTkLabel(control_frame, text="", font=customtkinter.CTkFont(size=14, weight="bold"))
         name_label.grid(row=0, column=0, padx=10, pady=10)
 
         entry = customtkinter.CTkEntry(control_frame, font=customtkinter.CTkFont(size=14))
         entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        entry.insert(0, species_name if species_name != "미분류" else "")
+        self.current_entry = entry
         
         entry.bind("<KeyRelease>", self.on_key_release)
         entry.bind("<FocusIn>", lambda e, en=entry: self.on_entry_focus(en))
         entry.bind("<FocusOut>", self.on_entry_focus_out)
-        entry.bind("<KeyRelease>", lambda e, s=species_name, en=entry: self.update_filename_previews(s, en.get()), add="+")
+        entry.bind("<KeyRelease>", lambda e, en=entry: self.schedule_filename_previews(self.current_species, en), add="+")
 
-        rename_btn = customtkinter.CTkButton(control_frame, text="이름 확정 및 정보 업데이트", command=lambda: self.update_group_name(species_name, entry.get()))
+        rename_btn = customtkinter.CTkButton(control_frame, text="이름 확정 및 정보 업데이트", command=lambda: self.update_group_name(self.current_species, entry.get()))
         rename_btn.grid(row=0, column=2, padx=10, pady=10)
         
         # 종 정보 표시 영역 추가
@@ -371,65 +704,85 @@ class BirdNameEditor(customtkinter.CTk):
         info_label = customtkinter.CTkLabel(info_frame, text="종 정보", font=customtkinter.CTkFont(size=14, weight="bold"))
         info_label.pack(pady=(10, 5))
         
-        bird_info = self.bird_info_map.get(species_name, {})
-        info_text = f"국명: {bird_info.get('korean_name', species_name)}\n"
-        info_text += f"영명: {bird_info.get('common_name', 'N/A')}\n"
-        info_text += f"학명: {bird_info.get('scientific_name', 'N/A')}\n"
-        info_text += f"분류: 목 {bird_info.get('order', 'N/A')}, 과 {bird_info.get('family', 'N/A')}"
-        
-        info_display = customtkinter.CTkLabel(info_frame, text=info_text, justify="left", 
+        info_display = customtkinter.CTkLabel(info_frame, text="", justify="left", 
                                             font=customtkinter.CTkFont(size=12))
         info_display.pack(pady=(0, 10), padx=10)
         
         # 미리보기와 정보를 업데이트하는 함수 저장
         self.current_info_display = info_display
         
-        thumb_grid_frame = customtkinter.CTkFrame(self.photo_view_frame, fg_color="transparent")
-        thumb_grid_frame.pack(fill="both", expand=True)
-        
-        cols = 5
-        for i, photo_info in enumerate(photo_list):
-            row, col = divmod(i, cols)
-            thumb_frame = customtkinter.CTkFrame(thumb_grid_frame)
-            thumb_frame.grid(row=row, column=col, padx=5, pady=5)
-            
-            try:
-                # 썸네일을 정사각형으로 크롭하여 표시
-                img = Image.open(photo_info["thumbnail_path"])
-                
-                # 정사각형으로 크롭
-                width, height = img.size
-                size = min(width, height)
-                left = (width - size) // 2
-                top = (height - size) // 2
-                right = left + size
-                bottom = top + size
-                img_cropped = img.crop((left, top, right, bottom))
-                img_cropped = img_cropped.resize((200, 200), Image.Resampling.LANCZOS)
-                
-                ctk_img = customtkinter.CTkImage(light_image=img_cropped, dark_image=img_cropped, size=(200, 200))
-                
-                # 클릭 가능한 이미지 라벨 (원본 보기용)
-                img_label = customtkinter.CTkLabel(thumb_frame, image=ctk_img, text="", cursor="hand2")
-                img_label.pack(pady=(5,0))
-                img_label.bind("<Button-1>", lambda e, path=photo_info["path"], name=photo_info["original_filename"]: self.show_original_image(path, name))
-                
-                original_name_label = customtkinter.CTkLabel(thumb_frame, text=photo_info["original_filename"], wraplength=190, font=customtkinter.CTkFont(size=12))
-                original_name_label.pack(padx=5)
+        # 보이는 줄만 위젯을 만들고 썸네일은 백그라운드에서 디코딩하는 격자 (사진 수와 관계없이 바로 열림)
+        self.photo_grid = VirtualPhotoGrid(
+            self.photo_view_frame, self.thumb_loader, self.ui_queue.call, self.load_grid_image,
+            preview_text=self.get_preview_text,
+            on_open=lambda p: self.show_original_image(p["path"], p["original_filename"]),
+            image_cache=self.image_cache,
+        )
+        self.photo_grid.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.photo_panel = {"name_label": name_label, "entry": entry, "info_display": info_display, "grid": self.photo_grid}
+
+    def prefetch_neighbor_species(self, species_name: str):
+        """종 목록에 지금 보이는 순서(필터/정렬 반영)에서 바로 위/아래 종의 첫 화면 썸네일을 미리 디코딩"""
+        neighbors = self.species_list.neighbors(species_name)
+        self.prefetcher.prefetch(
+            photo_info for name in neighbors
+            for photo_info in self.species_photo_map.get(name, [])[:PREFETCH_PHOTOS_PER_SPECIES]
+        )
 
-                preview_label = customtkinter.CTkLabel(thumb_frame, text="", wraplength=190, font=customtkinter.CTkFont(size=12, weight="bold"), text_color="#3498db")
-                preview_label.pack(padx=5, pady=(0,5))
-                photo_info['preview_label'] = preview_label
-            except Exception as e:
-                error_label = customtkinter.CTkLabel(thumb_frame, text=f"썸네일 로드 실패\n{e}")
-                error_label.pack(padx=5, pady=5)
-        
-        self.update_filename_previews(species_name, entry.get())
+    def load_grid_image(self, photo_info: Dict) -> Image.Image:
+        """작업자 스레드에서 실행: 썸네일을 정사각형으로 크롭 (GUI용 빠른 미리보기 품질)
+
+        썸네일이 없거나(로딩 때 생성 실패) 그사이 캐시 용량 정리로 지워졌으면 원본에서 다시 만들어 캐시에 등록
+        """
+        thumbnail_path = photo_info["thumbnail_path"]
+        if not thumbnail_path or not os.path.exists(thumbnail_path):
+            thumbnail_path = thumbnailing.get_or_create_thumbnail(self.thumb_cache, photo_info["path"])
+        if thumbnail_path is None:
+            # 격자는 이 칸에 회색 자리 표시 이미지와 실패 이유를 표시
+            raise FileNotFoundError("썸네일을 만들 수 없습니다.")
+        with Image.open(thumbnail_path) as img:
+            return thumbnailing.render_square_image(img, 1, (200, 200), thumbnailing.TIER_FAST_PREVIEW)
 
     def show_original_image(self, image_path: str, filename: str):
         """원본 이미지를 팝업으로 표시"""
         ImagePopup(self, image_path, filename)
 
+    def schedule_filename_previews(self, species_name: str, entry):
+        """키 입력마다 바로 갱신하지 않고 PREVIEW_DEBOUNCE_MS 동안 입력이 멈추면 한 번만 갱신"""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(PREVIEW_DEBOUNCE_MS, self._run_scheduled_previews, species_name, entry)
+
+    def _run_scheduled_previews(self, species_name: str, entry):
+        self._preview_after_id = None
+        if entry.winfo_exists():
+            self.update_filename_previews(species_name, entry.get())
+
+    def get_preview_names(self, bird_name: str):
+        """국명 → (파일명용 국명, 파일명용 영명), 같은 이름은 다시 계산하지 않음"""
+        cached = self._preview_name_cache.get(bird_name)
+        if cached is None:
+            eng_name = self.species_index.english_name_for(bird_name) if self.species_index is not None and bird_name else ""
+            cached = (name_check.sanitize_filename(bird_name), name_check.sanitize_filename(eng_name))
+            self._preview_name_cache[bird_name] = cached
+        return cached
+
+    @staticmethod
+    def build_preview_filename(photo_info: Dict, kor_name_clean: str, eng_name_clean: str) -> str:
+        if not kor_name_clean:
+            return "이름을 입력하세요"
+        # 촬영 시각 문자열과 확장자는 사진마다 한 번만 계산
+        if "preview_stamp" not in photo_info:
+            dt = photo_info["datetime"]
+            photo_info["preview_stamp"] = (dt.strftime("%Y%m%d_%H%M%S") if dt else "",
+                                           os.path.splitext(photo_info["original_filename"])[1])
+        timestamp, ext = photo_info["preview_stamp"]
+        parts = [timestamp] if timestamp else []
+        parts.append(kor_name_clean)
+        if eng_name_clean and eng_name_clean != "N_A":
+            parts.append(eng_name_clean)
+        return f"{'_'.join(parts)}{ext}"
+
     def update_filename_previews(self, species_name: str, new_bird_name: str):
         photo_list = self.species_photo_map.get(species_name, [])
         
@@ -437,16 +790,14 @@ class BirdNameEditor(customtkinter.CTk):
         if hasattr(self, 'current_info_display') and self.current_info_display.winfo_exists():
             if new_bird_name and new_bird_name != species_name:
                 # 임시로 CSV에서 정보 검색해서 미리보기
-                temp_info = name_check.search_csv_by_korean_name(self.csv_db, new_bird_name)
+                temp_info = name_check.search_csv_by_korean_name(self.species_index, new_bird_name)
                 if temp_info:
                     info_text = f"국명: {temp_info['korean_name']}\n"
                     info_text += f"영명: {temp_info['common_name']}\n"
                     info_text += f"학명: {temp_info['scientific_name']}\n"
                     info_text += f"분류: 목 {temp_info['order']}, 과 {temp_info['family']}"
-                    self.current_info_display.configure(text=info_text)
                 else:
                     info_text = f"국명: {new_bird_name}\n영명: 검색 중...\n학명: 검색 중...\n분류: 검색 중..."
-                    self.current_info_display.configure(text=info_text)
             else:
                 # 기존 정보 표시
                 bird_info = self.bird_info_map.get(species_name, {})
@@ -454,61 +805,58 @@ class BirdNameEditor(customtkinter.CTk):
                 info_text += f"영명: {bird_info.get('common_name', 'N/A')}\n"
                 info_text += f"학명: {bird_info.get('scientific_name', 'N/A')}\n"
                 info_text += f"분류: 목 {bird_info.get('order', 'N/A')}, 과 {bird_info.get('family', 'N/A')}"
+            if self.current_info_display.cget("text") != info_text:
                 self.current_info_display.configure(text=info_text)
         
-        # 파일명 미리보기 업데이트
-        eng_name = ""
-        if self.csv_db is not None and new_bird_name:
-            result = self.csv_db[self.csv_db['국명'] == new_bird_name]
-            if not result.empty:
-                eng_name = result.iloc[0].get('영명', '')
-
-        for photo_info in photo_list:
-            if 'preview_label' in photo_info and photo_info['preview_label'].winfo_exists():
-                kor_name_clean = name_check.sanitize_filename(new_bird_name)
-                eng_name_clean = name_check.sanitize_filename(eng_name)
-                
-                new_base = ""
-                if photo_info["datetime"]:
-                    timestamp = photo_info["datetime"].strftime("%Y%m%d_%H%M%S")
-                    if eng_name_clean and eng_name_clean != "N_A": 
-                        new_base = f"{timestamp}_{kor_name_clean}_{eng_name_clean}"
-                    else: 
-                        new_base = f"{timestamp}_{kor_name_clean}"
-                else:
-                    if eng_name_clean and eng_name_clean != "N_A": 
-                        new_base = f"{kor_name_clean}_{eng_name_clean}"
-                    else: 
-                        new_base = kor_name_clean
+        # 파일명 미리보기는 격자에서 보이는 칸만 다시 그림 (그룹 크기와 관계없이 일정한 비용)
+        self._preview_names = self.get_preview_names(new_bird_name)
+        if self.photo_grid is not None and self.photo_grid.winfo_exists():
+            self.photo_grid.refresh_previews()
 
-                ext = os.path.splitext(photo_info["original_filename"])[1]
-                new_filename = f"{new_base}{ext}" if kor_name_clean else "이름을 입력하세요"
-                photo_info['preview_label'].configure(text=f"-> {new_filename}")
+    def get_preview_text(self, photo_info: Dict) -> str:
+        kor_name_clean, eng_name_clean = self._preview_names
+        return f"-> {self.build_preview_filename(photo_info, kor_name_clean, eng_name_clean)}"
 
     def update_group_name(self, old_species_name: str, new_species_name: str):
         if not new_species_name or new_species_name == old_species_name:
             tkinter.messagebox.showwarning("이름 오류", "변경할 새 이름이 비어있거나 기존 이름과 동일합니다.")
             return
 
-        self.update_status(f"'{new_species_name}' 정보 조회 중 (CSV, Wiki)...")
-        self.bird_info_map[new_species_name] = name_check.resolve_bird_info(
-            new_species_name, self.csv_db, self.wiki, log_callback=self.update_status
-        )
-        self.update_status("정보 조회 완료.")
-
-        photo_list = self.species_photo_map.get(old_species_name, [])
-        for photo_info in photo_list:
-            self.bird_name_map[photo_info['original_filename']] = new_species_name
+        # CSV 정보로 바로 반영하고, 부족한 정보의 Wiki 조회는 보완 작업자에게 넘김 (UI 스레드는 네트워크를 기다리지 않음)
+        needs_wiki = False
+        if new_species_name not in self.bird_info_map:
+            self.bird_info_map[new_species_name], needs_wiki = name_check.resolve_bird_info_csv(new_species_name, self.species_index)
+            if needs_wiki: self.enricher.submit([new_species_name], tag=self.load_generation)
 
-        if new_species_name in self.species_photo_map:
-            self.species_photo_map[new_species_name].extend(photo_list)
-        else:
-            self.species_photo_map[new_species_name] = photo_list
-        del self.species_photo_map[old_species_name]
+        self.move_photos(old_species_name, new_species_name, list(self.species_photo_map.get(old_species_name, [])))
 
-        self.display_species_list()
+        self.update_species_entries([old_species_name, new_species_name])
         self.display_photos_for_species(new_species_name)
-        tkinter.messagebox.showinfo("정보 업데이트 완료", f"'{new_species_name}'의 상세 정보가 업데이트되었습니다.\n이제 파일명을 저장할 수 있습니다.")
+        if needs_wiki:
+            self.update_status(f"'{new_species_name}'(으)로 변경했습니다. 부족한 종 정보는 Wiki에서 백그라운드로 보완합니다.")
+        tkinter.messagebox.showinfo("정보 업데이트 완료", f"'{new_species_name}'(으)로 이름을 변경했습니다.\n이제 파일명을 저장할 수 있습니다.")
+
+    def export_rename_plan(self):
+        """파일을 복사하지 않고 새 이름 계획만 JSON으로 저장 (dry-run)"""
+        output_folder = filedialog.askdirectory(title="저장할 폴더를 선택하세요 (계획만 만들고 복사하지 않습니다)")
+        if not output_folder: return
+        json_path = filedialog.asksaveasfilename(
+            title="이름 변경 계획 저장", defaultextension=".json", initialfile="rename_plan.json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not json_path: return
+        try:
+            # 실제 저장과 같은 이름이 나오도록 중단된 저장의 기록을 읽기 전용으로 반영
+            journal = SaveJournal.open(output_folder, self.source_folder, read_only=True)
+            plan = rename_plan.build_rename_plan(
+                self.source_folder, self.bird_name_map, self.species_photo_map, self.bird_info_map, output_folder,
+                previous_names=journal.previous_names(), reserved_names=journal.reserved_names()
+            )
+            plan.export_json(json_path)
+        except Exception as e:
+            tkinter.messagebox.showerror("오류", f"이름 변경 계획 저장 실패: {e}")
+            return
+        self.update_status(f"이름 변경 계획 저장: 복사 예정 {len(plan.entries)}개, 제외 {len(plan.skipped)}개 ({json_path})")
 
     def save_changes(self):
         output_folder = filedialog.askdirectory(title="어디에 저장할까요?")
@@ -527,30 +875,53 @@ class BirdNameEditor(customtkinter.CTk):
             return
         # --------------------------------
 
-        def save_in_background(chosen_report_format):
+        transfer_mode = dialog.transfer_mode
+        verify = dialog.verify
+
+        def save_in_background(ctx: JobContext, chosen_report_format):
             try:
-                self.update_status("파일 복사 및 이름 변경 시작...")
+                if not self.enricher.wait_idle(0):
+                    ctx.report(f"종 정보 보완 마무리 대기 중 ({self.enricher.pending_count}종)...")
+                    # 기다리는 동안에도 취소 요청에 응답
+                    for _ in range(60):
+                        if self.enricher.wait_idle(1): break
+                        ctx.check()
+
+                # 보완 결과는 UI 스레드 큐를 거쳐 반영되므로, 그 뒤에 찍은 사본으로 저장
+                bird_name_map, species_photo_map, bird_info_map = self._wait_for_snapshot(ctx)
+
+                ctx.report("파일 복사 및 이름 변경 시작...")
                 copied_files = thumbnailing.copy_and_rename_files(
-                    self.source_folder, self.bird_name_map, self.species_photo_map,
-                    self.bird_info_map,
-                    output_folder, self.update_status
+                    self.source_folder, bird_name_map, species_photo_map,
+                    bird_info_map,
+                    output_folder, ctx.log, progress_callback=ctx.reporter("파일 복사"),
+                    engine=copy_engine.CopyEngine.for_paths(self.source_folder, output_folder, transfer_mode, verify=verify)
                 )
+                if verify:
+                    manifest_path = os.path.join(output_folder, main_visualizer.REPORT_DIR_NAME, CHECKSUM_MANIFEST_NAME)
+                    copy_engine.write_checksum_manifest(
+                        manifest_path, [(f["new_path"], f["blake2b"]) for f in copied_files if f.get("blake2b")]
+                    )
+                    ctx.log(f"체크섬 목록 저장: {manifest_path}")
                 
-                self.update_status("새로운 썸네일 생성 중...")
+                ctx.report("새로운 썸네일 생성 중...")
                 thumbnailing.update_thumbnails_for_copied_files(
-                    copied_files, os.path.join(output_folder, "renamer_thumbnails"), log_callback=self.update_status
+                    copied_files, os.path.join(output_folder, "renamer_thumbnails"), log_callback=ctx.log,
+                    cache=self.thumb_cache, progress_callback=ctx.reporter("썸네일")
                 )
                 
                 if chosen_report_format != "none":
-                    self.update_status("시각적 리포트 생성 중...")
+                    ctx.check()
+                    # 마지막 단계도 진행 중으로 표시 (finish는 저장이 모두 끝났을 때만)
+                    ctx.report("시각적 리포트 생성 중...", current=0, total=1, stage="리포트")
                     report_options = {'format': chosen_report_format, 'thumbnail_size': 'medium'}
                     main_visualizer.create_visual_reports(
-                        copied_files, self.bird_info_map, output_folder, 
-                        report_options, location, self.update_status
+                        copied_files, bird_info_map, output_folder, 
+                        report_options, location, ctx.log, cache=self.thumb_cache
                     )
                 
-                unique_bird_names = {name for name in self.bird_name_map.values() if name != "미분류"}
-                self.update_status(f"저장 완료! {len(copied_files)}개 파일 저장됨")
+                unique_bird_names = {name for name in bird_name_map.values() if name != "미분류"}
+                self.progress.finish(f"저장 완료! {len(copied_files)}개 파일 저장됨")
                 
                 msg = (f"편집이 완료되었습니다!\n\n"
                        f"저장 위치: {output_folder}\n"
@@ -560,15 +931,17 @@ class BirdNameEditor(customtkinter.CTk):
                 if chosen_report_format != "none":
                     msg += f"'편집완료_탐조기록' 폴더에서 생성된 리포트를 확인하세요."
 
-                tkinter.messagebox.showinfo("저장 완료", msg)
+                self.ui_queue.call(tkinter.messagebox.showinfo, "저장 완료", msg)
                 
+            except JobCancelled:
+                raise
             except Exception as e:
-                self.update_status(f"저장 오류: {e}")
+                self.progress.finish(f"저장 오류: {e}")
                 import traceback
                 traceback.print_exc()
-                tkinter.messagebox.showerror("오류", f"저장 중 오류가 발생했습니다: {e}")
+                self.ui_queue.call(tkinter.messagebox.showerror, "오류", f"저장 중 오류가 발생했습니다: {e}")
 
-        threading.Thread(target=save_in_background, args=(report_format,), daemon=True).start()
+        self.jobs.start(save_in_background, "저장", key="save", args=(report_format,))
 
     def on_entry_focus(self, entry_widget):
         self.active_entry = entry_widget
@@ -593,7 +966,7 @@ class BirdNameEditor(customtkinter.CTk):
         if self.autocomplete_listbox: self.autocomplete_listbox.destroy()
         if not current_text: return
 
-        suggestions = name_check.fuzzy_search_kor_name(current_text, self.korean_names_list)
+        suggestions = name_check.fuzzy_search_kor_name(current_text, self.name_searcher)
         
         if suggestions:
             self.autocomplete_listbox = tk.Listbox(self, height=min(len(suggestions), 5), font=("Malgun Gothic", 12))
@@ -618,6 +991,8 @@ class BirdNameEditor(customtkinter.CTk):
 
 
 def main():
+    # PyInstaller 빌드에서 병렬 분석용 작업자 프로세스가 정상 동작하도록 필요
+    multiprocessing.freeze_support()
     app = BirdNameEditor()
     app.mainloop()
 
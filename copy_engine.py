@@ -0,0 +1,351 @@
+# 파일 이름: copy_engine.py - 병렬 파일 전송 (커널 복사 경로, 하드링크/reflink/이동 모드)
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AbstractSet, Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+MODE_COPY = "copy"          # 일반 복사 (원본 유지)
+MODE_HARDLINK = "hardlink"  # 같은 파일 시스템에서 하드링크 (데이터 공유, 용량 추가 없음)
+MODE_REFLINK = "reflink"    # Btrfs/XFS 등에서 블록 공유 복제 (수정 시에만 복사)
+MODE_MOVE = "move"          # 같은 파일 시스템에서 이름만 변경 (원본 폴더에서 사라짐)
+TRANSFER_MODES = [MODE_COPY, MODE_HARDLINK, MODE_REFLINK, MODE_MOVE]
+
+FICLONE = 0x40049409  # Linux ioctl: 파일 전체 reflink
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "sshfs", "fuse.sshfs", "9p", "afpfs", "davfs", "fuse.rclone"}
+VERIFY_RETRIES = 1  # 검증 불일치 시 다시 복사하는 횟수
+HASH_BUFFER_SIZE = 1024 * 1024
+_LINK_METHODS = {"hardlink", "move"}  # 원본과 같은 파일(inode)이 되는 방식
+_FAST_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP}
+
+
+class CopyProfile(NamedTuple):
+    """저장 위치 종류별 튜닝값"""
+    name: str
+    workers: int
+    buffer_size: int
+
+
+# 로컬 디스크는 동시 작업을 적게 하고 큰 버퍼로 순차 읽기/쓰기,
+# 네트워크 드라이브는 파일당 왕복 지연을 숨기도록 동시 작업을 늘림
+LOCAL_PROFILE = CopyProfile("local", workers=4, buffer_size=8 * 1024 * 1024)
+NETWORK_PROFILE = CopyProfile("network", workers=8, buffer_size=1024 * 1024)
+
+
+class CopyResult(NamedTuple):
+    """파일 하나의 전송 결과 (method: 실제로 쓰인 방식, error가 있으면 실패)
+
+    검증 모드에서는 source_hash/dest_hash(BLAKE2b 16진수)가 채워지고, retries는 불일치로 다시 복사한 횟수.
+    """
+    index: int
+    source: str
+    dest: str
+    size: int
+    seconds: float
+    method: str
+    error: Optional[str] = None
+    source_hash: Optional[str] = None
+    dest_hash: Optional[str] = None
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+
+def format_rate(bytes_per_second: float) -> str:
+    return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+
+
+def is_network_path(path: str) -> bool:
+    """네트워크 드라이브(SMB/NFS 등)에 있는 경로인지 추정"""
+    path = os.path.abspath(path)
+    if sys.platform == "win32":
+        if path.startswith("\\\\"): return True  # UNC 경로
+        try:
+            import ctypes
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(os.path.splitdrive(path)[0] + "\\") == DRIVE_REMOTE
+        except Exception:
+            return False
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    real = os.path.realpath(path)
+    best, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (real == mount_point or real.startswith(prefix)) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+def profile_for(*paths: str) -> CopyProfile:
+    """원본/대상 중 하나라도 네트워크 경로면 네트워크 튜닝 사용"""
+    return NETWORK_PROFILE if any(is_network_path(p) for p in paths if p) else LOCAL_PROFILE
+
+
+def _copy_data(fsrc, fdst, size: int, buffer_size: int) -> str:
+    """커널 복사 경로(copy_file_range → sendfile)를 먼저 시도하고, 안 되면 큰 버퍼로 복사"""
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    offset = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < size:
+                sent = os.copy_file_range(src_fd, dst_fd, min(size - offset, 1 << 30))
+                if sent == 0: break
+                offset += sent
+            if offset >= size: return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS or offset: raise
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, 1 << 30))
+                if sent == 0: break
+                offset += sent
+            if offset >= size: return "sendfile"
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS or offset: raise
+    # 버퍼 하나를 재사용하며 readinto로 읽어 파일마다 메모리를 새로 만들지 않음
+    fsrc.seek(offset)
+    fdst.seek(offset)
+    view = memoryview(bytearray(buffer_size))
+    while True:
+        read = fsrc.readinto(view)
+        if not read: break
+        written = 0
+        while written < read:
+            written += fdst.write(view[written:read])
+    return "buffered"
+
+
+def _copy_and_hash(fsrc, fdst, buffer_size: int) -> str:
+    """읽은 블록을 해시하면서 그대로 기록 (원본은 한 번만 읽음), 원본의 BLAKE2b 반환"""
+    digest = hashlib.blake2b()
+    view = memoryview(bytearray(buffer_size))
+    while True:
+        read = fsrc.readinto(view)
+        if not read: break
+        chunk = view[:read]
+        digest.update(chunk)  # 큰 블록은 GIL을 놓고 해시하므로 여러 작업자가 동시에 진행
+        written = 0
+        while written < read:
+            written += fdst.write(chunk[written:])
+    return digest.hexdigest()
+
+
+def hash_file(path: str, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    """파일 전체의 BLAKE2b (b2sum과 같은 64바이트 다이제스트)"""
+    digest = hashlib.blake2b()
+    view = memoryview(bytearray(buffer_size))
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(view)
+            if not read: break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def _reflink(src: str, dst: str):
+    import fcntl  # Linux 전용
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)  # 만들다 만 빈 파일은 지우고 일반 복사로 넘어감
+            raise
+
+
+def _move_exclusive(src: str, dst: str):
+    """대상이 이미 있으면 FileExistsError (os.rename은 POSIX에서 기존 파일을 그대로 덮어씀)"""
+    try:
+        os.link(src, dst)  # 이미 있으면 실패하는 원자적 방법
+    except FileExistsError:
+        raise
+    except OSError:
+        # 하드링크를 지원하지 않는 파일 시스템(FAT/exFAT 등): 확인 후 이름 변경
+        if os.path.lexists(dst): raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+class CopyEngine:
+    """작업자 수가 제한된 스레드 풀로 여러 파일을 동시에 전송
+
+    - 복사는 copy_file_range/sendfile 같은 커널 경로를 우선 사용하고 메타데이터(수정 시각 등)는 copy2처럼 보존
+    - hardlink/reflink/move는 데이터를 다시 쓰지 않으며, 지원되지 않으면(다른 드라이브 등) 일반 복사로 대체
+    - 결과는 파일마다 on_result로 호출 스레드에서 전달되므로 진행 보고/취소 확인을 그 안에서 할 수 있음
+    - verify이면 복사하면서 원본을 해시하고(커널 복사 경로 대신), 대상은 별도 검증 풀에서 다시 읽어 비교.
+      불일치하면 VERIFY_RETRIES번까지 다시 복사
+    """
+
+    def __init__(self, mode: str = MODE_COPY, profile: Optional[CopyProfile] = None,
+                 workers: Optional[int] = None, buffer_size: Optional[int] = None, verify: bool = False):
+        if mode not in TRANSFER_MODES: raise ValueError(f"알 수 없는 전송 방식: {mode}")
+        self.mode = mode
+        self.profile = profile or LOCAL_PROFILE
+        self.workers = workers or self.profile.workers
+        self.buffer_size = buffer_size or self.profile.buffer_size
+        self.verify = verify
+
+    @classmethod
+    def for_paths(cls, source_folder: str, output_folder: str, mode: str = MODE_COPY,
+                  verify: bool = False) -> "CopyEngine":
+        return cls(mode, profile_for(source_folder, output_folder), verify=verify)
+
+    def transfer(self, src: str, dst: str) -> Tuple[str, Optional[str]]:
+        """파일 하나 전송, (실제로 쓰인 방식, 복사하면서 계산한 원본 해시 또는 None) 반환"""
+        if self.mode == MODE_HARDLINK:
+            try:
+                os.link(src, dst)
+                return "hardlink", None
+            except OSError:
+                pass
+        elif self.mode == MODE_REFLINK:
+            try:
+                _reflink(src, dst)
+                shutil.copystat(src, dst)
+                return "reflink", None
+            except FileExistsError:
+                raise
+            except (OSError, ImportError):
+                pass
+        elif self.mode == MODE_MOVE:
+            # 다른 파일 시스템으로는 이동하지 않고 복사 (원본은 그대로 둠)
+            if os.stat(src).st_dev == os.stat(os.path.dirname(dst) or ".").st_dev:
+                _move_exclusive(src, dst)
+                return "move", None
+        return self.copy_file(src, dst)
+
+    def copy_file(self, src: str, dst: str) -> Tuple[str, Optional[str]]:
+        source_hash = None
+        with open(src, "rb", buffering=0) as fsrc:
+            size = os.fstat(fsrc.fileno()).st_size
+            # 다른 파일과 이름이 겹치면 덮어쓰지 않음 (이름은 계획 단계에서 이미 확정됨)
+            with open(dst, "xb", buffering=0) as fdst:
+                try:
+                    if self.verify:
+                        # 해시할 블록이 CPU 캐시에 남도록 버퍼를 작게 유지
+                        source_hash = _copy_and_hash(fsrc, fdst, min(self.buffer_size, HASH_BUFFER_SIZE))
+                        method = "buffered"
+                    else:
+                        method = _copy_data(fsrc, fdst, size, self.buffer_size)
+                except BaseException:
+                    fdst.close()
+                    os.remove(dst)  # 반쯤 쓴 파일을 남기지 않음
+                    raise
+        shutil.copystat(src, dst)
+        return method, source_hash
+
+    def _run_one(self, index: int, src: str, dst: str, existing: bool = False) -> CopyResult:
+        start = time.perf_counter()
+        try:
+            if existing:
+                # 이전 저장에서 이미 복사된 파일: 검증만 수행
+                return CopyResult(index, src, dst, os.path.getsize(dst), 0.0, "existing")
+            size = os.path.getsize(src)
+            method, source_hash = self.transfer(src, dst)
+            return CopyResult(index, src, dst, size, time.perf_counter() - start, method, source_hash=source_hash)
+        except Exception as e:
+            return CopyResult(index, src, dst, 0, time.perf_counter() - start, self.mode, str(e))
+
+    def _verify_one(self, result: CopyResult) -> CopyResult:
+        """대상 파일을 다시 읽어 원본 해시와 비교, 다르면 지우고 다시 복사"""
+        retries = 0
+        while True:
+            try:
+                source_hash = result.source_hash
+                dest_hash = hash_file(result.dest)
+                if source_hash is None:
+                    if result.method in _LINK_METHODS or not os.path.exists(result.source):
+                        # 링크/이동은 원본과 같은 파일이라 비교 대상이 없음 (해시만 기록)
+                        return result._replace(source_hash=dest_hash, dest_hash=dest_hash, retries=retries)
+                    source_hash = hash_file(result.source)
+                if source_hash == dest_hash:
+                    return result._replace(source_hash=source_hash, dest_hash=dest_hash, retries=retries)
+                if retries >= VERIFY_RETRIES:
+                    # 크기/수정 시각은 원본과 같으므로 남겨 두면 다음 저장에서 완료된 파일로 보임
+                    os.remove(result.dest)
+                    return result._replace(source_hash=source_hash, dest_hash=dest_hash, retries=retries,
+                                           error="체크섬 불일치")
+                retries += 1
+                os.remove(result.dest)
+                result = self._run_one(result.index, result.source, result.dest)
+                if not result.ok: return result._replace(retries=retries)
+            except Exception as e:
+                return result._replace(error=f"검증 실패: {e}", retries=retries)
+
+    def run(self, pairs: Sequence[Tuple[str, str]],
+            on_result: Optional[Callable[[CopyResult], None]] = None,
+            existing: AbstractSet[int] = frozenset(),
+            on_copied: Optional[Callable[[CopyResult], None]] = None) -> List[CopyResult]:
+        """(원본, 대상) 목록을 전송하고 입력 순서대로 결과 반환
+
+        existing에 있는 번호는 이미 복사된 것으로 보고 전송하지 않음 (검증 모드에서는 검증만 수행).
+        on_result에서 예외가 나면(취소 등) 아직 시작하지 않은 전송은 버리고 예외를 그대로 전달.
+        on_copied는 전송이 끝난 즉시(검증 모드면 검증 전에 한 번, dest_hash가 채워진 검증 후에 한 번) 호출되어
+        저장 기록용으로 씀. 취소로 멈출 때도 이미 끝난 전송/검증 결과에 대해 호출되므로 예외를 내면 안 됨.
+        """
+        results: List[Optional[CopyResult]] = [None] * len(pairs)
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="copy")
+        # 검증은 별도 풀에서 하여 복사 작업자는 다음 파일 전송을 계속함
+        verifier = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify") if self.verify else None
+        pending = set()
+
+        def record(result: CopyResult):
+            # 이미 있던 파일은 검증이 끝났을 때만 새로 기록할 내용이 있음
+            if on_copied and result.ok and (result.method != "existing" or result.dest_hash):
+                on_copied(result)
+
+        try:
+            pending = {executor.submit(self._run_one, i, src, dst, i in existing) for i, (src, dst) in enumerate(pairs)}
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    result = future.result()
+                    if result.ok: record(result)
+                    if verifier is not None and result.ok and result.dest_hash is None:
+                        pending.add(verifier.submit(self._verify_one, result))
+                        continue
+                    results[result.index] = result
+                    if on_result: on_result(result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if verifier is not None: verifier.shutdown(wait=True, cancel_futures=True)
+            # 중단된 경우: 끝났지만 아직 넘기지 못한 전송/검증 결과도 기록해 두어 다시 복사하지 않게 함
+            for future in pending:
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    result = future.result()
+                    if result.ok: record(result)
+        return results
+
+
+def write_checksum_manifest(path: str, items: Iterable[Tuple[str, str]]):
+    """(파일 경로, BLAKE2b) 목록을 b2sum 형식으로 저장 (경로는 manifest 위치 기준 상대 경로)"""
+    base = os.path.dirname(os.path.abspath(path))
+    os.makedirs(base, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for file_path, digest in items:
+            relative = os.path.relpath(os.path.abspath(file_path), base).replace(os.sep, "/")
+            f.write(f"{digest}  {relative}\n")
+
+
+def summarize(results: Sequence[CopyResult], elapsed: float) -> str:
+    """'120개, 3.2 GB, 215.3 MB/s' 형식의 전체 전송 요약 (이미 있던 파일은 제외)"""
+    done = [r for r in results if r is not None and r.ok and r.method != "existing"]
+    total_bytes = sum(r.size for r in done)
+    rate = total_bytes / elapsed if elapsed > 0 else 0.0
+    return f"{len(done)}개, {total_bytes / (1024 ** 3):.2f} GB, {format_rate(rate)}"
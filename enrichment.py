@@ -0,0 +1,96 @@
+# 파일 이름: enrichment.py - 백그라운드 종 정보 보완(Wikipedia) 작업 큐
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_BATCH_SIZE = 50
+
+
+class SpeciesEnricher:
+    """폴더 로딩과 분리되어 부족한 종 정보(영명, 학명, 목, 과)를 채우는 작업자
+
+    resolve_batch(names) -> {국명: 정보}는 executor의 작업자 스레드에서 호출되고,
+    결과는 on_result(국명, 정보, tag)로 하나씩 전달됨. tag는 submit() 때 넘긴 값으로,
+    예전 폴더의 결과를 무시하는 데 쓸 수 있음.
+    한 번에 한 묶음만 executor에 올리므로 공용 작업자 풀을 오래 점유하지 않음.
+    """
+
+    def __init__(self, resolve_batch: Callable[[List[str]], Dict[str, Dict]],
+                 on_result: Callable[[str, Optional[Dict], object], None],
+                 batch_size: int = DEFAULT_BATCH_SIZE, executor: Optional[Executor] = None):
+        self._resolve_batch = resolve_batch
+        self._on_result = on_result
+        self._batch_size = batch_size
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="species-enricher")
+        self._queue: Deque[Tuple[str, object]] = deque()
+        self._pending = 0
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def submit(self, names: List[str], tag: object = None):
+        """보완할 국명들을 큐에 추가"""
+        names = list(dict.fromkeys(names))
+        if not names: return
+        with self._lock:
+            self._pending += len(names)
+            self._idle.clear()
+            self._queue.extend((name, tag) for name in names)
+            self._schedule_locked()
+
+    def clear(self) -> int:
+        """아직 시작하지 않은 항목을 모두 버림 (새 폴더를 열 때), 버린 개수 반환"""
+        with self._lock:
+            dropped = len(self._queue)
+            self._queue.clear()
+            self._finish_locked(dropped)
+        return dropped
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """큐가 빌 때까지 대기 (저장 전에 정보 보완이 끝나도록)"""
+        return self._idle.wait(timeout)
+
+    def _schedule_locked(self):
+        if self._scheduled or not self._queue: return
+        self._scheduled = True
+        self._executor.submit(self._run_batch)
+
+    def _finish_locked(self, count: int):
+        self._pending -= count
+        if self._pending <= 0:
+            self._pending = 0
+            self._idle.set()
+
+    def _run_batch(self):
+        # 쌓여 있는 이름을 한 번에 묶어서 일괄 조회
+        with self._lock:
+            batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+        try:
+            by_tag: Dict[object, List[str]] = {}
+            for name, tag in batch:
+                by_tag.setdefault(tag, []).append(name)
+
+            for tag, names in by_tag.items():
+                try:
+                    infos = self._resolve_batch(names)
+                except Exception as e:
+                    print(f"종 정보 보완 실패 ({len(names)}종): {e}")
+                    infos = {}
+                for name in names:
+                    try:
+                        self._on_result(name, infos.get(name), tag)
+                    except Exception as e:
+                        print(f"종 정보 보완 결과 처리 실패 ({name}): {e}")
+        finally:
+            with self._lock:
+                self._finish_locked(len(batch))
+                # 남은 항목은 다음 묶음으로 다시 올려 더 급한 작업이 사이에 끼어들 수 있게 함
+                self._scheduled = False
+                self._schedule_locked()
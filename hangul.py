@@ -0,0 +1,65 @@
+# 파일 이름: hangul.py - 한글 자모 분해 / 초성 추출 도구
+from typing import Iterable
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"  # 첫 칸은 받침 없음
+
+# 겹받침/이중모음은 입력 순서대로 풀어 두어야 입력 중인 글자("흘" 다음 "흙")도 앞부분으로 일치
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+CONSONANTS = frozenset(CHOSEONG) | frozenset(JONGSEONG.strip())
+
+
+def is_syllable(ch: str) -> bool:
+    return SYLLABLE_BASE <= ord(ch) <= SYLLABLE_LAST
+
+
+def _split_jamo(jamo: str) -> str:
+    return COMPOUND_JAMO.get(jamo, jamo)
+
+
+def decompose(text: str) -> str:
+    """완성형 한글을 호환 자모열로 분해 (예: '흑기' → 'ㅎㅡㄱㄱㅣ'), 한글 외 문자는 소문자로 유지"""
+    out = []
+    for ch in text:
+        if is_syllable(ch):
+            code = ord(ch) - SYLLABLE_BASE
+            cho, rest = divmod(code, JUNGSEONG_COUNT * JONGSEONG_COUNT)
+            jung, jong = divmod(rest, JONGSEONG_COUNT)
+            out.append(CHOSEONG[cho])
+            out.append(_split_jamo(JUNGSEONG[jung]))
+            if jong:
+                out.append(_split_jamo(JONGSEONG[jong]))
+        else:
+            out.append(_split_jamo(ch).lower())
+    return "".join(out)
+
+
+def choseong(text: str) -> str:
+    """초성만 추출 (예: '흑기러기' → 'ㅎㄱㄹㄱ'), 한글 외 문자는 소문자로 유지"""
+    out = []
+    for ch in text:
+        if is_syllable(ch):
+            out.append(CHOSEONG[(ord(ch) - SYLLABLE_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+        else:
+            out.append(ch.lower())
+    return "".join(out)
+
+
+def is_choseong_query(text: str) -> bool:
+    """공백을 뺀 모든 글자가 자음인지 (초성 검색 대상인지)"""
+    chars = [ch for ch in text if not ch.isspace()]
+    return bool(chars) and all(ch in CONSONANTS for ch in chars)
+
+
+def ngrams(text: str, n: int) -> Iterable[str]:
+    return (text[i:i + n] for i in range(len(text) - n + 1))
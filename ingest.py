@@ -0,0 +1,82 @@
+# 파일 이름: ingest.py - 사진 폴더 병렬 분석(썸네일 + EXIF) 모듈
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import thumbnailing
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"}
+
+
+def get_default_workers() -> int:
+    """CPU 코어 수 기반 기본 작업자 수 (UI 스레드 몫으로 1개 남김)"""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def list_image_files(folder: str) -> List[str]:
+    """폴더 안의 이미지 파일 이름 목록"""
+    return [f for f in os.listdir(folder) if os.path.splitext(f)[1].lower() in IMAGE_EXTENSIONS]
+
+
+def thumbnail_path_for(thumbnail_folder: str, filename: str) -> str:
+    """원본 파일명에 대응하는 썸네일 경로"""
+    return os.path.join(thumbnail_folder, f"{os.path.splitext(filename)[0]}_thumb.jpg")
+
+
+def process_single_photo(file_path: str, thumbnail_path: Optional[str], cache=None) -> Dict:
+    """사진 한 장의 썸네일 생성 및 EXIF 추출 (작업자에서 실행)"""
+    if cache is not None:
+        # 공용 캐시에 있으면 EXIF만 읽고, 없으면 만들어서 캐시에 등록
+        return thumbnailing.extract_photo_data_cached(cache, file_path)
+
+    # 썸네일이 이미 있으면 헤더/EXIF만 읽음
+    need_thumbnail = not os.path.exists(thumbnail_path)
+    data = thumbnailing.extract_photo_data(file_path, thumbnail_path if need_thumbnail else None)
+    data["thumbnail_path"] = thumbnail_path
+    return data
+
+
+def _process_job(job: Tuple) -> Dict:
+    # ProcessPoolExecutor.map에 넘기기 위한 최상위 함수 (pickle 가능해야 함)
+    return process_single_photo(*job)
+
+
+def _create_executor(workers: int, use_processes: bool) -> Tuple[Executor, bool]:
+    """프로세스 풀 생성, 실패 시 스레드 풀로 대체"""
+    if use_processes and workers > 1:
+        try:
+            return ProcessPoolExecutor(max_workers=workers), True
+        except (OSError, NotImplementedError, ValueError):
+            pass
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest"), False
+
+
+def ingest_photos(source_folder: str, filenames: List[str], thumbnail_folder: Optional[str] = None,
+                  workers: Optional[int] = None, use_processes: bool = True,
+                  cache=None) -> Iterator[Tuple[str, Dict]]:
+    """여러 사진을 병렬로 분석하고 (파일명, 결과)를 입력 순서대로 스트리밍
+
+    cache(thumb_cache.ThumbnailCache)가 주어지면 썸네일은 공용 캐시에 저장되고
+    thumbnail_folder는 사용하지 않음.
+    """
+    workers = workers or get_default_workers()
+    if cache is not None:
+        jobs = [(os.path.join(source_folder, f), None, cache) for f in filenames]
+    else:
+        os.makedirs(thumbnail_folder, exist_ok=True)
+        jobs = [(os.path.join(source_folder, f), thumbnail_path_for(thumbnail_folder, f)) for f in filenames]
+
+    if workers <= 1:
+        for filename, job in zip(filenames, jobs):
+            yield filename, _process_job(job)
+        return
+
+    executor, is_process_pool = _create_executor(workers, use_processes)
+    # 프로세스 풀은 IPC 비용을 줄이기 위해 여러 작업을 묶어서 전달
+    chunksize = max(1, min(16, len(jobs) // (workers * 4))) if is_process_pool else 1
+    try:
+        # map()은 완료 순서와 관계없이 입력 순서대로 결과를 돌려줌
+        for filename, result in zip(filenames, executor.map(_process_job, jobs, chunksize=chunksize)):
+            yield filename, result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,221 @@
+# 파일 이름: jobs.py - 우선순위/취소를 지원하는 백그라운드 작업 스케줄러
+import heapq
+import itertools
+import threading
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Optional
+
+from progress import ProgressBus
+
+# 숫자가 작을수록 먼저 실행
+PRIORITY_INTERACTIVE = 0   # 사용자가 기다리는 작업: 화면에 보이는 썸네일, 폴더 로딩, 저장
+PRIORITY_ENRICHMENT = 10   # 백그라운드 종 정보 보완
+PRIORITY_PREFETCH = 20     # 이웃 종 썸네일 미리 읽기
+
+
+class JobCancelled(Exception):
+    """취소된 작업이 진행 중에 스스로 멈출 때 사용"""
+
+
+class CancelToken:
+    """작업 스레드가 주기적으로 확인하는 취소 표시"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set(): raise JobCancelled()
+
+
+class JobContext:
+    """긴 작업에 넘겨지는 공통 인터페이스 (취소 확인 + 진행 상황 보고)"""
+
+    def __init__(self, name: str, token: CancelToken, progress: Optional[ProgressBus] = None):
+        self.name = name
+        self.token = token
+        self._progress = progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def check(self):
+        """취소되었으면 JobCancelled 발생"""
+        self.token.raise_if_cancelled()
+
+    def report(self, message: Optional[str] = None, current: Optional[int] = None,
+               total: Optional[int] = None, stage: Optional[str] = None):
+        if self._progress is None: return
+        if stage is None and (current is not None or total is not None):
+            stage = self.name  # 단계 이름을 따로 주지 않으면 작업 이름으로 진행 막대 표시
+        self._progress.post(message, stage=stage, current=current, total=total)
+
+    def log(self, message: str):
+        """log_callback 자리에 넘길 수 있는 메시지 보고"""
+        self.report(message)
+
+    def reporter(self, stage: str) -> Callable[[int, int], None]:
+        """progress_callback(current, total) 생성: 호출될 때마다 취소 여부도 확인"""
+        def report(current: int, total: int):
+            self.check()
+            self.report(current=current, total=total, stage=stage)
+        return report
+
+
+class Job:
+    """start()로 시작한 긴 작업 하나"""
+
+    def __init__(self, name: str, key: Optional[str], context: JobContext):
+        self.name = name
+        self.key = key
+        self.context = context
+        self.future: Optional[Future] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.context.cancelled
+
+    def cancel(self):
+        # 아직 시작하지 않았으면 큐에서 빠지고, 실행 중이면 다음 확인 지점에서 멈춤
+        self.context.token.cancel()
+        if self.future is not None: self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+
+class _PriorityExecutor(Executor):
+    """정해진 우선순위로 스케줄러에 제출하는 Executor (submit만 지원)"""
+
+    def __init__(self, scheduler: "JobScheduler", priority: int):
+        self._scheduler = scheduler
+        self._priority = priority
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self._scheduler.submit(fn, *args, priority=self._priority, **kwargs)
+
+
+class JobScheduler:
+    """작업자 수가 제한된 우선순위 스레드 풀
+
+    - submit()은 Future를 돌려주므로 concurrent.futures 방식 코드와 그대로 호환
+      (시작 전 Future.cancel()은 큐에서 작업을 빼는 것과 같음)
+    - executor(priority)로 우선순위가 고정된 Executor를 만들어 기존 컴포넌트에 넘길 수 있음
+    - start()는 취소 토큰과 진행 보고가 붙은 긴 작업을 실행. 같은 key의 이전 작업은 취소됨
+    - 작업자 스레드는 필요할 때만 max_workers개까지 생성
+    """
+
+    def __init__(self, max_workers: int, name: str = "jobs", progress: Optional[ProgressBus] = None):
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._progress = progress
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()  # 같은 우선순위는 들어온 순서대로
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._shutdown = False
+        self._jobs: Dict[Optional[str], Job] = {}
+        self._active: List[Job] = []
+
+    # --- Future 기반 제출 ---
+    def submit(self, fn, /, *args, priority: int = PRIORITY_INTERACTIVE, **kwargs) -> Future:
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown: raise RuntimeError("스케줄러가 이미 종료되었습니다.")
+            heapq.heappush(self._heap, (priority, next(self._counter), future, fn, args, kwargs))
+            # 쉬고 있는 작업자보다 밀린 작업이 많을 때만 새 스레드 생성
+            if len(self._heap) > self._idle_workers and len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._worker, daemon=True,
+                                          name=f"{self._name}-{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._condition.notify()
+        return future
+
+    def executor(self, priority: int) -> Executor:
+        return _PriorityExecutor(self, priority)
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def shutdown(self, cancel_pending: bool = True):
+        """새 작업을 받지 않고, 시작 전 작업은 취소 (실행 중인 작업은 기다리지 않음)"""
+        with self._condition:
+            self._shutdown = True
+            pending, self._heap = self._heap, []
+            self._condition.notify_all()
+            jobs = list(self._active)
+        if cancel_pending:
+            for _, _, future, _, _, _ in pending:
+                future.cancel()
+        for job in jobs:
+            job.cancel()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._heap and not self._shutdown:
+                    self._idle_workers += 1
+                    self._condition.wait()
+                    self._idle_workers -= 1
+                if not self._heap: return
+                _, _, future, fn, args, kwargs = heapq.heappop(self._heap)
+            # 큐에 있는 동안 취소된 작업은 건너뜀
+            if not future.set_running_or_notify_cancel(): continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    # --- 긴 작업 ---
+    def start(self, fn: Callable, name: str, key: Optional[str] = None,
+              priority: int = PRIORITY_INTERACTIVE, args: tuple = ()) -> Job:
+        """fn(context, *args)를 실행하는 작업 시작 (key가 같은 이전 작업은 취소)"""
+        job = Job(name, key, JobContext(name, CancelToken(), self._progress))
+        with self._condition:
+            previous = self._jobs.get(key) if key is not None else None
+            if key is not None: self._jobs[key] = job
+            self._active.append(job)
+        if previous is not None: previous.cancel()
+        job.future = self.submit(self._run_job, job, fn, args, priority=priority)
+        # 시작 전에 취소되어 실행되지 않은 경우도 포함하여 끝나면 목록에서 제거
+        job.future.add_done_callback(lambda f: self._forget(job))
+        return job
+
+    def active_jobs(self) -> List[Job]:
+        with self._condition:
+            return [job for job in self._active if not job.cancelled]
+
+    def cancel_all(self):
+        for job in self.active_jobs():
+            job.cancel()
+
+    def _run_job(self, job: Job, fn: Callable, args: tuple):
+        try:
+            return fn(job.context, *args)
+        except JobCancelled:
+            # 같은 key의 새 작업으로 교체된 경우에는 새 작업의 상태 표시를 덮어쓰지 않음
+            if self._progress is not None and (job.key is None or self._jobs.get(job.key) is job):
+                self._progress.finish(f"{job.name} 취소됨.")
+            return None
+        except Exception as e:
+            print(f"작업 실패 ({job.name}): {e}")
+            raise
+
+    def _forget(self, job: Job):
+        with self._condition:
+            if job in self._active: self._active.remove(job)
+            if job.key is not None and self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
@@ -11,6 +11,10 @@ from typing import Dict, List
 
 from PIL import Image
 
+import thumbnailing
+
+REPORT_DIR_NAME = '편집완료_탐조기록'  # 출력 폴더 안의 리포트 폴더
+
 
 def sanitize_filename(name: str) -> str:
     """파일명에 사용할 수 없는 문자 제거"""
@@ -21,38 +25,37 @@ def sanitize_filename(name: str) -> str:
     return re.sub(r"\s+", "_", name)
 
 
-def image_to_base64(image_path: str, max_size: tuple = (400, 768)) -> str:
+def file_to_base64(jpeg_path: str) -> str:
+    """이미 만들어진 JPEG 썸네일을 재인코딩 없이 data URI로 변환"""
+    try:
+        with open(jpeg_path, 'rb') as f:
+            return f"data:image/jpeg;base64,{base64.b64encode(f.read()).decode()}"
+    except OSError:
+        return ""
+
+
+def image_to_base64(image_path: str, max_size: tuple = (400, 768),
+                    tier: str = thumbnailing.TIER_BALANCED, cache=None) -> str:
     """이미지를 base64로 인코딩 (HTML 임베딩용) - 정사각형으로 크롭"""
+    if cache is not None:
+        # 캐시된 JPEG 썸네일을 다시 인코딩하지 않고 그대로 임베딩
+        side = min(max_size)
+        cached = thumbnailing.get_or_create_thumbnail(cache, image_path, (side, side), tier)
+        if cached:
+            img_data = file_to_base64(cached)
+            if img_data: return img_data
     try:
         with Image.open(image_path) as img:
-            # EXIF orientation 처리
-            if hasattr(img, '_getexif'):
-                exif = img._getexif()
-                if exif and 274 in exif:
-                    orientation = exif[274]
-                    if orientation == 3:
-                        img = img.rotate(180, expand=True)
-                    elif orientation == 6:
-                        img = img.rotate(270, expand=True)
-                    elif orientation == 8:
-                        img = img.rotate(90, expand=True)
-            
-            # 정사각형으로 크롭
-            width, height = img.size
-            size = min(width, height)
-            left = (width - size) // 2
-            top = (height - size) // 2
-            right = left + size
-            bottom = top + size
-            img_cropped = img.crop((left, top, right, bottom))
-            
-            # 리사이즈
-            img_cropped.thumbnail(max_size, Image.Resampling.LANCZOS)
+            # EXIF orientation 처리 + 정사각형 크롭 + 축소 디코딩 리사이즈
+            orientation = thumbnailing.read_exif_info(img)["orientation"]
+            side = min(max_size)
+            img_cropped = thumbnailing.render_square_image(img, orientation, (side, side), tier, upscale=False)
             
             # base64 인코딩
             buffer = io.BytesIO()
             img_format = 'JPEG' if img_cropped.mode == 'RGB' else 'PNG'
-            img_cropped.save(buffer, format=img_format, quality=85, optimize=True)
+            quality = thumbnailing.QUALITY_TIERS[tier]["jpeg_quality"]
+            img_cropped.save(buffer, format=img_format, quality=quality, optimize=True)
             img_data = buffer.getvalue()
             
             mime_type = f"image/{img_format.lower()}"
@@ -126,6 +129,7 @@ def prepare_observation_data(copied_files: List[Dict], bird_info_map: Dict[str,
             },
             'taxonomy_str': f"목: {bird_info.get('order', 'N/A')}, 과: {bird_info.get('family', 'N/A')}",
             'thumbnail_path': file_info.get('new_thumbnail_path'),
+            'pyramid': file_info.get('pyramid') or {},
             'source': bird_info.get('source', '사용자 편집')
         }
         
@@ -134,7 +138,8 @@ def prepare_observation_data(copied_files: List[Dict], bird_info_map: Dict[str,
     return observations
 
 
-def create_html_report(log_dir: str, observations: List[Dict], location: str, thumbnail_size: str, log):
+def create_html_report(log_dir: str, observations: List[Dict], location: str, thumbnail_size: str, log,
+                       cache=None):
     """HTML 형식의 시각적 리포트 생성"""
     if not observations:
         log("- HTML 리포트를 생성할 기록이 없습니다.")
@@ -365,12 +370,15 @@ def create_html_report(log_dir: str, observations: List[Dict], location: str, th
             else:
                 time_str = '시간 정보 없음'
             
-            # 이미지 처리 - 실제 파일에서 base64 생성
+            # 이미지 처리 - 로딩 때 만든 피라미드 단계 우선, 없으면 실제 파일에서 base64 생성
             img_data = ""
-            if obs_data.get('new_path') and os.path.exists(obs_data['new_path']):
-                img_data = image_to_base64(obs_data['new_path'], thumb_size_px)
-            elif obs_data.get('thumbnail_path') and os.path.exists(obs_data['thumbnail_path']):
-                img_data = image_to_base64(obs_data['thumbnail_path'], thumb_size_px)
+            level_path = thumbnailing.pick_pyramid_level(obs_data.get('pyramid'), thumb_size_px[0])
+            if level_path:
+                img_data = file_to_base64(level_path)
+            if not img_data and obs_data.get('new_path') and os.path.exists(obs_data['new_path']):
+                img_data = image_to_base64(obs_data['new_path'], thumb_size_px, thumbnailing.TIER_BALANCED, cache)
+            if not img_data and obs_data.get('thumbnail_path') and os.path.exists(obs_data['thumbnail_path']):
+                img_data = image_to_base64(obs_data['thumbnail_path'], thumb_size_px, thumbnailing.TIER_BALANCED, cache)
             
             html_content += f"""
                     <div class="observation-card">
@@ -415,7 +423,7 @@ def create_html_report(log_dir: str, observations: List[Dict], location: str, th
         log(f"  - HTML 리포트 생성 실패: {e}")
 
 
-def create_word_report(log_dir: str, observations: List[Dict], location: str, log):
+def create_word_report(log_dir: str, observations: List[Dict], location: str, log, cache=None):
     """Word 형식의 시각적 리포트 생성"""
     try:
         from docx import Document
@@ -534,34 +542,35 @@ def create_word_report(log_dir: str, observations: List[Dict], location: str, lo
             # 이미지 삽입 - 실제 파일 사용
             image_inserted = False
             
-            # 첫 번째 시도: 실제 파일 경로
-            if obs_data.get('new_path') and os.path.exists(obs_data['new_path']):
+            # 첫 번째 시도: 로딩 때 만든 피라미드 단계 또는 공용 썸네일 캐시 (인쇄용 품질)
+            cached = thumbnailing.pick_pyramid_level(obs_data.get('pyramid'), 300)
+            if not cached and cache is not None and obs_data.get('new_path') and os.path.exists(obs_data['new_path']):
+                cached = thumbnailing.get_or_create_thumbnail(
+                    cache, obs_data['new_path'], (300, 300), thumbnailing.TIER_PRINT
+                )
+            if cached:
+                try:
+                    p = row_cells[0].paragraphs[0]
+                    r = p.runs[0] if p.runs else p.add_run()
+                    r.add_picture(cached, width=Inches(1.5))
+                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    image_inserted = True
+                except Exception as e:
+                    log(f"  - Word 이미지 삽입 실패 (캐시): {e}")
+
+            # 두 번째 시도: 실제 파일 경로
+            if not image_inserted and obs_data.get('new_path') and os.path.exists(obs_data['new_path']):
                 try:
                     # 정사각형으로 크롭된 임시 이미지 생성
                     temp_path = os.path.join(log_dir, f"temp_{os.path.basename(obs_data['new_path'])}")
                     with Image.open(obs_data['new_path']) as img:
-                        # EXIF orientation 처리
-                        if hasattr(img, '_getexif'):
-                            exif = img._getexif()
-                            if exif and 274 in exif:
-                                orientation = exif[274]
-                                if orientation == 3:
-                                    img = img.rotate(180, expand=True)
-                                elif orientation == 6:
-                                    img = img.rotate(270, expand=True)
-                                elif orientation == 8:
-                                    img = img.rotate(90, expand=True)
-                        
-                        # 정사각형으로 크롭
-                        width, height = img.size
-                        size = min(width, height)
-                        left = (width - size) // 2
-                        top = (height - size) // 2
-                        right = left + size
-                        bottom = top + size
-                        img_cropped = img.crop((left, top, right, bottom))
-                        img_cropped = img_cropped.resize((300, 300), Image.Resampling.LANCZOS)
-                        img_cropped.save(temp_path, "JPEG")
+                        # EXIF orientation 처리 + 정사각형 크롭 (인쇄용 품질)
+                        orientation = thumbnailing.read_exif_info(img)["orientation"]
+                        img_cropped = thumbnailing.render_square_image(
+                            img, orientation, (300, 300), thumbnailing.TIER_PRINT
+                        )
+                        img_cropped.save(temp_path, "JPEG",
+                                         quality=thumbnailing.QUALITY_TIERS[thumbnailing.TIER_PRINT]["jpeg_quality"])
                     
                     p = row_cells[0].paragraphs[0]
                     r = p.runs[0] if p.runs else p.add_run()
@@ -578,7 +587,7 @@ def create_word_report(log_dir: str, observations: List[Dict], location: str, lo
                 except Exception as e:
                     log(f"  - Word 이미지 삽입 실패 (실제 파일): {e}")
             
-            # 두 번째 시도: 썸네일 파일
+            # 세 번째 시도: 썸네일 파일
             if not image_inserted and obs_data.get('thumbnail_path') and os.path.exists(obs_data['thumbnail_path']):
                 try:
                     p = row_cells[0].paragraphs[0]
@@ -626,9 +635,9 @@ def create_word_report(log_dir: str, observations: List[Dict], location: str, lo
 
 
 def create_visual_reports(copied_files: List[Dict], bird_info_map: Dict[str, Dict], 
-                        output_dir: str, report_options: Dict, location: str, log):
+                        output_dir: str, report_options: Dict, location: str, log, cache=None):
     """시각적 리포트 생성 메인 함수"""
-    log_dir = os.path.join(output_dir, '편집완료_탐조기록')
+    log_dir = os.path.join(output_dir, REPORT_DIR_NAME)
     
     # 관찰 데이터 준비
     observations = prepare_observation_data(copied_files, bird_info_map)
@@ -638,9 +647,9 @@ def create_visual_reports(copied_files: List[Dict], bird_info_map: Dict[str, Dic
     
     if report_format in ['html', 'both']:
         log("- HTML 시각적 리포트 생성 중...")
-        create_html_report(log_dir, observations, location, thumbnail_size, log)
+        create_html_report(log_dir, observations, location, thumbnail_size, log, cache)
     
     if report_format in ['docx', 'both']:
         log("- Word 시각적 리포트 생성 중...")
-        create_word_report(log_dir, observations, location, log)
+        create_word_report(log_dir, observations, location, log, cache)
                 
\ No newline at end of file
@@ -1,8 +1,12 @@
 # 파일 이름: name_check.py (정보 조회 로직 개선)
 import re
-from typing import Dict, List, Optional
-import pandas as pd
-import wikipediaapi
+from typing import Dict, List, Optional, Tuple
+
+import wiki_client
+from name_search import MIN_MATCH_CONFIDENCE, FilenameMatcher, KoreanNameSearcher
+from species_index import SpeciesIndex
+
+WIKI_USER_AGENT = 'BirdRenamerApp/1.0'
 
 def sanitize_filename(name: str) -> str:
     """파일명에 사용할 수 없는 문자 제거 및 공백을 언더스코어로 변경"""
@@ -23,172 +27,175 @@ def extract_korean_bird_names_from_filename(filename: str) -> List[str]:
     korean_words = re.findall(r'[\uac00-\ud7a3]+', basename)
     return [" ".join(korean_words)] if korean_words else []
 
-def search_csv_by_korean_name(df: Optional[pd.DataFrame], name: str) -> Optional[Dict]:
-    """CSV 데이터프레임에서 국명으로 새 정보 검색"""
-    if df is None or not isinstance(name, str) or name.strip() == "": 
+def guess_bird_names_from_filenames(filenames: List[str], matcher: Optional[FilenameMatcher] = None) -> Dict[str, str]:
+    """파일명마다 초기 종 이름 추정 {파일명: 국명}
+
+    체크리스트 매처가 있으면 파일명 속 종 이름을 우선 사용하고,
+    찾지 못하면 기존처럼 파일명의 한글 단어를 이어 붙인 이름(없으면 '미분류')을 사용
+    """
+    matches = matcher.match_many(filenames) if matcher is not None else {}
+    guessed = {}
+    for filename in filenames:
+        match = matches.get(filename)
+        if match and match.confidence >= MIN_MATCH_CONFIDENCE:
+            guessed[filename] = match.korean_name
+            continue
+        names = extract_korean_bird_names_from_filename(filename)
+        guessed[filename] = names[0] if names else "미분류"
+    return guessed
+
+def search_csv_by_korean_name(species_index: Optional[SpeciesIndex], name: str) -> Optional[Dict]:
+    """조류 목록 색인에서 국명으로 새 정보 검색"""
+    if species_index is None or not isinstance(name, str) or name.strip() == "": 
         return None
-    try:
-        result = df[df['국명'] == name.strip()]
-        if not result.empty:
-            bird_info = result.iloc[0].to_dict()
-            return {
-                "korean_name": bird_info.get("국명", name),
-                "common_name": bird_info.get("영명", ""),
-                "scientific_name": bird_info.get("학명", ""),
-                "order": bird_info.get("목", ""), 
-                "family": bird_info.get("과", ""),
-            }
-    except Exception: 
-        pass
-    return None
-
-def get_info_from_wikipedia(wiki, korean_name: str, log_callback=None) -> Dict:
-    """위키피디아에서 정보(영문명, 학명 등)를 가져오는 함수 - 다국어 링크 활용"""
-    info = {"common_name": "", "scientific_name": "", "order": "", "family": ""}
-    if not wiki or not korean_name: 
-        return info
-    
-    try:
-        # 1. 한국어 페이지에서 기본 정보 추출
-        ko_page = wiki.page(korean_name)
-        if not ko_page.exists():
-            if log_callback: 
-                log_callback(f"  - Wiki 한국어 페이지 '{korean_name}' 없음.")
-            return info
-            
-        ko_summary = ko_page.summary
-        
-        # 한국어 페이지에서 학명 추출
-        sci_name_patterns = [
-            r'\((?:학명:)?\s*([A-Z][a-z]+\s+[a-z]+)\)',  # 기본 패턴
-            r'학명은?\s*([A-Z][a-z]+\s+[a-z]+)',  # 학명은/학명:
-            r'([A-Z][a-z]+\s+[a-z]+)\s*\)',  # 괄호 앞 학명
-            r'《([A-Z][a-z]+\s+[a-z]+)》',  # 《학명》 패턴
-        ]
-        
-        for pattern in sci_name_patterns:
-            sci_match = re.search(pattern, ko_summary)
-            if sci_match:
-                info["scientific_name"] = sci_match.group(1).strip()
-                break
-        
-        # 한국어 페이지에서 분류 정보 추출
-        order_patterns = [
-            r'목[은:]?\s*([가-힣]+목)',
-            r'([가-힣]+목)\s*에\s*속',
-            r'속하는\s*([가-힣]+목)',
-        ]
-        
-        for pattern in order_patterns:
-            order_match = re.search(pattern, ko_summary)
-            if order_match:
-                info["order"] = order_match.group(1).strip()
-                break
-        
-        family_patterns = [
-            r'과[은:]?\s*([가-힣]+과)',
-            r'([가-힣]+과)\s*에\s*속',
-            r'속하는\s*([가-힣]+과)',
-        ]
-        
-        for pattern in family_patterns:
-            family_match = re.search(pattern, ko_summary)
-            if family_match:
-                info["family"] = family_match.group(1).strip()
-                break
-        
-        # 2. 영어 페이지에서 영명 가져오기
-        try:
-            # 다국어 링크에서 영어 페이지 찾기
-            if hasattr(ko_page, 'langlinks') and 'en' in ko_page.langlinks:
-                english_title = ko_page.langlinks['en']
-                if log_callback:
-                    log_callback(f"  - 영어 Wiki 페이지 발견: {english_title}")
-                
-                # 영어 위키백과 인스턴스 생성
-                en_wiki = wikipediaapi.Wikipedia(
-                    user_agent='BirdRenamerApp/1.0',
-                    language='en',
-                    extract_format=wikipediaapi.ExtractFormat.WIKI
-                )
-                
-                en_page = en_wiki.page(english_title)
-                if en_page.exists():
-                    # 영어 제목이 곧 영명
-                    english_title_clean = english_title.strip()
-                    
-                    # 괄호 안의 내용 제거 (disambiguation 등)
-                    english_title_clean = re.sub(r'\s*\([^)]*\)', '', english_title_clean)
-                    
-                    if english_title_clean and len(english_title_clean) < 50:
-                        info["common_name"] = english_title_clean
-                        if log_callback:
-                            log_callback(f"  - 영명 발견: {english_title_clean}")
-                    
-                    # 영어 페이지에서 추가 학명 확인 (더 정확할 수 있음)
-                    if not info["scientific_name"]:
-                        en_summary = en_page.summary
-                        en_sci_patterns = [
-                            r'\(([A-Z][a-z]+\s+[a-z]+)\)',  # (Scientific name)
-                            r'scientifically known as ([A-Z][a-z]+\s+[a-z]+)',
-                            r'binomial name ([A-Z][a-z]+\s+[a-z]+)',
-                        ]
-                        
-                        for pattern in en_sci_patterns:
-                            en_sci_match = re.search(pattern, en_summary)
-                            if en_sci_match:
-                                info["scientific_name"] = en_sci_match.group(1).strip()
-                                break
-            else:
-                if log_callback:
-                    log_callback(f"  - 영어 Wiki 페이지 링크 없음.")
-                    
-        except Exception as e:
+    record = species_index.get(name)
+    return record.to_dict() if record else None
+
+def _empty_wiki_info() -> Dict:
+    return {"common_name": "", "scientific_name": "", "order": "", "family": ""}
+
+def get_info_from_wikipedia(wiki, korean_name: str, log_callback=None, cache=None) -> Dict:
+    """위키피디아에서 정보(영문명, 학명 등)를 가져오는 함수 - 다국어 링크 활용
+
+    wiki는 wiki_client.WikiBatchClient (None이면 조회하지 않음).
+
+    cache(wiki_cache.WikiCache)가 주어지면 캐시를 먼저 확인하고, 오프라인 모드면
+    캐시에 없는 이름은 조회하지 않음. 조회 중 오류가 난 결과는 캐시에 저장하지 않음.
+    """
+    if cache is not None and korean_name:
+        hit, cached_info = cache.get(korean_name)
+        if hit:
             if log_callback:
-                log_callback(f"  - 영어 Wiki 조회 중 오류: {e}")
-        
-        # 3. 한국어 페이지에서 영명 찾기 (fallback)
-        if not info["common_name"]:
-            eng_name_patterns = [
-                r'영명[은:]?\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])',  # 영명: 패턴
-                r'영어[로는]?\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])',  # 영어로는 패턴
-                r'\(영어:\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])\)',  # (영어: ) 패턴
-            ]
-            
-            for pattern in eng_name_patterns:
-                eng_match = re.search(pattern, ko_summary)
-                if eng_match:
-                    candidate = eng_match.group(1).strip()
-                    # 학명과 다르고, 적절한 길이인 경우만
-                    if (candidate.lower() != info.get("scientific_name", "").lower() and 
-                        5 < len(candidate) < 50 and 
-                        not any(char in candidate for char in '()[]{}/')):
-                        info["common_name"] = candidate
-                        if log_callback:
-                            log_callback(f"  - 한국어 페이지에서 영명 발견: {candidate}")
-                        break
-        
-        if log_callback: 
-            found_info = []
-            if info["scientific_name"]: found_info.append("학명")
-            if info["common_name"]: found_info.append("영명")
-            if info["order"]: found_info.append("목")
-            if info["family"]: found_info.append("과")
-            
-            if found_info:
-                log_callback(f"  - Wiki에서 '{korean_name}' {', '.join(found_info)} 정보 발견.")
-            else:
-                log_callback(f"  - Wiki에서 '{korean_name}' 추가 정보 없음.")
-                    
-    except Exception as e:
-        if log_callback: 
-            log_callback(f"  - Wiki 조회 중 오류: {e}")
+                log_callback(f"  - Wiki 캐시에서 '{korean_name}' 정보 사용.")
+            return {**_empty_wiki_info(), **cached_info}
+        if cache.offline:
+            if log_callback:
+                log_callback(f"  - 오프라인 모드: '{korean_name}' Wiki 조회 생략.")
+            return _empty_wiki_info()
+
+    if wiki is None:
+        return _empty_wiki_info()
+    info, ok = _lookup_wikipedia_client(wiki, korean_name, log_callback)
+    if cache is not None and ok and wiki and korean_name:
+        cache.put(korean_name, info)
+    return info
+
+# --- Wikipedia 요약문 파싱 (단건 조회와 일괄 조회에서 공용) ---
+def parse_ko_summary(ko_summary: str) -> Dict:
+    """한국어 요약문에서 학명, 목, 과 추출"""
+    info = {"scientific_name": "", "order": "", "family": ""}
+
+    # 한국어 페이지에서 학명 추출
+    sci_name_patterns = [
+        r'\((?:학명:)?\s*([A-Z][a-z]+\s+[a-z]+)\)',  # 기본 패턴
+        r'학명은?\s*([A-Z][a-z]+\s+[a-z]+)',  # 학명은/학명:
+        r'([A-Z][a-z]+\s+[a-z]+)\s*\)',  # 괄호 앞 학명
+        r'《([A-Z][a-z]+\s+[a-z]+)》',  # 《학명》 패턴
+    ]
+    
+    for pattern in sci_name_patterns:
+        sci_match = re.search(pattern, ko_summary)
+        if sci_match:
+            info["scientific_name"] = sci_match.group(1).strip()
+            break
+    
+    # 한국어 페이지에서 분류 정보 추출
+    order_patterns = [
+        r'목[은:]?\s*([가-힣]+목)',
+        r'([가-힣]+목)\s*에\s*속',
+        r'속하는\s*([가-힣]+목)',
+    ]
+    
+    for pattern in order_patterns:
+        order_match = re.search(pattern, ko_summary)
+        if order_match:
+            info["order"] = order_match.group(1).strip()
+            break
+    
+    family_patterns = [
+        r'과[은:]?\s*([가-힣]+과)',
+        r'([가-힣]+과)\s*에\s*속',
+        r'속하는\s*([가-힣]+과)',
+    ]
     
+    for pattern in family_patterns:
+        family_match = re.search(pattern, ko_summary)
+        if family_match:
+            info["family"] = family_match.group(1).strip()
+            break
     return info
 
+def parse_english_title(english_title: str) -> str:
+    """영어 문서 제목을 영명으로 정리 (너무 길면 빈 문자열)"""
+    # 괄호 안의 내용 제거 (disambiguation 등)
+    english_title_clean = re.sub(r'\s*\([^)]*\)', '', english_title.strip())
+    return english_title_clean if english_title_clean and len(english_title_clean) < 50 else ""
 
-def resolve_bird_info(korean_name: str, csv_df: pd.DataFrame, wiki, log_callback=None) -> Dict:
-    """한글 새 이름으로부터 CSV와 Wikipedia를 종합하여 완전한 새 정보 조회 - 개선된 버전"""
+def parse_en_scientific_name(en_summary: str) -> str:
+    """영어 요약문에서 학명 추출"""
+    en_sci_patterns = [
+        r'\(([A-Z][a-z]+\s+[a-z]+)\)',  # (Scientific name)
+        r'scientifically known as ([A-Z][a-z]+\s+[a-z]+)',
+        r'binomial name ([A-Z][a-z]+\s+[a-z]+)',
+    ]
+    
+    for pattern in en_sci_patterns:
+        en_sci_match = re.search(pattern, en_summary)
+        if en_sci_match:
+            return en_sci_match.group(1).strip()
+    return ""
+
+def parse_ko_english_name(ko_summary: str, scientific_name: str) -> str:
+    """한국어 요약문에서 영명 찾기 (영어 문서가 없을 때의 fallback)"""
+    eng_name_patterns = [
+        r'영명[은:]?\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])',  # 영명: 패턴
+        r'영어[로는]?\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])',  # 영어로는 패턴
+        r'\(영어:\s*([A-Za-z][A-Za-z\s-]+[A-Za-z])\)',  # (영어: ) 패턴
+    ]
+    
+    for pattern in eng_name_patterns:
+        eng_match = re.search(pattern, ko_summary)
+        if eng_match:
+            candidate = eng_match.group(1).strip()
+            # 학명과 다르고, 적절한 길이인 경우만
+            if (candidate.lower() != scientific_name.lower() and 
+                5 < len(candidate) < 50 and 
+                not any(char in candidate for char in '()[]{}/')):
+                return candidate
+    return ""
+
+def _log_found_fields(korean_name: str, info: Dict, log_callback):
+    found_info = []
+    if info["scientific_name"]: found_info.append("학명")
+    if info["common_name"]: found_info.append("영명")
+    if info["order"]: found_info.append("목")
+    if info["family"]: found_info.append("과")
+    
+    if found_info:
+        log_callback(f"  - Wiki에서 '{korean_name}' {', '.join(found_info)} 정보 발견.")
+    else:
+        log_callback(f"  - Wiki에서 '{korean_name}' 추가 정보 없음.")
+
+def _lookup_wikipedia_client(client, korean_name: str, log_callback=None) -> Tuple[Dict, bool]:
+    """wiki_client를 통한 단건 조회 (타임아웃/재시도/차단기 적용). (정보, 오류 없이 끝났는지) 반환"""
+    if not korean_name:
+        return _empty_wiki_info(), True
+    if client.circuit_open:
+        if log_callback:
+            log_callback(f"  - Wiki 연결 불안정으로 '{korean_name}' 조회 생략.")
+        return _empty_wiki_info(), False
+
+    infos, failed = fetch_wiki_infos_batch(client, [korean_name])
+    info = infos.get(korean_name, _empty_wiki_info())
+    if log_callback:
+        if korean_name in failed:
+            log_callback(f"  - Wiki 조회 중 오류: {client.stats_text()}")
+        else:
+            _log_found_fields(korean_name, info, log_callback)
+    return info, korean_name not in failed
+
+def _resolve_from_csv(korean_name: str, species_index: Optional[SpeciesIndex], log_callback=None) -> Tuple[Dict, bool]:
+    """CSV 단계: (기본 결과, Wiki 보완이 필요한지) 반환"""
     # 기본 정보 구조
     result = {
         "korean_name": korean_name, 
@@ -200,10 +207,10 @@ def resolve_bird_info(korean_name: str, csv_df: pd.DataFrame, wiki, log_callback
     }
     
     if korean_name == "미분류": 
-        return result
+        return result, False
 
     # 1차: CSV에서 검색
-    csv_info = search_csv_by_korean_name(csv_df, korean_name)
+    csv_info = search_csv_by_korean_name(species_index, korean_name)
     if csv_info:
         result.update(csv_info)
         result["source"] = "CSV"
@@ -229,66 +236,161 @@ def resolve_bird_info(korean_name: str, csv_df: pd.DataFrame, wiki, log_callback
     if not result.get("order"): missing_fields.append("목")
     if not result.get("family"): missing_fields.append("과")
     
-    if missing_fields or not csv_info:
-        if log_callback:
-            if missing_fields:
-                log_callback(f"  - Wiki에서 '{korean_name}' {', '.join(missing_fields)} 검색 중...")
-            else:
-                log_callback(f"  - Wiki에서 '{korean_name}' 추가 정보 확인 중...")
-        
-        wiki_info = get_info_from_wikipedia(wiki, korean_name, log_callback)
+    needs_wiki = bool(missing_fields or not csv_info)
+    if log_callback:
+        if not needs_wiki:
+            log_callback(f"  - CSV에서 모든 정보 완전함, Wiki 검색 생략.")
+        elif missing_fields:
+            log_callback(f"  - Wiki에서 '{korean_name}' {', '.join(missing_fields)} 검색 중...")
+        else:
+            log_callback(f"  - Wiki에서 '{korean_name}' 추가 정보 확인 중...")
+    return result, needs_wiki
+
+def _merge_wiki_info(result: Dict, wiki_info: Dict, log_callback=None):
+    """비어있는 정보만 Wiki 결과로 보완하고 출처 표시 갱신"""
+    korean_name = result["korean_name"]
+    if any(wiki_info.values()):  # Wiki에서 뭔가 찾은 경우
+        updated_fields = []
         
-        if any(wiki_info.values()):  # Wiki에서 뭔가 찾은 경우
-            updated_fields = []
+        # 비어있는 정보만 Wiki로 보완
+        if not result.get("common_name") and wiki_info.get("common_name"):
+            result["common_name"] = wiki_info["common_name"]
+            updated_fields.append("영명")
             
-            # 비어있는 정보만 Wiki로 보완
-            if not result.get("common_name") and wiki_info.get("common_name"):
-                result["common_name"] = wiki_info["common_name"]
-                updated_fields.append("영명")
-                
-            if not result.get("scientific_name") and wiki_info.get("scientific_name"):
-                result["scientific_name"] = wiki_info["scientific_name"]
-                updated_fields.append("학명")
-                
-            if not result.get("order") and wiki_info.get("order"):
-                result["order"] = wiki_info["order"]
-                updated_fields.append("목")
-                
-            if not result.get("family") and wiki_info.get("family"):
-                result["family"] = wiki_info["family"]
-                updated_fields.append("과")
+        if not result.get("scientific_name") and wiki_info.get("scientific_name"):
+            result["scientific_name"] = wiki_info["scientific_name"]
+            updated_fields.append("학명")
             
-            # 소스 정보 업데이트
-            if updated_fields:
-                if result["source"] == "CSV":
-                    result["source"] = f"CSV+Wiki({', '.join(updated_fields)})"
-                else:
-                    result["source"] = f"Wiki({', '.join(updated_fields)})"
-                    
-                if log_callback:
-                    log_callback(f"  - Wiki에서 {', '.join(updated_fields)} 보완 완료.")
-            elif log_callback:
-                log_callback(f"  - Wiki에서 유용한 추가 정보 없음.")
-        else:
+        if not result.get("order") and wiki_info.get("order"):
+            result["order"] = wiki_info["order"]
+            updated_fields.append("목")
+            
+        if not result.get("family") and wiki_info.get("family"):
+            result["family"] = wiki_info["family"]
+            updated_fields.append("과")
+        
+        # 소스 정보 업데이트
+        if updated_fields:
+            if result["source"] == "CSV":
+                result["source"] = f"CSV+Wiki({', '.join(updated_fields)})"
+            else:
+                result["source"] = f"Wiki({', '.join(updated_fields)})"
+                
             if log_callback:
-                log_callback(f"  - Wiki에서 '{korean_name}' 정보 없음.")
+                log_callback(f"  - Wiki에서 {', '.join(updated_fields)} 보완 완료.")
+        elif log_callback:
+            log_callback(f"  - Wiki에서 유용한 추가 정보 없음.")
     else:
         if log_callback:
-            log_callback(f"  - CSV에서 모든 정보 완전함, Wiki 검색 생략.")
-            
+            log_callback(f"  - Wiki에서 '{korean_name}' 정보 없음.")
+
+def _fill_not_available(result: Dict) -> Dict:
     # 최종적으로 비어있는 필드는 'N/A'로 채움
     for key in ["common_name", "scientific_name", "order", "family"]:
         if not result[key]: 
             result[key] = "N/A"
-            
     return result
 
-def fuzzy_search_kor_name(query: str, all_names: List[str], limit: int = 10) -> List[str]:
-    """자동완성용 한글 이름 유사도 검색"""
+def resolve_bird_info(korean_name: str, species_index: Optional[SpeciesIndex], wiki, log_callback=None, wiki_cache=None) -> Dict:
+    """한글 새 이름으로부터 CSV와 Wikipedia를 종합하여 완전한 새 정보 조회 - 개선된 버전"""
+    if korean_name == "미분류": 
+        return _resolve_from_csv(korean_name, species_index)[0]
+
+    result, needs_wiki = _resolve_from_csv(korean_name, species_index, log_callback)
+    if needs_wiki:
+        wiki_info = get_info_from_wikipedia(wiki, korean_name, log_callback, cache=wiki_cache)
+        _merge_wiki_info(result, wiki_info, log_callback)
+    return _fill_not_available(result)
+
+def resolve_bird_info_csv(korean_name: str, species_index: Optional[SpeciesIndex]) -> Tuple[Dict, bool]:
+    """네트워크 없이 CSV만으로 종 정보 구성. (정보, Wiki 보완이 필요한지) 반환"""
+    result, needs_wiki = _resolve_from_csv(korean_name, species_index)
+    if korean_name == "미분류":
+        return result, False
+    return _fill_not_available(result), needs_wiki
+
+def resolve_bird_info_batch(korean_names, species_index: Optional[SpeciesIndex], client, log_callback=None,
+                            wiki_cache=None) -> Dict[str, Dict]:
+    """여러 국명을 한꺼번에 조회 - Wiki가 필요한 이름만 모아 다중 제목 API 요청으로 처리
+
+    client는 wiki_client.WikiBatchClient. 캐시 적중/오프라인 처리는 단건 조회와 같음.
+    """
+    results: Dict[str, Dict] = {}
+    pending: List[str] = []
+    for name in dict.fromkeys(korean_names):
+        if name == "미분류":
+            results[name] = _resolve_from_csv(name, species_index)[0]
+            continue
+        result, needs_wiki = _resolve_from_csv(name, species_index)
+        results[name] = result
+        if needs_wiki: pending.append(name)
+
+    wiki_infos: Dict[str, Dict] = {}
+    to_fetch: List[str] = []
+    for name in pending:
+        if wiki_cache is not None:
+            hit, cached_info = wiki_cache.get(name)
+            if hit:
+                wiki_infos[name] = {**_empty_wiki_info(), **cached_info}
+                continue
+            if wiki_cache.offline:
+                continue
+        to_fetch.append(name)
+
+    if to_fetch and client is not None:
+        if log_callback:
+            log_callback(f"Wiki에서 {len(to_fetch)}종 정보 일괄 조회 중...")
+        fetched, failed = fetch_wiki_infos_batch(client, to_fetch)
+        for name, info in fetched.items():
+            wiki_infos[name] = info
+            if wiki_cache is not None and name not in failed:
+                wiki_cache.put(name, info)
+
+    for name in pending:
+        _merge_wiki_info(results[name], wiki_infos.get(name, _empty_wiki_info()))
+    return {name: _fill_not_available(result) for name, result in results.items()}
+
+def fetch_wiki_infos_batch(client, korean_names: List[str]) -> Tuple[Dict[str, Dict], set]:
+    """한국어 문서(요약+영어 링크)와 영어 문서(요약)를 묶음 요청으로 받아 정보 추출
+
+    반환: ({국명: 정보}, 조회 오류가 난 국명 집합)
+    """
+    ko_pages, ko_failed = client.fetch_pages("ko", korean_names)
+    infos: Dict[str, Dict] = {}
+    english_titles = {}
+    for name in korean_names:
+        info = _empty_wiki_info()
+        page = ko_pages.get(name)
+        if page and page["exists"]:
+            info.update(parse_ko_summary(page["extract"]))
+            en_title = page["langlinks"].get("en")
+            if en_title: english_titles[name] = en_title
+        infos[name] = info
+
+    en_pages, en_failed_titles = client.fetch_pages("en", list(set(english_titles.values())))
+    failed = set(ko_failed)
+    for name, en_title in english_titles.items():
+        if en_title in en_failed_titles:
+            failed.add(name)
+            continue
+        en_page = en_pages.get(en_title)
+        if en_page and en_page["exists"]:
+            infos[name]["common_name"] = parse_english_title(en_title)
+            if not infos[name]["scientific_name"]:
+                infos[name]["scientific_name"] = parse_en_scientific_name(en_page["extract"])
+
+    for name in korean_names:
+        page = ko_pages.get(name)
+        if page and page["exists"] and not infos[name]["common_name"]:
+            infos[name]["common_name"] = parse_ko_english_name(page["extract"], infos[name]["scientific_name"])
+    return infos, failed
+
+def fuzzy_search_kor_name(query: str, all_names, limit: int = 10) -> List[str]:
+    """자동완성용 한글 이름 검색 (완전 일치 → 앞부분 → 중간, 초성/조합 중 글자 지원)
+
+    all_names에는 미리 만든 name_search.KoreanNameSearcher를 넘기는 것을 권장 (목록이면 매번 색인 생성)
+    """
     if not query: 
         return []
-    query = query.lower()
-    exact_matches = [name for name in all_names if query == name.lower()]
-    starts_with = [name for name in all_names if name.lower().startswith(query) and name not in exact_matches]
-    contains = [name for name in all_names if query in name.lower() and name not in exact_matches + starts_with]
-    return (exact_matches + starts_with + contains)[:limit]
\ No newline at end of file
+    searcher = all_names if isinstance(all_names, KoreanNameSearcher) else KoreanNameSearcher(all_names)
+    return searcher.search(query, limit)
@@ -0,0 +1,361 @@
+# 파일 이름: name_search.py - 국명 검색 엔진 (자동완성 트라이/n-gram 색인, 파일명 종 이름 매칭)
+import os
+import re
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import hangul
+
+NGRAM_SIZE = 2
+
+
+class _SubstringIndex:
+    """문자열 목록에 대한 접두(트라이) / 부분 문자열(n-gram 역색인) 검색
+
+    트라이의 각 노드는 그 접두어를 가진 항목 번호를 오름차순으로 들고 있어
+    접두 검색은 노드까지 내려간 뒤 목록을 자르기만 하면 됨.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys = keys
+        self._root: Dict = {"ids": []}
+        self._postings: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            node = self._root
+            for ch in key:
+                node = node.setdefault(ch, {"ids": []})
+                node["ids"].append(i)
+            for gram in set(key) | set(hangul.ngrams(key, NGRAM_SIZE)):
+                self._postings.setdefault(gram, []).append(i)
+
+    def prefix(self, query: str) -> List[int]:
+        node = self._root
+        for ch in query:
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node["ids"]
+
+    def contains(self, query: str, limit: int) -> List[int]:
+        grams = {query} if len(query) <= 1 else set(hangul.ngrams(query, NGRAM_SIZE))
+        postings = [self._postings.get(g) for g in grams]
+        if not all(postings):
+            return []
+        # 가장 짧은 역색인 목록만 순서대로 훑으면서 실제로 포함되는지 확인 (limit개 찾으면 중단)
+        result = []
+        for i in min(postings, key=len):
+            if query in self.keys[i]:
+                result.append(i)
+                if len(result) >= limit: break
+        return result
+
+
+class KoreanNameSearcher:
+    """국명 목록을 미리 색인해 두고 키 입력마다 빠르게 후보를 찾는 검색기
+
+    - 자모 단위로 분해해서 색인하므로 조합 중인 글자('흑기럭')도 '흑기러기'의 앞부분으로 일치
+    - 자음만 입력하면 초성 색인도 함께 검색 ('ㅎㄱㄹㄱ' → '흑기러기')
+    - 결과 순서: 완전 일치 → 앞부분 일치 → 중간 일치, 같은 단계 안에서는 목록 순서
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self.names: List[str] = list(dict.fromkeys(n for n in names if isinstance(n, str) and n))
+        self._exact = {name.lower(): i for i, name in reversed(list(enumerate(self.names)))}
+        self._jamo = _SubstringIndex([hangul.decompose(name) for name in self.names])
+        self._choseong = _SubstringIndex([hangul.choseong(name) for name in self.names])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        query = query.strip() if isinstance(query, str) else ""
+        if not query or not self.names:
+            return []
+
+        ordered: List[int] = []
+        seen: Set[int] = set()
+
+        def add(ids):
+            for i in ids:
+                if len(ordered) >= limit: return
+                if i not in seen:
+                    seen.add(i)
+                    ordered.append(i)
+
+        exact = self._exact.get(query.lower())
+        if exact is not None:
+            add([exact])
+
+        # (자모 색인, 자모 질의) + 자음만 입력했으면 (초성 색인, 초성 질의)
+        targets = [(self._jamo, hangul.decompose(query))]
+        if hangul.is_choseong_query(query):
+            targets.append((self._choseong, hangul.choseong(query)))
+
+        for stage in ("prefix", "contains"):
+            if len(ordered) >= limit: break
+            # 각 결과는 목록 순서로 정렬되어 있으므로 앞쪽 일부만 합쳐도 상위 결과는 보존
+            ids: Set[int] = set()
+            for index, key in targets:
+                if stage == "prefix":
+                    ids.update(index.prefix(key)[:limit + len(ordered)])
+                else:
+                    ids.update(index.contains(key, limit + len(ordered)))
+            add(sorted(ids))
+        return [self.names[i] for i in ordered]
+
+
+# --- 파일명에서 종 이름 찾기 (Aho-Corasick) ---
+
+MIN_MATCH_CONFIDENCE = 0.5
+SOURCE_KOREAN = "국명"
+SOURCE_ENGLISH = "영명"
+SOURCE_SCIENTIFIC = "학명"
+_SEPARATORS = re.compile(r"[\s_\-.,()\[\]]+")
+_DIGITS = re.compile(r"\d+")
+_MISSING = object()
+
+
+class FilenameMatch(NamedTuple):
+    korean_name: str
+    matched_text: str
+    confidence: float
+    source: str
+
+
+def normalize_for_match(text: str) -> str:
+    """소문자로 바꾸고 구분 문자(_, -, 공백 등)를 공백 하나로 통일"""
+    text = text.replace("*", "").lower()
+    return " " + _SEPARATORS.sub(" ", text).strip() + " "
+
+
+class FilenameMatcher:
+    """체크리스트의 국명/영명/학명 전체로 만든 Aho-Corasick 오토마톤
+
+    - 파일명을 한 번 훑어서 들어 있는 모든 종 이름을 찾고, 그중 가장 그럴듯한 것 하나를 신뢰도와 함께 반환
+    - 단어 경계에 딱 맞는 일치 > 긴 이름 > 짧은 이름 순으로 선택, 서로 다른 종이 여럿 나오면 신뢰도를 낮춤
+    - 숫자(일련번호, 날짜)를 뺀 나머지가 같은 파일명은 결과를 재사용하여 대량 일괄 처리 비용을 줄임
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str, str]]):
+        # patterns: (이름, 국명, 출처)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+        self._patterns: List[Tuple[str, str, str]] = []
+        seen = set()
+        for text, korean_name, source in patterns:
+            key = normalize_for_match(text).strip()
+            if len(key) < 1 or key in seen: continue
+            seen.add(key)
+            self._add(key, len(self._patterns))
+            self._patterns.append((key, korean_name, source))
+        self._build_links()
+        self._memo: Dict[str, Optional[FilenameMatch]] = {}
+
+    @classmethod
+    def from_species_index(cls, species_index) -> "FilenameMatcher":
+        patterns = []
+        for record in species_index.records():
+            patterns.append((record.korean_name, record.korean_name, SOURCE_KOREAN))
+            hangul_only = "".join(ch for ch in record.korean_name if hangul.is_syllable(ch))
+            if hangul_only and hangul_only != record.korean_name.replace("*", ""):
+                patterns.append((hangul_only, record.korean_name, SOURCE_KOREAN))  # 'E 검은날개흰따오기' 등
+        # 국명을 모두 넣은 뒤 별칭 추가 (같은 문자열이면 국명이 우선)
+        for record in species_index.records():
+            if len(record.common_name) >= 3:
+                patterns.append((record.common_name, record.korean_name, SOURCE_ENGLISH))
+            if record.scientific_name:
+                patterns.append((record.scientific_name, record.korean_name, SOURCE_SCIENTIFIC))
+        return cls(patterns)
+
+    def _add(self, key: str, pattern_id: int):
+        node = 0
+        for ch in key:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = nxt
+        self._outputs[node].append(pattern_id)
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # 실패 링크 쪽에서 끝나는 (더 짧은) 이름도 이 노드에서 함께 보고
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """정규화된 문자열에서 (끝 위치, 패턴 번호) 전부 찾기"""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        found = []
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if outputs[node]:
+                found.extend((pos, pid) for pid in outputs[node])
+        return found
+
+    def _score(self, text: str) -> Optional[FilenameMatch]:
+        candidates = []
+        for end, pid in self.find_all(text):
+            key, korean_name, source = self._patterns[pid]
+            start = end - len(key) + 1
+            aligned = text[start - 1] == " " and text[end + 1] == " "
+            # 한 글자 이름이나 영명/학명은 단어 경계에 맞을 때만 인정
+            if not aligned and (len(key) < 2 or source != SOURCE_KOREAN):
+                continue
+            candidates.append((aligned, len(key), source == SOURCE_KOREAN, -start, korean_name, key, source))
+        if not candidates:
+            return None
+        best = max(candidates)
+        aligned, _, is_korean, _, korean_name, key, source = best
+        confidence = (1.0 if aligned else 0.6) * (1.0 if is_korean else 0.9)
+        # 겹치지 않는 곳에서 다른 종 이름도 단어로 나오면 애매한 파일명
+        best_start = -best[3]
+        rivals = {c[4] for c in candidates
+                  if c[0] and c[4] != korean_name and (-c[3] >= best_start + len(key) or -c[3] + c[1] <= best_start)}
+        if rivals:
+            confidence *= 0.8
+        return FilenameMatch(korean_name, key, round(confidence, 2), source)
+
+    def match(self, filename: str) -> Optional[FilenameMatch]:
+        """파일명에서 가장 그럴듯한 종 이름 찾기 (없으면 None)"""
+        # 숫자(날짜, 시각, 일련번호)는 종 이름에 없으므로 지우고, 같은 나머지 부분은 결과 재사용
+        key = _DIGITS.sub(" ", os.path.splitext(filename)[0])
+        result = self._memo.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._memo[key] = self._score(normalize_for_match(key))
+        return result
+
+    def match_many(self, filenames: Iterable[str]) -> Dict[str, Optional[FilenameMatch]]:
+        """여러 파일명을 한꺼번에 처리. {파일명: 일치 결과 또는 None}"""
+        return {filename: self.match(filename) for filename in filenames}
+
+
+# --- 오타가 있는 이름에 대한 종 제안 (SymSpell 방식 삭제 색인) ---
+
+MAX_SUGGEST_DISTANCE = 2
+SHORT_KEY_JAMO = 6  # 자모 6개 이하(대략 두 글자)는 편집 거리 1까지만 허용
+MIN_TOKEN_JAMO = 4
+_HANGUL_WORD = re.compile(r"[가-힣]+")
+
+
+class SpeciesSuggestion(NamedTuple):
+    korean_name: str
+    token: str
+    distance: int
+
+
+def _deletes(key: str, max_distance: int) -> Set[str]:
+    """key에서 글자를 max_distance개까지 지운 모든 문자열 (key 자신 포함)"""
+    result = {key}
+    frontier = {key}
+    for _ in range(max_distance):
+        nxt = set()
+        for word in frontier:
+            if len(word) <= 1: continue
+            for i in range(len(word)):
+                nxt.add(word[:i] + word[i + 1:])
+        nxt -= result
+        result |= nxt
+        frontier = nxt
+    return result
+
+
+def jamo_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """자모열 간 편집 거리 (인접 자모 바꿈 포함), max_distance를 넘으면 max_distance + 1"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return min(prev[-1], max_distance + 1)
+
+
+class SpeciesSuggester:
+    """국명을 자모로 분해해 삭제 색인(SymSpell)을 만들어 두고, 오타 난 이름에 가장 가까운 종을 제안
+
+    색인과 질의 양쪽에서 자모를 최대 max_distance개 지운 문자열이 겹치는 후보만 실제 거리를 계산하므로
+    파일 수가 많아도 전체 국명과 일일이 비교하지 않음.
+    """
+
+    def __init__(self, names: Sequence[str], max_distance: int = MAX_SUGGEST_DISTANCE):
+        self.max_distance = max_distance
+        self.names: List[str] = list(dict.fromkeys(n for n in names if isinstance(n, str) and n))
+        self._keys = [hangul.decompose(n.replace("*", "")) for n in self.names]
+        self._exact = {key: i for i, key in reversed(list(enumerate(self._keys)))}
+        self._deletes: Dict[str, List[int]] = {}
+        for i, key in enumerate(self._keys):
+            for d in _deletes(key, max_distance):
+                self._deletes.setdefault(d, []).append(i)
+        self._memo: Dict[str, Optional[SpeciesSuggestion]] = {}
+
+    def _allowed_distance(self, key: str) -> int:
+        return min(self.max_distance, 1 if len(key) <= SHORT_KEY_JAMO else 2)
+
+    def suggest(self, token: str) -> Optional[SpeciesSuggestion]:
+        """한 단어에 대한 가장 가까운 국명 (허용 거리 밖이면 None)"""
+        if token in self._memo:
+            return self._memo[token]
+        key = hangul.decompose(token)
+        result = None
+        if len(key) >= MIN_TOKEN_JAMO:
+            if key in self._exact:
+                result = SpeciesSuggestion(self.names[self._exact[key]], token, 0)
+            else:
+                allowed = self._allowed_distance(key)
+                best = None
+                candidates = set()
+                for d in _deletes(key, allowed):
+                    candidates.update(self._deletes.get(d, ()))
+                for i in sorted(candidates):
+                    dist = jamo_edit_distance(key, self._keys[i], allowed)
+                    if dist <= allowed and (best is None or dist < best[0]):
+                        best = (dist, i)
+                if best:
+                    result = SpeciesSuggestion(self.names[best[1]], token, best[0])
+        self._memo[token] = result
+        return result
+
+    def suggest_for_filename(self, filename: str) -> Optional[SpeciesSuggestion]:
+        """파일명의 한글 단어(및 단어를 이어 붙인 것) 중 가장 가까운 종 제안"""
+        words = _HANGUL_WORD.findall(os.path.splitext(filename)[0])
+        tokens = list(dict.fromkeys(words + (["".join(words)] if len(words) > 1 else [])))
+        best = None
+        for token in tokens:
+            suggestion = self.suggest(token)
+            # 거리가 작은 것, 같으면 긴 단어에서 나온 제안 우선
+            if suggestion and (best is None or (suggestion.distance, -len(token)) < (best.distance, -len(best.token))):
+                best = suggestion
+        return best
+
+    def suggest_many(self, filenames: Iterable[str]) -> Dict[str, SpeciesSuggestion]:
+        """여러 파일명에 대한 제안 {파일명: 제안} (제안이 없는 파일은 제외)"""
+        suggestions = {}
+        for filename in filenames:
+            suggestion = self.suggest_for_filename(filename)
+            if suggestion:
+                suggestions[filename] = suggestion
+        return suggestions
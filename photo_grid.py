@@ -0,0 +1,336 @@
+# 파일 이름: photo_grid.py - 보이는 줄만 위젯을 만드는 가상화 썸네일 격자, 표시용 이미지 LRU 캐시와 미리 읽기
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import customtkinter
+from PIL import Image
+
+CELL_IMAGE_SIZE = 200
+ROW_HEIGHT = 290  # 썸네일 + 원본 파일명 + 미리보기 라벨 높이 (대략)
+DEFAULT_COLUMNS = 5
+OVERSCAN_ROWS = 1  # 화면 아래로 미리 만들어 둘 줄 수
+DEFAULT_IMAGE_CACHE_BYTES = 256 * 1024 ** 2
+BYTES_PER_PIXEL = 8  # PIL 이미지(RGBX) + Tk PhotoImage 사본을 합친 대략적인 크기
+
+
+def image_key(photo_info: Dict) -> str:
+    """표시용 이미지/대기 중인 디코딩을 구분하는 키: 원본 경로
+
+    썸네일 경로는 만들지 못했으면 None이라 여러 사진이 같은 키를 쓰게 되므로 키로 쓰지 않음.
+    """
+    return photo_info["path"]
+
+
+def make_ctk_image(image: Image.Image) -> customtkinter.CTkImage:
+    """PIL 이미지를 화면 표시용 CTkImage로 (메인 스레드에서 호출)"""
+    return customtkinter.CTkImage(light_image=image, dark_image=image, size=image.size)
+
+
+class ImageLRUCache:
+    """image_key(원본 경로) → 바로 표시할 수 있는 CTkImage, 메모리 상한을 넘으면 가장 오래 안 쓴 것부터 버림
+
+    CTkImage는 Tk 객체를 만들기 때문에 메인 스레드에서만 사용.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[str, Tuple[customtkinter.CTkImage, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[customtkinter.CTkImage]:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key: str, image: Image.Image) -> customtkinter.CTkImage:
+        """PIL 이미지를 CTkImage로 만들어 등록하고 반환 (이미 있으면 기존 것 반환)"""
+        if key in self._items:
+            self._items.move_to_end(key)
+            return self._items[key][0]
+        ctk_image = make_ctk_image(image)
+        nbytes = image.width * image.height * BYTES_PER_PIXEL
+        self._items[key] = (ctk_image, nbytes)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            _, (_, old_bytes) = self._items.popitem(last=False)
+            self._bytes -= old_bytes
+        return ctk_image
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+
+
+class ThumbnailPrefetcher:
+    """다음에 볼 가능성이 높은 종(목록의 위/아래)의 첫 화면 썸네일을 미리 디코딩해서 캐시에 넣음
+
+    - 디코딩은 전용 executor(보통 스레드 1개)에서 하므로 화면에 보이는 썸네일 로딩을 막지 않음
+    - prefetch()를 다시 부르면 이전 요청 중 시작하지 않은 작업은 취소
+    - dispatch(fn, *args)는 fn을 메인 스레드에서 실행하도록 넘기는 함수 (progress.MainThreadQueue.call)
+    """
+
+    def __init__(self, dispatch: Callable[..., None], executor: Executor, cache: ImageLRUCache,
+                 load_image: Callable[[Dict], Image.Image]):
+        self._dispatch = dispatch
+        self._executor = executor
+        self._cache = cache
+        self._load_image = load_image
+        self._futures: Dict[str, Future] = {}
+
+    def prefetch(self, photo_infos: Iterable[Dict]):
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
+        for photo_info in photo_infos:
+            key = image_key(photo_info)
+            if key in self._cache or key in self._futures: continue
+            future = self._executor.submit(self._load_image, photo_info)
+            self._futures[key] = future
+            future.add_done_callback(lambda f, k=key: self._deliver(k, f))
+
+    def _deliver(self, key: str, future: Future):
+        # 작업자 스레드에서 호출됨: 캐시(Tk 객체 생성)는 메인 스레드에서만 갱신
+        if future.cancelled() or future.exception() is not None: return
+        self._dispatch(self._store, key, future)
+
+    def _store(self, key: str, future: Future):
+        if self._futures.get(key) is future:
+            del self._futures[key]
+        self._cache.put(key, future.result())
+
+
+class _Cell:
+    """재사용되는 격자 칸 하나 (프레임 + 이미지/파일명/미리보기 라벨)"""
+
+    def __init__(self, master, placeholder, on_click, on_wheel):
+        self.frame = customtkinter.CTkFrame(master)
+        self.image_label = customtkinter.CTkLabel(self.frame, image=placeholder, text="", cursor="hand2")
+        self.image_label.pack(pady=(5, 0))
+        self.name_label = customtkinter.CTkLabel(self.frame, text="", wraplength=190, font=customtkinter.CTkFont(size=12))
+        self.name_label.pack(padx=5)
+        self.preview_label = customtkinter.CTkLabel(self.frame, text="", wraplength=190,
+                                                    font=customtkinter.CTkFont(size=12, weight="bold"), text_color="#3498db")
+        self.preview_label.pack(padx=5, pady=(0, 5))
+        self.photo_index: Optional[int] = None
+        self.image_key: Optional[str] = None
+        self.image_label.bind("<Button-1>", lambda e: on_click(self))
+        for widget in (self.frame, self.image_label, self.name_label, self.preview_label):
+            bind_mouse_wheel(widget, on_wheel)
+
+    def set_text(self, label, text: str):
+        if label.cget("text") != text:
+            label.configure(text=text)
+
+    def set_image(self, key: Optional[str], image):
+        if self.image_key != key:
+            self.image_key = key
+            self.image_label.configure(image=image)
+
+
+def bind_mouse_wheel(widget, handler):
+    widget.bind("<MouseWheel>", handler, add="+")
+    widget.bind("<Button-4>", handler, add="+")  # Linux
+    widget.bind("<Button-5>", handler, add="+")
+
+
+class VirtualPhotoGrid(customtkinter.CTkFrame):
+    """사진 수와 관계없이 화면에 보이는 줄(+여유 줄)만큼의 칸만 만들어 재사용하는 썸네일 격자
+
+    - load_image(photo_info) -> PIL 이미지: 작업자 스레드(executor)에서 호출되어 썸네일을 디코딩
+    - preview_text(photo_info) -> 미리보기 문자열: 보이는 칸을 그릴 때만 호출
+    - on_open(photo_info): 썸네일 클릭 시 호출
+    - 스크롤은 줄 단위, 화면에서 벗어난 칸의 대기 중인 디코딩 작업은 취소
+    - 디코딩된 이미지는 image_cache(ImageLRUCache)에 넣어 다른 종을 보고 돌아와도 다시 디코딩하지 않음
+    - 디코딩 결과는 dispatch(fn, *args)로 메인 스레드에 넘김 (작업자 스레드에서 Tk를 호출하지 않음)
+    """
+
+    def __init__(self, master, executor: Executor, dispatch: Callable[..., None],
+                 load_image: Callable[[Dict], Image.Image],
+                 preview_text: Callable[[Dict], str], on_open: Callable[[Dict], None],
+                 image_cache: Optional[ImageLRUCache] = None, columns: int = DEFAULT_COLUMNS, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self._executor = executor
+        self._dispatch = dispatch
+        self._load_image = load_image
+        self._preview_text = preview_text
+        self._on_open = on_open
+        self.columns = columns
+        self._photos: List[Dict] = []
+        self._first_row = 0
+        self._cells: List[_Cell] = []
+        self._images = image_cache if image_cache is not None else ImageLRUCache()
+        self._pending: Dict[str, Future] = {}
+        self._failed: Dict[str, str] = {}
+        self._generation = 0
+        self._render_after_id = None
+        self._destroyed = False
+
+        blank = Image.new("RGB", (CELL_IMAGE_SIZE, CELL_IMAGE_SIZE), (90, 90, 90))
+        self._placeholder = customtkinter.CTkImage(light_image=blank, dark_image=blank, size=(CELL_IMAGE_SIZE, CELL_IMAGE_SIZE))
+
+        self._body = customtkinter.CTkFrame(self, fg_color="transparent")
+        self._body.pack(side="left", fill="both", expand=True)
+        self._scrollbar = customtkinter.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+        bind_mouse_wheel(self._body, self._on_wheel)
+        self.bind("<Configure>", lambda e: self._schedule_render())
+
+    # --- 공개 API ---
+    def set_photos(self, photos: List[Dict]):
+        """표시할 사진 목록 지정 (목록은 복사하지 않음)"""
+        self._generation += 1
+        self._cancel_pending()
+        self._photos = photos
+        self._first_row = 0
+        self._failed.clear()
+        self._schedule_render()
+
+    def refresh_previews(self):
+        """보이는 칸의 미리보기 문자열만 다시 계산"""
+        for cell in self._cells:
+            if cell.photo_index is not None:
+                cell.set_text(cell.preview_label, self._preview_text(self._photos[cell.photo_index]))
+
+    # --- 배치/스크롤 ---
+    @property
+    def _total_rows(self) -> int:
+        return -(-len(self._photos) // self.columns)
+
+    def _visible_rows(self) -> int:
+        height = self.winfo_height()
+        return max(1, height // ROW_HEIGHT) if height > 1 else 2
+
+    def _schedule_render(self):
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render)
+
+    def _scroll_to(self, row: int):
+        row = max(0, min(row, self._total_rows - self._visible_rows()))
+        if row != self._first_row:
+            self._first_row = row
+            self._schedule_render()
+
+    def _on_scrollbar(self, *args):
+        if not args: return
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * self._total_rows))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible_rows() if args[2] == "pages" else 1)
+            self._scroll_to(self._first_row + step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._first_row - 1)
+        else:
+            self._scroll_to(self._first_row + 1)
+        return "break"
+
+    def _ensure_cells(self, count: int):
+        while len(self._cells) < count:
+            i = len(self._cells)
+            cell = _Cell(self._body, self._placeholder, self._on_cell_click, self._on_wheel)
+            cell.frame.grid(row=i // self.columns, column=i % self.columns, padx=5, pady=5)
+            self._cells.append(cell)
+
+    def _render(self):
+        self._render_after_id = None
+        if not self.winfo_exists(): return
+        rows = self._visible_rows()
+        self._ensure_cells((rows + OVERSCAN_ROWS) * self.columns)
+
+        start = self._first_row * self.columns
+        visible_keys = set()
+        for k, cell in enumerate(self._cells):
+            index = start + k
+            if index >= len(self._photos):
+                cell.photo_index = None
+                cell.frame.grid_remove()
+                continue
+            photo_info = self._photos[index]
+            key = image_key(photo_info)
+            visible_keys.add(key)
+            cell.photo_index = index
+            cell.frame.grid()
+            cell.set_text(cell.name_label, photo_info["original_filename"])
+            cell.set_text(cell.preview_label, self._preview_text(photo_info))
+            image = self._images.get(key)
+            if image is not None:
+                cell.set_image(key, image)
+            else:
+                cell.set_image(None, self._placeholder)
+                if key in self._failed:
+                    cell.set_text(cell.preview_label, f"썸네일 로드 실패\n{self._failed[key]}")
+                else:
+                    self._request(photo_info)
+
+        # 화면 밖으로 나간 칸의 대기 중인 디코딩은 취소
+        for key in [k for k in self._pending if k not in visible_keys]:
+            if self._pending[key].cancel():
+                del self._pending[key]
+
+        total = max(1, self._total_rows)
+        self._scrollbar.set(self._first_row / total, min(1.0, (self._first_row + rows) / total))
+
+    def _on_cell_click(self, cell: _Cell):
+        if cell.photo_index is not None:
+            self._on_open(self._photos[cell.photo_index])
+
+    # --- 백그라운드 디코딩 ---
+    def _request(self, photo_info: Dict):
+        key = image_key(photo_info)
+        if key in self._pending: return
+        generation = self._generation
+        future = self._executor.submit(self._load_image, photo_info)
+        self._pending[key] = future
+        future.add_done_callback(lambda f: self._deliver(key, f, generation))
+
+    def _deliver(self, key: str, future: Future, generation: int):
+        # 작업자 스레드에서 호출됨: UI 갱신은 메인 스레드로 넘김
+        if future.cancelled(): return
+        self._dispatch(self._on_loaded, key, future, generation)
+
+    def _on_loaded(self, key: str, future: Future, generation: int):
+        image = None
+        try:
+            # 다른 종으로 넘어간 뒤 도착한 결과도 캐시에는 넣어 둠
+            image = self._images.put(key, future.result())
+        except Exception as e:
+            self._failed[key] = str(e)
+        # 격자가 이미 닫혔으면(다른 종 선택) 캐시에만 넣고 끝냄
+        if self._destroyed or generation != self._generation: return
+        self._pending.pop(key, None)
+        for cell in self._cells:
+            if cell.photo_index is not None and image_key(self._photos[cell.photo_index]) == key:
+                if image is not None:
+                    cell.set_image(key, image)
+                else:
+                    cell.set_text(cell.preview_label, f"썸네일 로드 실패\n{self._failed[key]}")
+
+    def _cancel_pending(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def destroy(self):
+        # 다른 종으로 넘어가면 아직 시작하지 않은 디코딩 작업은 버림
+        self._generation += 1
+        self._destroyed = True
+        self._cancel_pending()
+        super().destroy()
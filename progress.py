@@ -0,0 +1,147 @@
+# 파일 이름: progress.py - 작업 스레드의 진행 상황을 UI로 전달하는 이벤트 버스 (큐 + 주기적 반영)
+import queue
+import time
+from typing import Callable, NamedTuple, Optional
+
+IDLE_STAGE = ""  # 진행 막대를 비우는 단계 (작업 종료)
+
+
+class ProgressEvent(NamedTuple):
+    """작업 스레드가 올리는 진행 이벤트 (None인 항목은 이전 값 유지)"""
+    stage: Optional[str]
+    current: Optional[int]
+    total: Optional[int]
+    message: Optional[str]
+    timestamp: float
+
+
+class ProgressSnapshot(NamedTuple):
+    """UI에 그릴 현재 상태 (여러 이벤트를 합친 결과)"""
+    stage: str
+    current: int
+    total: int
+    message: str
+    rate: Optional[float]  # 초당 처리 개수
+    eta: Optional[float]   # 남은 시간(초)
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.current / self.total) if self.total else 0.0
+
+    def detail_text(self) -> str:
+        """'120/500 · 35.2장/s · 남은 시간 0:11' 형식 (진행 단계가 없으면 빈 문자열)"""
+        if not self.stage or not self.total: return ""
+        parts = [f"{self.stage} {self.current}/{self.total}"]
+        if self.rate:
+            parts.append(f"{self.rate:.1f}장/s")
+        if self.eta is not None and self.current < self.total:
+            parts.append(f"남은 시간 {format_duration(self.eta)}")
+        return " · ".join(parts)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+class ProgressBus:
+    """어느 스레드에서나 post할 수 있는 진행 상황 큐
+
+    - 작업 스레드는 위젯을 건드리지 않고 이벤트만 올림 (파일마다 올려도 비용이 작음)
+    - UI 스레드가 타이머로 drain하여 쌓인 이벤트를 한 번에 합쳐 마지막 상태만 그림
+    - 처리 속도/남은 시간은 단계가 시작된 시점부터의 평균으로 계산
+    """
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[ProgressEvent]" = queue.SimpleQueue()
+        self._stage = IDLE_STAGE
+        self._current = 0
+        self._total = 0
+        self._message = ""
+        self._stage_started = 0.0
+        self._stage_start_count = 0
+
+    # --- 작업 스레드 쪽 ---
+    def post(self, message: Optional[str] = None, stage: Optional[str] = None,
+             current: Optional[int] = None, total: Optional[int] = None):
+        self._queue.put(ProgressEvent(stage, current, total, message, time.monotonic()))
+
+    def log(self, message: str):
+        """기존 log_callback 자리에 그대로 넘길 수 있는 메시지 전용 post"""
+        self.post(message=message)
+
+    def reporter(self, stage: str) -> Callable[[int, int], None]:
+        """(current, total)만 받는 progress_callback 생성"""
+        def report(current: int, total: int):
+            self.post(stage=stage, current=current, total=total)
+        return report
+
+    def finish(self, message: Optional[str] = None):
+        """진행 막대를 비우고 마지막 메시지를 표시"""
+        self.post(message=message, stage=IDLE_STAGE)
+
+    # --- UI 스레드 쪽 ---
+    def drain(self) -> Optional[ProgressSnapshot]:
+        """쌓인 이벤트를 모두 반영하고 현재 상태 반환 (새 이벤트가 없으면 None)"""
+        changed = False
+        last_time = None
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            last_time = event.timestamp
+            if event.stage is not None and event.stage != self._stage:
+                self._stage = event.stage
+                self._current = 0
+                self._total = 0
+                self._stage_started = event.timestamp
+                self._stage_start_count = event.current or 0
+            if event.total is not None:
+                self._total = event.total
+            if event.current is not None:
+                self._current = event.current
+            if event.message is not None:
+                self._message = event.message
+        if not changed: return None
+
+        rate = eta = None
+        elapsed = last_time - self._stage_started
+        done = self._current - self._stage_start_count
+        if self._stage and elapsed > 0 and done > 0:
+            rate = done / elapsed
+            eta = max(0, self._total - self._current) / rate
+        return ProgressSnapshot(self._stage, self._current, self._total, self._message, rate, eta)
+
+
+class MainThreadQueue:
+    """작업 스레드가 UI 스레드에서 실행할 함수를 넣어 두는 큐
+
+    작업 스레드에서 widget.after()를 부르지 않도록 결과 전달용으로 사용.
+    UI 스레드가 ProgressBus와 같은 타이머에서 run_pending()으로 실행.
+    """
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+
+    # --- 작업 스레드 쪽 ---
+    def call(self, fn: Callable, *args):
+        self._queue.put((fn, args))
+
+    # --- UI 스레드 쪽 ---
+    def run_pending(self) -> int:
+        """쌓인 함수를 들어온 순서대로 실행, 실행 개수 반환 (하나가 실패해도 나머지는 실행)"""
+        count = 0
+        while True:
+            try:
+                fn, args = self._queue.get_nowait()
+            except queue.Empty:
+                return count
+            count += 1
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"UI 작업 실패 ({getattr(fn, '__name__', fn)}): {e}")
@@ -0,0 +1,195 @@
+# 파일 이름: rename_plan.py - 복사 전에 모든 파일의 새 이름을 메모리에서 확정하는 이름 변경 계획
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import name_check
+
+UNCLASSIFIED = "미분류"
+PLAN_VERSION = 1
+
+
+class RenameEntry(NamedTuple):
+    """원본 한 장의 복사 계획"""
+    original_filename: str
+    source_path: str
+    new_filename: str
+    dest_path: str
+    bird_name: str
+    datetime: Optional[datetime]
+    pyramid: Dict
+    thumbnail_path: Optional[str] = None  # 로딩 때 만든 GUI 썸네일
+
+    def to_copied_info(self) -> Dict:
+        """copy_and_rename_files가 돌려주던 복사 결과 딕셔너리 형식"""
+        return {
+            "original_path": self.source_path,
+            "new_path": self.dest_path,
+            "new_filename": self.new_filename,
+            "bird_name": self.bird_name,
+            "datetime": self.datetime,
+            "pyramid": self.pyramid or {},
+            "source_thumbnail_path": self.thumbnail_path,
+        }
+
+    def to_json(self) -> Dict:
+        return {
+            "original_filename": self.original_filename,
+            "source_path": self.source_path,
+            "new_filename": self.new_filename,
+            "dest_path": self.dest_path,
+            "bird_name": self.bird_name,
+            "datetime": self.datetime.isoformat() if self.datetime else None,
+        }
+
+
+class RenamePlan(NamedTuple):
+    """저장 한 번의 전체 계획 (entries는 복사할 파일, skipped는 (파일명, 이유))"""
+    source_folder: str
+    output_folder: str
+    entries: List[RenameEntry]
+    skipped: List[Tuple[str, str]]
+
+    def to_json(self) -> Dict:
+        return {
+            "version": PLAN_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "source_folder": self.source_folder,
+            "output_folder": self.output_folder,
+            "entry_count": len(self.entries),
+            "entries": [entry.to_json() for entry in self.entries],
+            "skipped": [{"original_filename": f, "reason": reason} for f, reason in self.skipped],
+        }
+
+    def export_json(self, path: str):
+        """복사 없이 계획만 JSON으로 저장 (dry-run)"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+
+
+class NameReserver:
+    """출력 폴더 목록 한 번 + 예약 집합으로 겹치지 않는 파일명 배정
+
+    후보마다 os.path.exists를 호출하지 않으므로 네트워크 드라이브에서도 빠름.
+    대소문자를 구분하지 않는 파일 시스템(Windows/macOS)을 고려해 casefold로 비교.
+    """
+
+    def __init__(self, existing_names: Iterable[str] = ()):
+        self._taken: Set[str] = {name.casefold() for name in existing_names}
+        self._next_suffix: Dict[str, int] = {}  # 같은 기본 이름의 다음 번호 (연사 사진이 많아도 후보를 처음부터 다시 보지 않음)
+
+    @classmethod
+    def for_folder(cls, folder: str) -> "NameReserver":
+        try:
+            return cls(os.listdir(folder))
+        except FileNotFoundError:
+            return cls()
+
+    def claim(self, filename: str):
+        """이미 정해진 이름(이전 저장에서 배정된 이름)을 그대로 예약"""
+        self._taken.add(filename.casefold())
+
+    def reserve(self, base: str, ext: str) -> str:
+        """'기본이름.확장자'가 비었으면 그대로, 아니면 '기본이름_1.확장자'부터 빈 이름 배정"""
+        candidate = f"{base}{ext}"
+        key = candidate.casefold()
+        if key in self._taken:
+            base_key = key
+            counter = self._next_suffix.get(base_key, 1)
+            while True:
+                candidate = f"{base}_{counter}{ext}"
+                key = candidate.casefold()
+                counter += 1
+                if key not in self._taken: break
+            self._next_suffix[base_key] = counter
+        self._taken.add(key)
+        return candidate
+
+
+def build_base_name(dt: Optional[datetime], kor_name_clean: str, eng_name_clean: str) -> str:
+    """'시각_국명_영명' 형식의 확장자 없는 파일명 (시각/영명은 없으면 생략)"""
+    parts = [dt.strftime("%Y%m%d_%H%M%S")] if dt else []
+    parts.append(kor_name_clean)
+    if eng_name_clean and eng_name_clean not in ["N_A", ""]:
+        parts.append(eng_name_clean)
+    return "_".join(parts)
+
+
+def build_photo_index(species_photo_map: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """원본 파일명 → 사진 정보 (종 그룹을 파일마다 다시 훑지 않도록 한 번만 생성)"""
+    return {p["original_filename"]: p for photos in species_photo_map.values() for p in photos}
+
+
+def _is_name_for(filename: str, base: str, ext: str) -> bool:
+    """filename이 '기본이름.확장자' 또는 '기본이름_번호.확장자'인지"""
+    if not filename.endswith(ext) or not filename.startswith(base): return False
+    suffix = filename[len(base):len(filename) - len(ext)]
+    return suffix == "" or (suffix.startswith("_") and suffix[1:].isdigit())
+
+
+def build_rename_plan(source_folder: str, bird_name_map: Dict[str, str],
+                      species_photo_map: Dict[str, List[Dict]], bird_info_map: Dict[str, Dict],
+                      output_folder: str, previous_names: Optional[Dict[str, str]] = None,
+                      reserved_names: Iterable[str] = ()) -> RenamePlan:
+    """모든 파일의 새 이름을 복사 전에 확정 (원본/출력 폴더 목록은 각각 한 번만 읽음)
+
+    previous_names(원본 파일명 → 이전 저장에서 배정한 새 파일명)가 있으면, 종 이름이 바뀌지 않은
+    파일은 같은 이름을 다시 사용하여 이어서 저장할 때 '_1' 중복 파일이 생기지 않도록 함.
+    reserved_names(같은 출력 폴더에 다른 원본 폴더를 저장하며 계획된 이름)는 아직 파일이 없어도 배정하지 않음.
+    """
+    previous_names = previous_names or {}
+    photo_index = build_photo_index(species_photo_map)
+    try:
+        source_names = set(os.listdir(source_folder))
+    except FileNotFoundError:
+        source_names = set()
+    reserver = NameReserver.for_folder(output_folder)
+    for name in reserved_names:
+        reserver.claim(name)
+    clean_names: Dict[str, Tuple[str, str]] = {}
+
+    planned: List[tuple] = []
+    skipped: List[Tuple[str, str]] = []
+    for original_filename, new_bird_name in bird_name_map.items():
+        if new_bird_name == UNCLASSIFIED:
+            skipped.append((original_filename, UNCLASSIFIED))
+            continue
+        # 이동 모드로 이미 옮겨진 원본은 이전 계획이 있으면 계속 포함
+        if original_filename not in source_names and original_filename not in previous_names:
+            skipped.append((original_filename, "원본 없음"))
+            continue
+
+        if new_bird_name not in clean_names:
+            info = bird_info_map.get(new_bird_name, {})
+            clean_names[new_bird_name] = (name_check.sanitize_filename(new_bird_name),
+                                          name_check.sanitize_filename(info.get("common_name", "")))
+        kor_name_clean, eng_name_clean = clean_names[new_bird_name]
+
+        photo = photo_index.get(original_filename, {})
+        dt = photo.get("datetime")
+        ext = os.path.splitext(original_filename)[1]
+        base = build_base_name(dt, kor_name_clean, eng_name_clean)
+        previous = previous_names.get(original_filename)
+        if previous and _is_name_for(previous, base, ext):
+            reserver.claim(previous)
+        else:
+            previous = None
+        planned.append((original_filename, new_bird_name, base, ext, dt, photo.get("pyramid") or {},
+                        photo.get("thumbnail_path"), previous))
+
+    # 이전 이름을 먼저 모두 예약한 뒤 나머지에 새 이름 배정
+    entries: List[RenameEntry] = []
+    for original_filename, new_bird_name, base, ext, dt, pyramid, thumbnail_path, previous in planned:
+        new_filename = previous or reserver.reserve(base, ext)
+        entries.append(RenameEntry(
+            original_filename=original_filename,
+            source_path=os.path.join(source_folder, original_filename),
+            new_filename=new_filename,
+            dest_path=os.path.join(output_folder, new_filename),
+            bird_name=new_bird_name,
+            datetime=dt,
+            pyramid=pyramid,
+            thumbnail_path=thumbnail_path,
+        ))
+    return RenamePlan(source_folder, output_folder, entries, skipped)
@@ -0,0 +1,205 @@
+# 파일 이름: save_journal.py - 복사/이름 변경 단계의 미리 쓰기 기록 (중단된 저장 이어서 하기)
+import glob
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from rename_plan import RenameEntry, RenamePlan
+
+JOURNAL_PREFIX = ".renamer_journal_"
+MTIME_TOLERANCE_NS = 2_000_000_000  # FAT/SMB는 수정 시각 정밀도가 2초
+FSYNC_INTERVAL = 1.0  # 완료 기록은 모아서 이 간격마다 디스크에 확정
+
+
+def journal_path(output_folder: str, source_folder: str) -> str:
+    """원본 폴더마다 따로 쓰는 기록 파일 경로 (같은 출력 폴더에 여러 폴더를 저장해도 섞이지 않음)"""
+    key = hashlib.blake2b(os.path.normcase(os.path.abspath(source_folder)).encode("utf-8"), digest_size=6).hexdigest()
+    return os.path.join(output_folder, f"{JOURNAL_PREFIX}{key}.jsonl")
+
+
+def _read_records(path: str):
+    """기록 파일의 JSON 줄들 (중단될 때 반쯤 쓰인 마지막 줄은 건너뜀)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        return
+
+
+class SaveJournal:
+    """저장할 파일마다 '계획'과 '완료'를 JSON 한 줄씩 덧붙여 기록
+
+    - planned: 원본 파일명, 새 파일명, 원본 크기/수정 시각 (복사 시작 전에 모두 기록)
+    - done: 전송이 끝난 파일 (검증까지 끝났으면 BLAKE2b 포함, 검증 결과는 나중에 다시 기록될 수 있음)
+    다시 저장하면 이전에 배정된 이름을 그대로 사용하고, 대상 파일의 크기+수정 시각이 원본과 같으면
+    (copystat으로 마지막에 설정되므로 끝까지 복사된 파일만 일치) 완료로 보고 건너뜀.
+    다르면 이 기록이 배정한 이름의 덜 복사된 파일이므로 지우고 다시 복사.
+    같은 출력 폴더의 다른 기록(다른 원본 폴더)이 계획한 이름은 새 이름 배정에서 제외하므로 서로 겹치지 않음.
+    """
+
+    def __init__(self, path: str, source_folder: str, planned: Dict[str, Dict], done: Dict[str, Optional[str]],
+                 foreign_names: Set[str], read_only: bool = False):
+        self.path = path
+        self.source_folder = source_folder
+        self.output_folder = os.path.dirname(path)
+        self.read_only = read_only
+        self._planned = planned
+        self._previous = dict(planned)  # 이번 저장 전에 배정되어 있던 이름 (지워도 되는 대상 판단용)
+        self._done = done
+        self._foreign = foreign_names
+        self._file = None
+        self._last_sync = 0.0
+
+    @classmethod
+    def open(cls, output_folder: str, source_folder: str, read_only: bool = False) -> "SaveJournal":
+        """기존 기록을 읽어 정리(압축)한 뒤 이어서 쓸 수 있게 엶
+
+        read_only이면 파일을 만들거나 고치지 않음 (dry-run 계획 내보내기용).
+        """
+        path = journal_path(output_folder, source_folder)
+        planned: Dict[str, Dict] = {}
+        done: Dict[str, Optional[str]] = {}  # 원본 파일명 → 검증 해시 (없으면 None)
+        for record in _read_records(path):
+            name = record.get("file")
+            if record.get("type") == "planned":
+                planned[name] = record
+                done.pop(name, None)
+            elif record.get("type") == "done" and name in planned and record.get("name") == planned[name]["name"]:
+                done[name] = record.get("blake2b") or done.get(name)
+        foreign: Set[str] = set()
+        for other in glob.glob(os.path.join(glob.escape(output_folder), f"{JOURNAL_PREFIX}*.jsonl")):
+            if os.path.normcase(other) == os.path.normcase(path): continue
+            foreign.update(r["name"] for r in _read_records(other) if r.get("type") == "planned" and r.get("name"))
+        journal = cls(path, source_folder, planned, done, foreign, read_only)
+        if not read_only:
+            os.makedirs(output_folder, exist_ok=True)
+            journal._rewrite()
+        return journal
+
+    def previous_names(self) -> Dict[str, str]:
+        """원본 파일명 → 이전에 배정된 새 파일명
+
+        다른 기록도 같은 이름을 계획한 경우(이 검사가 생기기 전의 저장)에는, 대상 파일이 없거나
+        이 기록의 완료 파일임이 확인될 때만 사용하고 아니면 새 이름을 배정받도록 제외.
+        """
+        names = {}
+        for name, record in self._planned.items():
+            if record["name"] in self._foreign:
+                dest_path = os.path.join(self.output_folder, record["name"])
+                if os.path.lexists(dest_path) and not (name in self._done and self._matches(record, dest_path)):
+                    continue
+            names[name] = record["name"]
+        return names
+
+    def reserved_names(self) -> Set[str]:
+        """같은 출력 폴더의 다른 기록이 계획한 이름 (새 이름 배정에서 제외)"""
+        return set(self._foreign)
+
+    def record_plan(self, plan: RenamePlan):
+        """복사 전에 계획을 기록 (이름이나 원본이 바뀐 항목만 새로 씀)"""
+        records = []
+        for entry in plan.entries:
+            try:
+                stat = os.stat(entry.source_path)
+            except FileNotFoundError:
+                continue  # 이동 모드로 이미 옮겨진 원본: 이전 기록 유지
+            record = {"type": "planned", "file": entry.original_filename, "name": entry.new_filename,
+                      "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            previous = self._planned.get(entry.original_filename)
+            if previous == record: continue
+            self._planned[entry.original_filename] = record
+            self._done.pop(entry.original_filename, None)
+            records.append(record)
+        self._append(records, sync=True)
+
+    def is_completed(self, entry: RenameEntry) -> bool:
+        """대상 파일이 계획 당시 원본과 크기/수정 시각까지 같은지 (파일 내용은 읽지 않음)"""
+        record = self._planned.get(entry.original_filename)
+        if record is None or record["name"] != entry.new_filename: return False
+        return self._matches(record, entry.dest_path)
+
+    @staticmethod
+    def _matches(record: Dict, dest_path: str) -> bool:
+        try:
+            stat = os.stat(dest_path)
+        except FileNotFoundError:
+            return False
+        return stat.st_size == record["size"] and abs(stat.st_mtime_ns - record["mtime_ns"]) <= MTIME_TOLERANCE_NS
+
+    def split(self, plan: RenamePlan) -> Tuple[List[int], List[int]]:
+        """(이미 완료된 항목 번호, 남은 항목 번호)
+
+        - 완료 기록 전에 중단되었어도 대상 파일이 원본과 일치하면 완료로 기록
+        - 일치하지 않는 대상 파일은, 이 기록이 이전에 배정한 이름이고 다른 기록과 겹치지 않을 때만
+          덜 복사된 파일로 보고 지움 (전송은 기존 파일을 덮어쓰지 않음)
+        """
+        completed, remaining = [], []
+        for index, entry in enumerate(plan.entries):
+            if self.is_completed(entry):
+                completed.append(index)
+                if entry.original_filename not in self._done:
+                    self.record_done(entry)
+                continue
+            remaining.append(index)
+            previous = self._previous.get(entry.original_filename)
+            if (previous is not None and previous["name"] == entry.new_filename
+                    and entry.new_filename not in self._foreign and os.path.lexists(entry.dest_path)):
+                os.remove(entry.dest_path)
+        return completed, remaining
+
+    def stored_hash(self, entry: RenameEntry) -> Optional[str]:
+        """이전 저장에서 검증하며 기록한 BLAKE2b (없으면 None: 검증 전에 중단되었으면 다시 검증 필요)"""
+        return self._done.get(entry.original_filename)
+
+    def record_done(self, entry: RenameEntry, digest: Optional[str] = None):
+        """전송 완료 기록 (검증 해시는 검증이 끝난 뒤 같은 항목으로 다시 기록)"""
+        self._done[entry.original_filename] = digest
+        self._append([self._done_record(entry.original_filename, entry.new_filename, digest)])
+
+    @staticmethod
+    def _done_record(name: str, new_filename: str, digest: Optional[str]) -> Dict:
+        record = {"type": "done", "file": name, "name": new_filename}
+        if digest: record["blake2b"] = digest
+        return record
+
+    def close(self):
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    # --- 파일 쓰기 ---
+    def _append(self, records: List[Dict], sync: bool = False):
+        if not records: return
+        if self.read_only: raise RuntimeError("읽기 전용으로 연 저장 기록입니다.")
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+        self._file.flush()
+        if sync or time.monotonic() - self._last_sync >= FSYNC_INTERVAL:
+            self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def _rewrite(self):
+        """현재 상태만 남기도록 기록 파일을 새로 씀 (저장을 반복해도 파일이 계속 커지지 않음)"""
+        if not self._planned:
+            return
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for name, record in self._planned.items():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if name in self._done:
+                    done = self._done_record(name, record["name"], self._done[name])
+                    f.write(json.dumps(done, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
@@ -0,0 +1,106 @@
+# 파일 이름: species_index.py - 조류 목록 CSV의 메모리 색인 (국명/학명/영명 즉시 조회)
+import csv
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional
+
+EMPTY_VALUES = {"", "nan", "NaN", "None"}
+
+
+class SpeciesRecord(NamedTuple):
+    """조류 목록의 한 종 (필요한 열만 담은 작은 레코드)"""
+    korean_name: str
+    common_name: str
+    scientific_name: str
+    order: str
+    family: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """name_check에서 쓰던 정보 딕셔너리 형식"""
+        return self._asdict()
+
+
+def _clean(value) -> str:
+    if value is None: return ""
+    value = str(value).strip()
+    return "" if value in EMPTY_VALUES else value
+
+
+def _normalize_latin(name: str) -> str:
+    # 학명/영명은 대소문자, 공백 차이를 무시하고 조회
+    return " ".join(name.replace("_", " ").split()).casefold()
+
+
+class SpeciesIndex:
+    """CSV를 한 번 읽어 만든 읽기 전용 색인
+
+    - 국명, 학명, 영명 각각 dict 조회 (같은 키가 여러 번 나오면 CSV의 첫 행 사용)
+    - 레코드는 불변 NamedTuple이라 여러 스레드에서 그대로 공유 가능
+    """
+
+    def __init__(self, records: Iterable[SpeciesRecord], columns: Iterable[str] = ()):
+        by_korean: Dict[str, SpeciesRecord] = {}
+        by_scientific: Dict[str, SpeciesRecord] = {}
+        by_english: Dict[str, SpeciesRecord] = {}
+        for record in records:
+            if not record.korean_name: continue
+            by_korean.setdefault(record.korean_name, record)
+            if record.scientific_name:
+                by_scientific.setdefault(_normalize_latin(record.scientific_name), record)
+            if record.common_name:
+                by_english.setdefault(_normalize_latin(record.common_name), record)
+        self._by_korean: Mapping[str, SpeciesRecord] = MappingProxyType(by_korean)
+        self._by_scientific: Mapping[str, SpeciesRecord] = MappingProxyType(by_scientific)
+        self._by_english: Mapping[str, SpeciesRecord] = MappingProxyType(by_english)
+        self.columns = frozenset(columns)
+        self.korean_names: List[str] = sorted(by_korean)
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> "SpeciesIndex":
+        """조류 목록 CSV(국명, 학명, 영명, 목, 과 열)로 색인 생성"""
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            records = [
+                SpeciesRecord(
+                    korean_name=_clean(row.get("국명")),
+                    common_name=_clean(row.get("영명")),
+                    scientific_name=_clean(row.get("학명")),
+                    order=_clean(row.get("목")),
+                    family=_clean(row.get("과")),
+                )
+                for row in reader
+            ]
+            columns = reader.fieldnames or ()
+        return cls(records, columns)
+
+    def __len__(self) -> int:
+        return len(self._by_korean)
+
+    def __contains__(self, korean_name) -> bool:
+        return korean_name in self._by_korean
+
+    def get(self, korean_name: str) -> Optional[SpeciesRecord]:
+        """국명으로 조회"""
+        if not isinstance(korean_name, str): return None
+        return self._by_korean.get(korean_name.strip())
+
+    def get_by_scientific_name(self, scientific_name: str) -> Optional[SpeciesRecord]:
+        """학명으로 조회 (대소문자 무시)"""
+        if not isinstance(scientific_name, str): return None
+        return self._by_scientific.get(_normalize_latin(scientific_name))
+
+    def get_by_english_name(self, english_name: str) -> Optional[SpeciesRecord]:
+        """영명으로 조회 (대소문자 무시)"""
+        if not isinstance(english_name, str): return None
+        return self._by_english.get(_normalize_latin(english_name))
+
+    def english_name_for(self, korean_name: str) -> str:
+        """파일명 미리보기용 영명 (없으면 빈 문자열)"""
+        record = self.get(korean_name)
+        return record.common_name if record else ""
+
+    def count_with_english_name(self) -> int:
+        return sum(1 for record in self._by_korean.values() if record.common_name)
+
+    def records(self) -> List[SpeciesRecord]:
+        """색인된 모든 종 (CSV 순서)"""
+        return list(self._by_korean.values())
@@ -0,0 +1,167 @@
+# 파일 이름: species_list.py - 보이는 줄만 버튼을 만드는 가상화 종 목록 (필터/정렬)
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import customtkinter
+
+from photo_grid import bind_mouse_wheel
+
+ROW_HEIGHT = 34  # 버튼 높이 + 여백
+SORT_BY_NAME = "이름"
+SORT_BY_COUNT = "사진 수"
+SORT_BY_TAXONOMY = "분류"
+SORT_OPTIONS = [SORT_BY_NAME, SORT_BY_COUNT, SORT_BY_TAXONOMY]
+
+
+class SpeciesRow(NamedTuple):
+    species_name: str
+    count: int
+    suggested_name: Optional[str] = None  # 값이 있으면 '제안 적용' 줄
+
+
+def sort_species_names(names: Iterable[str], sort_by: str, counts: Dict[str, int],
+                       taxonomy: Callable[[str], tuple]) -> List[str]:
+    """종 이름 정렬: 이름순, 사진 많은 순, 분류(목 → 과 → 이름)순"""
+    if sort_by == SORT_BY_COUNT:
+        return sorted(names, key=lambda n: (-counts.get(n, 0), n))
+    if sort_by == SORT_BY_TAXONOMY:
+        def taxonomy_key(name):
+            order, family = taxonomy(name)
+            # 목/과를 모르는 종은 각 단계에서 뒤로
+            return (not order, order, not family, family, name)
+        return sorted(names, key=taxonomy_key)
+    return sorted(names)
+
+
+class VirtualSpeciesList(customtkinter.CTkFrame):
+    """종 수와 관계없이 화면에 보이는 줄만큼의 버튼만 만들어 재사용하는 종 목록
+
+    줄은 SpeciesRow 목록으로 받으며, 제안 줄(suggested_name이 있는 줄)은 들여쓰기된 테두리 버튼으로 표시.
+    """
+
+    def __init__(self, master, on_select: Callable[[str], None],
+                 on_accept_suggestion: Callable[[str, str], None], **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self._on_select = on_select
+        self._on_accept_suggestion = on_accept_suggestion
+        self._rows: List[SpeciesRow] = []
+        self._first = 0
+        self._selected: Optional[str] = None
+        self._buttons: List[customtkinter.CTkButton] = []
+        self._button_rows: List[Optional[SpeciesRow]] = []
+        self._button_styles: List[Optional[tuple]] = []
+        self._render_after_id = None
+
+        theme = customtkinter.ThemeManager.theme["CTkButton"]
+        self._styles = {
+            "species": {"fg_color": theme["fg_color"], "border_width": 0, "anchor": "center"},
+            "selected": {"fg_color": theme["hover_color"], "border_width": 0, "anchor": "center"},
+            "suggestion": {"fg_color": "transparent", "border_width": 1, "anchor": "w"},
+        }
+
+        self._body = customtkinter.CTkFrame(self, fg_color="transparent")
+        self._body.pack(side="left", fill="both", expand=True)
+        self._body.grid_columnconfigure(0, weight=1)
+        self._scrollbar = customtkinter.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+        bind_mouse_wheel(self._body, self._on_wheel)
+        self.bind("<Configure>", lambda e: self._schedule_render())
+
+    # --- 공개 API ---
+    def set_rows(self, rows: List[SpeciesRow], keep_position: bool = True):
+        self._rows = rows
+        if not keep_position:
+            self._first = 0
+        self._first = max(0, min(self._first, len(rows) - self._visible_count()))
+        self._schedule_render()
+
+    def set_selected(self, species_name: Optional[str]):
+        self._selected = species_name
+        self._schedule_render()
+
+    def neighbors(self, species_name: str) -> List[str]:
+        """현재 표시 순서(필터/정렬 반영)에서 바로 아래/위 종 이름 (제안 줄은 건너뜀)"""
+        names = [row.species_name for row in self._rows if not row.suggested_name]
+        try:
+            i = names.index(species_name)
+        except ValueError:
+            return []
+        return [names[j] for j in (i + 1, i - 1) if 0 <= j < len(names)]
+
+    # --- 배치/스크롤 ---
+    def _visible_count(self) -> int:
+        height = self.winfo_height()
+        return max(1, height // ROW_HEIGHT) if height > 1 else 20
+
+    def _schedule_render(self):
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render)
+
+    def _scroll_to(self, first: int):
+        first = max(0, min(first, len(self._rows) - self._visible_count()))
+        if first != self._first:
+            self._first = first
+            self._schedule_render()
+
+    def _on_scrollbar(self, *args):
+        if not args: return
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self._rows)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible_count() if args[2] == "pages" else 1)
+            self._scroll_to(self._first + step)
+
+    def _on_wheel(self, event):
+        step = -3 if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0 else 3
+        self._scroll_to(self._first + step)
+        return "break"
+
+    def _ensure_buttons(self, count: int):
+        while len(self._buttons) < count:
+            i = len(self._buttons)
+            btn = customtkinter.CTkButton(self._body, text="", height=28, command=lambda i=i: self._on_click(i))
+            btn.grid(row=i, column=0, sticky="ew", padx=5, pady=2)
+            btn.grid_remove()  # 배치 옵션만 기억해 두고, 줄이 배정될 때 _render에서 표시
+            bind_mouse_wheel(btn, self._on_wheel)
+            self._buttons.append(btn)
+            self._button_rows.append(None)
+            self._button_styles.append(None)
+
+    def _render(self):
+        self._render_after_id = None
+        if not self.winfo_exists(): return
+        visible = self._visible_count()
+        self._ensure_buttons(visible + 1)
+        for i, btn in enumerate(self._buttons):
+            index = self._first + i
+            row = self._rows[index] if index < len(self._rows) else None
+            if row is None:
+                if self._button_rows[i] is not None:
+                    btn.grid_remove()
+                    self._button_rows[i] = None
+                continue
+            if self._button_rows[i] is None:
+                btn.grid()
+            self._button_rows[i] = row
+
+            if row.suggested_name:
+                style = "suggestion"
+                text = f"  ↳ '{row.suggested_name}'(으)로 변경 ({row.count}장)"
+            else:
+                style = "selected" if row.species_name == self._selected else "species"
+                text = f"{row.species_name} ({row.count})"
+            # 글자/모양이 바뀐 버튼만 다시 그림
+            if self._button_styles[i] != (style, text):
+                btn.configure(text=text, **self._styles[style])
+                btn.grid_configure(padx=(20, 5) if style == "suggestion" else 5)
+                self._button_styles[i] = (style, text)
+
+        total = max(1, len(self._rows))
+        self._scrollbar.set(self._first / total, min(1.0, (self._first + visible) / total))
+
+    def _on_click(self, i: int):
+        row = self._button_rows[i]
+        if row is None: return
+        if row.suggested_name:
+            self._on_accept_suggestion(row.species_name, row.suggested_name)
+        else:
+            self._on_select(row.species_name)
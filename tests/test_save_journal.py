@@ -0,0 +1,162 @@
+# 파일 이름: tests/test_save_journal.py - 중단된 저장 이어서 하기 (저장 기록) 테스트
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from rename_plan import build_rename_plan
+from save_journal import SaveJournal
+from thumbnailing import copy_and_rename_files
+
+SPECIES = "흑기러기"
+BIRD_INFO = {SPECIES: {"common_name": "Brant"}}
+SHOT_TIME = datetime(2024, 5, 1, 10, 11, 12)
+
+
+class Interrupted(Exception):
+    pass
+
+
+def make_source(folder, count, size=4096):
+    """같은 시각에 찍은 같은 종 사진 count장 (모두 같은 기본 이름 → '_N' 번호가 붙음)"""
+    os.makedirs(folder)
+    for i in range(count):
+        with open(os.path.join(folder, f"IMG_{i:04d}.jpg"), "wb") as f:
+            f.write(bytes([i % 251]) * (size + i))
+    names = sorted(os.listdir(folder))
+    bird_name_map = {name: SPECIES for name in names}
+    species_photo_map = {SPECIES: [{"original_filename": name, "datetime": SHOT_TIME} for name in names]}
+    return bird_name_map, species_photo_map
+
+
+def output_files(folder):
+    return sorted(f for f in os.listdir(folder) if not f.startswith("."))
+
+
+def save(source, maps, output, **kwargs):
+    return copy_and_rename_files(source, maps[0], maps[1], BIRD_INFO, output, **kwargs)
+
+
+def interrupt_after(count):
+    def progress(current, total):
+        if current >= count: raise Interrupted()
+    return progress
+
+
+def test_resume_after_cancel_keeps_names(tmp_path):
+    source, output = str(tmp_path / "src"), str(tmp_path / "out")
+    maps = make_source(source, 40)
+    with pytest.raises(Interrupted):
+        save(source, maps, output, progress_callback=interrupt_after(15))
+
+    copied = save(source, maps, output)
+    assert len(copied) == 40
+    assert len(output_files(output)) == 40
+    # 다시 저장해도 아무것도 복사하지 않고 같은 이름 유지
+    assert sorted(c["new_filename"] for c in save(source, maps, output)) == output_files(output)
+
+
+def test_resume_after_crash_replaces_partial_file(tmp_path):
+    source, output = str(tmp_path / "src"), str(tmp_path / "out")
+    maps = make_source(source, 5)
+    # 계획만 기록된 상태에서 첫 파일을 쓰다가 멈춘 상황
+    journal = SaveJournal.open(output, source)
+    plan = build_rename_plan(source, maps[0], maps[1], BIRD_INFO, output, journal.previous_names())
+    journal.record_plan(plan)
+    journal.close()
+    partial = plan.entries[0]
+    with open(partial.dest_path, "wb") as f:
+        f.write(b"\0" * 500)
+
+    copied = save(source, maps, output)
+    assert len(output_files(output)) == 5
+    by_source = {c["original_path"]: c["new_filename"] for c in copied}
+    assert by_source[partial.source_path] == partial.new_filename
+    with open(partial.source_path, "rb") as a, open(partial.dest_path, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_finished_copy_without_done_record_is_not_copied_again(tmp_path):
+    source, output = str(tmp_path / "src"), str(tmp_path / "out")
+    maps = make_source(source, 3)
+    save(source, maps, output)
+    # 완료 기록만 사라진 상황 (기록 전에 중단)
+    journal_file = next(os.path.join(output, f) for f in os.listdir(output) if f.startswith("."))
+    with open(journal_file, encoding="utf-8") as f:
+        planned_only = [line for line in f if '"planned"' in line]
+    with open(journal_file, "w", encoding="utf-8") as f:
+        f.writelines(planned_only)
+    before = {f: os.stat(os.path.join(output, f)).st_ino for f in output_files(output)}
+
+    save(source, maps, output)
+    assert {f: os.stat(os.path.join(output, f)).st_ino for f in output_files(output)} == before
+
+
+def test_other_source_folder_never_gets_a_planned_name(tmp_path):
+    output = str(tmp_path / "out")
+    source_a, source_b = str(tmp_path / "a"), str(tmp_path / "b")
+    maps_a = make_source(source_a, 1, size=1000)
+    maps_b = make_source(source_b, 1, size=2000)
+    # A는 계획만 하고 중단, 그사이 B가 같은 출력 폴더에 저장
+    journal = SaveJournal.open(output, source_a)
+    journal.record_plan(build_rename_plan(source_a, maps_a[0], maps_a[1], BIRD_INFO, output))
+    journal.close()
+    copied_b = save(source_b, maps_b, output)
+    copied_a = save(source_a, maps_a, output)
+    assert copied_a[0]["new_filename"] != copied_b[0]["new_filename"]
+    for copied, size in ((copied_a, 1000), (copied_b, 2000)):
+        assert os.path.getsize(copied[0]["new_path"]) == size
+    # 다시 저장해도 서로의 파일을 건드리지 않음
+    save(source_b, maps_b, output)
+    save(source_a, maps_a, output)
+    assert len(output_files(output)) == 2
+    assert os.path.getsize(copied_b[0]["new_path"]) == 2000
+
+
+def test_resume_after_cancel_during_verification(tmp_path, monkeypatch):
+    import copy_engine
+    source, output = str(tmp_path / "src"), str(tmp_path / "out")
+    maps = make_source(source, 12)
+    real_hash = copy_engine.hash_file
+
+    def slow_hash(path, *args):
+        time.sleep(0.05)
+        return real_hash(path, *args)
+
+    monkeypatch.setattr(copy_engine, "hash_file", slow_hash)
+    with pytest.raises(Interrupted):
+        save(source, maps, output, verify=True, progress_callback=interrupt_after(2))
+    monkeypatch.setattr(copy_engine, "hash_file", real_hash)
+    copied_before = {f: os.stat(os.path.join(output, f)).st_ino for f in output_files(output)}
+    assert len(copied_before) > 2  # 복사는 끝났지만 검증 전에 취소된 파일이 있음
+    # 검증 전에 취소된 파일도 전송 완료는 기록되어 있음
+    journal_file = next(os.path.join(output, f) for f in os.listdir(output) if f.startswith("."))
+    with open(journal_file, encoding="utf-8") as f:
+        done_names = {json.loads(line)["name"] for line in f if '"done"' in line}
+    assert done_names == set(copied_before)
+
+    copied = save(source, maps, output, verify=True)
+    assert len(copied) == 12 and len(output_files(output)) == 12
+    assert all(c.get("blake2b") for c in copied)
+    # 취소 전에 복사된 파일은 다시 복사하지 않고 검증만 함
+    for name, inode in copied_before.items():
+        assert os.stat(os.path.join(output, name)).st_ino == inode
+
+
+def test_dry_run_plan_matches_resumed_save(tmp_path):
+    source, output = str(tmp_path / "src"), str(tmp_path / "out")
+    maps = make_source(source, 6)
+    with pytest.raises(Interrupted):
+        save(source, maps, output, progress_callback=interrupt_after(2))
+    journal_files = sorted(os.listdir(output))
+
+    journal = SaveJournal.open(output, source, read_only=True)
+    preview = build_rename_plan(source, maps[0], maps[1], BIRD_INFO, output,
+                                previous_names=journal.previous_names(), reserved_names=journal.reserved_names())
+    assert sorted(os.listdir(output)) == journal_files  # 읽기 전용: 기록을 고치지 않음
+
+    copied = save(source, maps, output)
+    assert ({e.source_path: e.new_filename for e in preview.entries}
+            == {c["original_path"]: c["new_filename"] for c in copied})
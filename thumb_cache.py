@@ -0,0 +1,223 @@
+# 파일 이름: thumb_cache.py - 내용 기반 공용 썸네일 캐시 (LRU, 다중 프로세스 안전)
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Optional, Tuple
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2GB
+FINGERPRINT_EDGE_BYTES = 64 * 1024  # 지문에 쓰는 파일 앞/뒤 부분 크기
+FINGERPRINT_VERSION = 2  # 지문 계산 방식이 바뀌면 올림 (색인을 비움)
+EVICT_CHECK_INTERVAL = 50  # put() 몇 번마다 용량 확인할지
+TOUCH_INTERVAL_SEC = 60  # 같은 항목의 접근 시간 갱신 최소 간격 (DB 쓰기 줄이기)
+EVICT_GRACE_SEC = 6 * 3600  # 최근에 조회된 항목은 지우지 않음 (get()이 돌려준 경로를 다른 프로세스가 쓰는 중일 수 있음)
+
+
+def get_default_cache_dir() -> str:
+    """OS별 기본 캐시 폴더"""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "BirdRenamer", "thumb_cache")
+    return os.path.join(os.path.expanduser("~"), ".cache", "bird_renamer", "thumbnails")
+
+
+class ThumbnailCache:
+    """파일 내용 지문 + 크기 + 품질 단계를 키로 하는 디스크 썸네일 캐시
+
+    - 키: (크기, 수정 시각, 앞 64KB, 뒤 64KB)의 BLAKE2b 지문. 수정 시각을 보존하는 복사(copy2)라면 다른 폴더의
+      같은 사진도 같은 키이고, 편집하면 수정 시각이 바뀌어 다른 키. 내장 미리보기만 읽는 로딩에서
+      원본 전체를 읽지 않도록 전체 해시는 하지 않음 (내용 검증은 copy_engine의 검증 모드가 담당)
+    - (장치, inode) → (크기, 수정시각, 지문) 색인을 두어 재방문 시에는 stat 한 번으로 키 계산
+      (파일마다 한 줄만 유지하고, 썸네일이 모두 삭제된 지문의 줄은 evict()에서 정리)
+    - 썸네일 파일은 임시 파일 작성 후 os.replace로 원자적으로 등록
+    - evict()는 최근 EVICT_GRACE_SEC 안에 조회된 항목은 지우지 않음 (용량 상한은 잠시 넘을 수 있음)
+    - 색인은 WAL 모드 SQLite라 여러 작업자 프로세스가 동시에 읽고 써도 안전
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.max_bytes = max_bytes
+        self.db_path = os.path.join(self.cache_dir, "index.sqlite3")
+        self._local = threading.local()
+        self._puts_since_check = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._init_db()
+
+    # 프로세스 풀로 넘길 때는 설정값만 전달하고, 작업자 프로세스에서는 공용 인스턴스를 재사용
+    def __reduce__(self):
+        return (get_shared_cache, (self.cache_dir, self.max_bytes))
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, bytes INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+            # 이전 버전의 지문 색인은 버림 (그 키의 썸네일은 LRU로 정리됨)
+            conn.execute("DROP TABLE IF EXISTS fingerprints")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < FINGERPRINT_VERSION:
+                conn.execute("DROP TABLE IF EXISTS file_fingerprints")
+                conn.execute(f"PRAGMA user_version = {FINGERPRINT_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_fingerprints ("
+                " dev INTEGER NOT NULL, ino INTEGER NOT NULL, size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL, fingerprint TEXT NOT NULL, PRIMARY KEY (dev, ino))"
+            )
+
+    # --- 키 계산 ---
+    def fingerprint(self, image_path: str) -> str:
+        """파일 지문 (색인의 크기/수정 시각이 지금과 같으면 파일을 읽지 않음, 아니면 앞/뒤 64KB만 읽음)"""
+        st = os.stat(image_path)
+        # inode가 없는 파일 시스템(일부 네트워크 드라이브)은 색인하지 않고 매번 계산
+        indexed = st.st_ino != 0
+        if indexed:
+            row = self._conn().execute(
+                "SELECT fingerprint FROM file_fingerprints WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+                (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns),
+            ).fetchone()
+            if row:
+                return row[0]
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        with open(image_path, "rb") as f:
+            h.update(f.read(FINGERPRINT_EDGE_BYTES))
+            if st.st_size > 2 * FINGERPRINT_EDGE_BYTES:
+                f.seek(-FINGERPRINT_EDGE_BYTES, os.SEEK_END)
+                h.update(f.read())
+        fp = h.hexdigest()
+        if indexed:
+            # 같은 파일의 이전 줄(수정 전 내용)은 덮어씀
+            with self._conn() as conn:
+                conn.execute("INSERT OR REPLACE INTO file_fingerprints VALUES (?, ?, ?, ?, ?)",
+                             (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, fp))
+        return fp
+
+    @staticmethod
+    def make_key(fingerprint: str, size: Tuple[int, int], tier: str) -> str:
+        return f"{fingerprint}_{size[0]}x{size[1]}_{tier}"
+
+    def key_for(self, image_path: str, size: Tuple[int, int], tier: str) -> str:
+        """원본 이미지 + 썸네일 크기 + 품질 단계에 대한 캐시 키"""
+        return self.make_key(self.fingerprint(image_path), size, tier)
+
+    def path_for_key(self, key: str) -> str:
+        # 한 폴더에 파일이 몰리지 않도록 앞 2글자로 분산
+        return os.path.join(self.cache_dir, key[:2], f"{key}.jpg")
+
+    def temp_path_for_key(self, key: str) -> str:
+        """put() 전에 썸네일을 써 둘 작업자별 임시 경로"""
+        path = self.path_for_key(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    # --- 조회/등록 ---
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 썸네일 경로 (없으면 None), 접근 시간 갱신"""
+        path = self.path_for_key(key)
+        if not os.path.exists(path):
+            return None
+        now = time.time()
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ? AND last_access < ?",
+                    (now, key, now - TOUCH_INTERVAL_SEC),
+                )
+        except sqlite3.Error:
+            pass
+        return path
+
+    def put(self, key: str, temp_path: str) -> str:
+        """임시 파일을 캐시에 원자적으로 등록하고 최종 경로 반환"""
+        path = self.path_for_key(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temp_path, path)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (key, os.path.getsize(path), time.time()),
+            )
+        self._puts_since_check += 1
+        if self._puts_since_check >= EVICT_CHECK_INTERVAL:
+            self.evict()
+        return path
+
+    def total_bytes(self) -> int:
+        row = self._conn().execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+        return int(row[0])
+
+    def evict(self) -> int:
+        """용량 상한을 넘으면 오래 안 쓴 항목부터 상한의 90%까지 삭제, 삭제 개수 반환
+
+        최근 EVICT_GRACE_SEC 안에 조회/등록된 항목은 다른 프로세스가 그 경로를 쓰고 있을 수 있어 남겨 둠.
+        """
+        self._puts_since_check = 0
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT key, bytes FROM entries WHERE last_access < ? ORDER BY last_access ASC",
+            (time.time() - EVICT_GRACE_SEC,),
+        ).fetchall()
+        with conn:
+            for key, nbytes in rows:
+                if total <= target:
+                    break
+                try:
+                    os.remove(self.path_for_key(key))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue  # 다른 프로세스가 열어 둔 파일 (Windows)
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= nbytes
+                removed += 1
+        if removed:
+            self.prune_fingerprints()
+        return removed
+
+    def prune_fingerprints(self) -> int:
+        """캐시에 썸네일이 하나도 남지 않은 지문의 색인 줄 삭제, 삭제 개수 반환"""
+        # 키는 '지문_크기_단계'이므로 '지문_' 이상 '지문`' 미만 범위가 그 지문의 항목 ('`'는 '_' 다음 문자)
+        with self._conn() as conn:
+            cursor = conn.execute(
+                "DELETE FROM file_fingerprints WHERE NOT EXISTS ("
+                " SELECT 1 FROM entries WHERE key >= file_fingerprints.fingerprint || '_'"
+                " AND key < file_fingerprints.fingerprint || '`')"
+            )
+            return cursor.rowcount
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> ThumbnailCache:
+    """프로세스당 하나의 캐시 인스턴스 (같은 설정이면 재사용)"""
+    key = (cache_dir or get_default_cache_dir(), max_bytes)
+    with _shared_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = ThumbnailCache(*key)
+        return _shared_caches[key]
@@ -1,144 +1,462 @@
 # 파일 이름: thumbnailing.py (파일명 생성 로직 및 썸네일 처리 개선)
+import io
+import math
 import os
 import shutil
 import re
-from typing import Dict, List
-from PIL import Image
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from PIL import Image, ExifTags
 from datetime import datetime
 import name_check # sanitize_filename 함수 사용을 위해 임포트
+from rename_plan import RenamePlan, build_rename_plan
+from copy_engine import CopyEngine, CopyResult, format_rate, summarize
+from save_journal import SaveJournal
+
+# EXIF 태그 번호
+EXIF_ORIENTATION = 274
+EXIF_DATETIME = 306
+EXIF_DATETIME_ORIGINAL = 36867
+EXIF_IFD_POINTER = 0x8769
+EXIF_THUMB_OFFSET = 513  # JPEGInterchangeFormat
+EXIF_THUMB_LENGTH = 514  # JPEGInterchangeFormatLength
+
+# orientation 값별 회전/반전 방법
+_ORIENTATION_TRANSPOSE = {
+    2: [Image.Transpose.FLIP_LEFT_RIGHT],
+    3: [Image.Transpose.ROTATE_180],
+    4: [Image.Transpose.FLIP_TOP_BOTTOM],
+    5: [Image.Transpose.TRANSPOSE],
+    6: [Image.Transpose.ROTATE_270],
+    7: [Image.Transpose.TRANSVERSE],
+    8: [Image.Transpose.ROTATE_90],
+}
+
+# 썸네일 품질 단계: GUI 미리보기 / HTML 리포트 / Word(인쇄용) 리포트
+TIER_FAST_PREVIEW = "fast_preview"
+TIER_BALANCED = "balanced"
+TIER_PRINT = "print"
+
+# draft_margin: 목표 크기의 몇 배 이상으로 축소 디코딩할지 (None이면 전체 해상도 디코딩)
+# reducing_gap: resize() 전에 reduce()로 정수배 축소할 여유 (None이면 정확한 리샘플링만)
+QUALITY_TIERS = {
+    TIER_FAST_PREVIEW: {"draft_margin": 1, "reducing_gap": 2.0,
+                        "resample": Image.Resampling.BILINEAR, "jpeg_quality": 80},
+    TIER_BALANCED: {"draft_margin": 2, "reducing_gap": 3.0,
+                    "resample": Image.Resampling.LANCZOS, "jpeg_quality": 85},
+    TIER_PRINT: {"draft_margin": 4, "reducing_gap": None,
+                 "resample": Image.Resampling.LANCZOS, "jpeg_quality": 92},
+}
+
+# 썸네일 피라미드: (한 변 크기, 품질 단계)
+# 200: GUI 격자, 150/250/400: HTML 리포트 small/medium/large, 300: Word 리포트
+GUI_THUMBNAIL_SIZE = 200
+PYRAMID_LEVELS = [
+    (150, TIER_BALANCED),
+    (GUI_THUMBNAIL_SIZE, TIER_FAST_PREVIEW),
+    (250, TIER_BALANCED),
+    (300, TIER_PRINT),
+    (400, TIER_BALANCED),
+]
+PYRAMID_DRAFT_MARGIN = 2  # 가장 큰 단계의 2배 이상 해상도로 한 번만 디코딩
+
+def _parse_datetime(ds) -> datetime | None:
+    try:
+        return datetime.strptime(ds.strip("\x00 "), "%Y:%m:%d %H:%M:%S") if ds else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def read_exif_info(img: Image.Image) -> Dict:
+    """EXIF를 한 번만 파싱하여 방향(orientation)과 촬영 시간을 함께 반환"""
+    info = {"orientation": 1, "datetime": None}
+    try:
+        exif = img.getexif()
+    except Exception:
+        return info
+    if not exif: return info
+    try:
+        info["orientation"] = int(exif.get(EXIF_ORIENTATION, 1) or 1)
+    except (TypeError, ValueError):
+        pass
+    try:
+        ds = exif.get_ifd(EXIF_IFD_POINTER).get(EXIF_DATETIME_ORIGINAL)
+    except Exception:
+        ds = None
+    info["datetime"] = _parse_datetime(ds) or _parse_datetime(exif.get(EXIF_DATETIME))
+    return info
 
 def get_photo_datetime(img: Image.Image) -> datetime | None:
     """EXIF에서 촬영 시간 추출"""
+    return read_exif_info(img)["datetime"]
+
+def apply_orientation(img: Image.Image, orientation: int) -> Image.Image:
+    """EXIF orientation 값에 맞게 이미지 회전"""
+    for method in _ORIENTATION_TRANSPOSE.get(orientation, []):
+        img = img.transpose(method)
+    return img
+
+def _is_usable_preview(preview_size: tuple, main_size: tuple, min_side: int) -> bool:
+    """미리보기 이미지가 썸네일 원본으로 쓸 만한지 (충분한 크기 + 같은 가로세로비)"""
+    pw, ph = preview_size
+    mw, mh = main_size
+    if not pw or not ph or not mw or not mh: return False
+    if min(pw, ph) < min_side or pw >= mw: return False
+    # 레터박스(검은 띠)가 들어간 미리보기는 비율이 달라지므로 제외
+    return abs(pw / ph - mw / mh) < 0.01
+
+def _find_embedded_preview(img: Image.Image, min_side: int) -> Optional[Image.Image]:
+    """JPEG/TIFF에 내장된 미리보기 중 min_side 이상인 가장 작은 것을 반환"""
+    main_size = img.size
+
+    # 1) EXIF IFD1 JPEG 썸네일
     try:
-        exif = img._getexif()
-        if not exif: return None
-        ds = exif.get(36867) or exif.get(306)
-        return datetime.strptime(ds, "%Y:%m:%d %H:%M:%S") if ds else None
-    except (AttributeError, KeyError, IndexError, TypeError):
-        return None
+        ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+        offset, length = ifd1.get(EXIF_THUMB_OFFSET), ifd1.get(EXIF_THUMB_LENGTH)
+        raw = img.info.get("exif")
+        if offset and length and raw:
+            # JPEG APP1의 'Exif\0\0' 헤더 뒤부터 TIFF 헤더 기준 오프셋
+            start = offset + (6 if raw.startswith(b"Exif\x00\x00") else 0)
+            preview = Image.open(io.BytesIO(raw[start:start + length]))
+            if _is_usable_preview(preview.size, main_size, min_side):
+                preview.load()
+                return preview
+    except Exception:
+        pass
 
-def create_single_thumbnail(image_path: str, thumbnail_path: str, size: tuple = (200, 200)) -> bool:
+    # 2) MPO(카메라 JPEG의 큰 미리보기) / 다중 페이지 TIFF의 축소 프레임
+    n_frames = getattr(img, "n_frames", 1)
+    if n_frames <= 1: return None
+    best = None
+    try:
+        for frame in range(1, n_frames):
+            img.seek(frame)
+            if _is_usable_preview(img.size, main_size, min_side):
+                if best is None or img.size[0] < best[1][0]:
+                    best = (frame, img.size)
+        if best is not None:
+            img.seek(best[0])
+            return img.copy()
+    except Exception:
+        pass
+    finally:
+        try: img.seek(0)
+        except Exception: pass
+    return None
+
+def _decode_square(img: Image.Image, orientation: int, target: int, draft_margin) -> Image.Image:
+    """축소 디코딩 + 방향 보정 + RGB 변환 + 중앙 정사각형 크롭 (리사이즈 전 단계)"""
+    # JPEG는 디코딩 전에 draft()로 DCT 단계에서 1/2~1/8 축소 디코딩
+    if draft_margin:
+        width, height = img.size
+        scale = target * draft_margin / min(width, height)
+        if scale < 1:
+            try:
+                img.draft("RGB", (math.ceil(width * scale), math.ceil(height * scale)))
+            except Exception:
+                pass
+
+    img = apply_orientation(img, orientation)
+    
+    # RGB 변환
+    if img.mode != 'RGB': img = img.convert('RGB')
+    
+    # 정사각형으로 크롭
+    width, height = img.size
+    size_crop = min(width, height)
+    left = (width - size_crop) // 2
+    top = (height - size_crop) // 2
+    right = left + size_crop
+    bottom = top + size_crop
+    return img.crop((left, top, right, bottom))
+
+def _resize_square(img_cropped: Image.Image, size: tuple, tier: str, upscale: bool = True) -> Image.Image:
+    settings = QUALITY_TIERS.get(tier, QUALITY_TIERS[TIER_BALANCED])
+    if not upscale and img_cropped.size[0] < max(size):
+        size = img_cropped.size
+    # 리사이즈 (reducing_gap: 정수배 reduce() 후 마무리 리샘플링)
+    return img_cropped.resize(size, settings["resample"], reducing_gap=settings["reducing_gap"])
+
+def render_square_image(img: Image.Image, orientation: int, size: tuple,
+                        tier: str = TIER_BALANCED, upscale: bool = True) -> Image.Image:
+    """방향 보정 후 중앙 정사각형 크롭 및 리사이즈 (품질 단계별 축소 디코딩 사용)"""
+    settings = QUALITY_TIERS.get(tier, QUALITY_TIERS[TIER_BALANCED])
+    img_cropped = _decode_square(img, orientation, max(size), settings["draft_margin"])
+    return _resize_square(img_cropped, size, tier, upscale)
+
+def build_thumbnail_pyramid(img: Image.Image, orientation: int,
+                            levels: List[Tuple[int, str]] = PYRAMID_LEVELS) -> Dict[int, Image.Image]:
+    """한 번의 디코딩으로 여러 크기의 정사각형 썸네일 생성 {크기: 이미지}"""
+    largest = max(side for side, _ in levels)
+    base = _decode_square(img, orientation, largest, PYRAMID_DRAFT_MARGIN)
+    pyramid = {}
+    # 큰 단계부터 만들어 두면 작은 단계는 reducing_gap 덕분에 빠르게 축소됨
+    for side, tier in sorted(levels, reverse=True):
+        pyramid[side] = _resize_square(base, (side, side), tier)
+    return pyramid
+
+def pick_pyramid_level(pyramid: Optional[Dict[int, str]], side: int) -> Optional[str]:
+    """요청 크기 이상인 가장 작은 단계(없으면 가장 큰 단계)의 썸네일 경로"""
+    if not pyramid: return None
+    available = sorted(s for s, path in pyramid.items() if path and os.path.exists(path))
+    if not available: return None
+    for s in available:
+        if s >= side: return pyramid[s]
+    return pyramid[available[-1]]
+
+def extract_photo_data(image_path: str, thumbnail_path: Optional[str] = None, size: tuple = (200, 200),
+                       tier: str = TIER_FAST_PREVIEW) -> Dict:
+    """파일을 한 번만 열어 방향, 촬영 시간, 크기, 썸네일을 함께 추출
+
+    thumbnail_path가 None이면 헤더/EXIF만 읽고 픽셀은 디코딩하지 않음.
+    충분히 큰 내장 미리보기가 있으면 전체 해상도 대신 그것으로 썸네일 생성.
+    """
+    result = {"orientation": 1, "datetime": None, "width": None, "height": None,
+              "thumbnail_path": thumbnail_path, "thumbnail_ok": False, "thumbnail_source": None}
+    try:
+        with Image.open(image_path) as img:
+            result.update(read_exif_info(img))
+            width, height = img.size
+            if result["orientation"] in (5, 6, 7, 8): width, height = height, width
+            result["width"], result["height"] = width, height
+
+            if thumbnail_path:
+                preview = _find_embedded_preview(img, max(size))
+                source = preview if preview is not None else img
+                thumb = render_square_image(source, result["orientation"], size, tier)
+                os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+                thumb.save(thumbnail_path, "JPEG", quality=QUALITY_TIERS[tier]["jpeg_quality"])
+                result["thumbnail_ok"] = True
+                result["thumbnail_source"] = "preview" if preview is not None else "full"
+    except Exception as e:
+        print(f"사진 정보 추출 실패 ({image_path}): {e}")
+    return result
+
+def create_single_thumbnail(image_path: str, thumbnail_path: str, size: tuple = (200, 200),
+                            tier: str = TIER_FAST_PREVIEW) -> bool:
     """단일 이미지의 썸네일 생성 - 정사각형 크롭 버전"""
+    return extract_photo_data(image_path, thumbnail_path, size, tier)["thumbnail_ok"]
+
+def extract_photo_data_cached(cache, image_path: str,
+                              levels: List[Tuple[int, str]] = PYRAMID_LEVELS) -> Dict:
+    """공용 캐시를 거쳐 사진 정보와 썸네일 피라미드 추출
+
+    모든 단계가 캐시에 있으면 EXIF만 읽고, 하나라도 없으면 원본을 한 번만 디코딩해
+    빠진 단계를 모두 만들어 등록함. 결과의 "pyramid"는 {크기: 캐시 경로}.
+    """
+    try:
+        fingerprint = cache.fingerprint(image_path)
+    except OSError as e:
+        print(f"썸네일 캐시 키 계산 실패 ({image_path}): {e}")
+        data = extract_photo_data(image_path, None)
+        data["pyramid"] = {}
+        return data
+
+    keys = {side: cache.make_key(fingerprint, (side, side), tier) for side, tier in levels}
+    pyramid = {side: cache.get(key) for side, key in keys.items()}
+    missing = [(side, tier) for side, tier in levels if not pyramid[side]]
+
+    result = {"orientation": 1, "datetime": None, "width": None, "height": None,
+              "thumbnail_path": None, "thumbnail_ok": False, "thumbnail_source": "cache" if not missing else None}
     try:
         with Image.open(image_path) as img:
-            # EXIF orientation 처리
-            if hasattr(img, '_getexif'):
-                exif = img._getexif()
-                if exif and 274 in exif:
-                    orientation = exif[274]
-                    if orientation == 3: img = img.rotate(180, expand=True)
-                    elif orientation == 6: img = img.rotate(270, expand=True)
-                    elif orientation == 8: img = img.rotate(90, expand=True)
-            
-            # RGB 변환
-            if img.mode != 'RGB': img = img.convert('RGB')
-            
-            # 정사각형으로 크롭
+            result.update(read_exif_info(img))
             width, height = img.size
-            size_crop = min(width, height)
-            left = (width - size_crop) // 2
-            top = (height - size_crop) // 2
-            right = left + size_crop
-            bottom = top + size_crop
-            img_cropped = img.crop((left, top, right, bottom))
-            
-            # 리사이즈
-            img_cropped = img_cropped.resize(size, Image.Resampling.LANCZOS)
-            
-            os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
-            img_cropped.save(thumbnail_path, "JPEG", quality=85)
-            return True
+            if result["orientation"] in (5, 6, 7, 8): width, height = height, width
+            result["width"], result["height"] = width, height
+
+            if missing:
+                preview = _find_embedded_preview(img, max(side for side, _ in missing))
+                source = preview if preview is not None else img
+                for side, thumb in build_thumbnail_pyramid(source, result["orientation"], missing).items():
+                    temp_path = cache.temp_path_for_key(keys[side])
+                    thumb.save(temp_path, "JPEG", quality=QUALITY_TIERS[dict(missing)[side]]["jpeg_quality"])
+                    pyramid[side] = cache.put(keys[side], temp_path)
+                result["thumbnail_source"] = "preview" if preview is not None else "full"
     except Exception as e:
-        print(f"썸네일 생성 실패 ({image_path}): {e}")
-        return False
+        print(f"사진 정보 추출 실패 ({image_path}): {e}")
+
+    result["pyramid"] = {side: path for side, path in pyramid.items() if path}
+    result["thumbnail_path"] = pick_pyramid_level(result["pyramid"], GUI_THUMBNAIL_SIZE)
+    result["thumbnail_ok"] = result["thumbnail_path"] is not None
+    return result
+
+def get_or_create_thumbnail(cache, image_path: str, size: tuple = (200, 200),
+                            tier: str = TIER_FAST_PREVIEW) -> Optional[str]:
+    """캐시된 썸네일 경로 반환, 없으면 생성 후 캐시에 등록"""
+    try:
+        key = cache.key_for(image_path, size, tier)
+    except OSError:
+        return None
+    cached = cache.get(key)
+    if cached: return cached
+
+    temp_path = cache.temp_path_for_key(key)
+    if create_single_thumbnail(image_path, temp_path, size, tier):
+        return cache.put(key, temp_path)
+    if os.path.exists(temp_path): os.remove(temp_path)
+    return None
 
 def copy_and_rename_files(source_folder: str, bird_name_map: Dict[str, str], 
                           species_photo_map: Dict[str, List[Dict]], 
                           bird_info_map: Dict[str, Dict], # 상세 정보 맵 추가
-                          output_folder: str, log_callback=None) -> List[Dict]:
-    """편집된 이름으로 원본 파일 복사 및 이름 변경 ('시각_국명_영명' 형식)"""
-    copied_files = []
+                          output_folder: str, log_callback=None, progress_callback=None,
+                          plan: Optional[RenamePlan] = None, engine: Optional[CopyEngine] = None,
+                          resume: bool = True, verify: bool = False) -> List[Dict]:
+    """편집된 이름으로 원본 파일 복사 및 이름 변경 ('시각_국명_영명' 형식)
+
+    새 파일명은 복사 전에 build_rename_plan으로 한 번에 확정 (plan을 넘기면 그대로 사용)
+    전송은 CopyEngine이 병렬로 처리 (engine을 넘기지 않으면 저장 위치에 맞춘 일반 복사)
+    resume이면 출력 폴더의 저장 기록(SaveJournal)으로 이전에 끝난 파일은 건너뛰고 남은 파일만 복사
+    verify(또는 검증 모드 engine)이면 복사본을 BLAKE2b로 확인하고 결과 딕셔너리에 'blake2b'를 넣음
+    progress_callback(current, total)은 파일마다 호출됨 (UI 갱신은 호출 측에서 묶어서 처리)
+    """
     if log_callback: log_callback("원본 파일 복사 및 이름 변경 시작...")
+    journal = SaveJournal.open(output_folder, source_folder) if resume else None
+    try:
+        if plan is None:
+            plan = build_rename_plan(source_folder, bird_name_map, species_photo_map, bird_info_map, output_folder,
+                                     previous_names=journal.previous_names() if journal else None,
+                                     reserved_names=journal.reserved_names() if journal else ())
+        if engine is None:
+            engine = CopyEngine.for_paths(source_folder, output_folder, verify=verify)
+        os.makedirs(output_folder, exist_ok=True)
 
-    for original_filename, new_bird_name in bird_name_map.items():
-        if new_bird_name == "미분류": continue
-        source_path = os.path.join(source_folder, original_filename)
-        if not os.path.exists(source_path): continue
+        digests: Dict[int, str] = {}
+        if journal is not None:
+            journal.record_plan(plan)
+            completed_indices, remaining = journal.split(plan)
+            if completed_indices and log_callback:
+                log_callback(f"  - 이전 저장에서 완료된 {len(completed_indices)}개는 건너뜀")
+        else:
+            completed_indices, remaining = [], list(range(len(plan.entries)))
 
+        # 검증 모드: 이전에 검증된 파일은 기록된 해시를 쓰고, 검증 없이 복사된 파일은 다시 읽어 검증만 함
+        reverify: List[int] = []
+        if engine.verify:
+            for i in completed_indices:
+                digest = journal.stored_hash(plan.entries[i])
+                if digest: digests[i] = digest
+                else: reverify.append(i)
+        work = remaining + reverify
+        existing = set(range(len(remaining), len(work)))
+
+        total = len(plan.entries)
+        completed = len(completed_indices) - len(reverify)
+        failed: Set[int] = set()
+
+        def on_result(result: CopyResult):
+            nonlocal completed
+            index = work[result.index]
+            entry = plan.entries[index]
+            if result.ok:
+                if result.dest_hash: digests[index] = result.dest_hash
+            else:
+                failed.add(index)
+            completed += 1
+            if progress_callback: progress_callback(completed, total)
+            if not log_callback: return
+            if result.retries and result.ok:
+                log_callback(f"  - 체크섬 불일치로 다시 복사함: {entry.new_filename}")
+            if not result.ok:
+                log_callback(f"  - 복사 실패 ({entry.original_filename}): {result.error}")
+            elif result.method != "existing":
+                log_callback(f"  - 복사: {entry.new_filename} ({format_rate(result.bytes_per_second)})")
+
+        def on_copied(result: CopyResult):
+            # 전송이 끝나면 바로 기록하고 검증 해시는 검증 후 다시 기록 (검증 중 취소되어도 다시 복사하지 않고 검증만 함)
+            if journal is not None: journal.record_done(plan.entries[work[result.index]], result.dest_hash)
+
+        started = time.perf_counter()
+        # 원본 파일 복사 (썸네일이 아닌 원본!)
+        results = engine.run([(plan.entries[i].source_path, plan.entries[i].dest_path) for i in work],
+                             on_result, existing=existing, on_copied=on_copied)
+        copied_files = []
+        for i, entry in enumerate(plan.entries):
+            if i in failed: continue
+            info = entry.to_copied_info()
+            if i in digests: info["blake2b"] = digests[i]
+            copied_files.append(info)
+        if engine.verify and log_callback:
+            log_callback(f"  - 체크섬 확인: {len(digests)}개 일치, {len(failed)}개 실패")
+        if log_callback:
+            log_callback(f"  - 전송 완료 ({engine.mode}, {engine.profile.name}): "
+                         f"{summarize(results, time.perf_counter() - started)}")
+        return copied_files
+    finally:
+        if journal is not None: journal.close()
+
+def _find_existing_thumbnail(file_info: Dict, size: tuple, cache=None) -> Optional[str]:
+    """복사본과 같은 사진으로 이미 만들어 둔 썸네일 (로딩 때의 피라미드/썸네일, 캐시 항목), 없으면 None"""
+    side = max(size)
+    candidates = [(file_info.get('pyramid') or {}).get(side)]
+    if side == GUI_THUMBNAIL_SIZE:
+        candidates.append(file_info.get('source_thumbnail_path'))
+    for path in candidates:
         try:
-            # bird_info_map에서 국명, 영문명 가져오기
-            info = bird_info_map.get(new_bird_name, {})
-            kor_name_clean = name_check.sanitize_filename(new_bird_name)
-            eng_name_clean = name_check.sanitize_filename(info.get("common_name", ""))
-            
-            # 촬영 시간 정보 찾기
-            dt = None
-            for photos in species_photo_map.values():
-                for p in photos:
-                    if p['original_filename'] == original_filename:
-                        dt = p.get('datetime')
-                        break
-                if dt: break
-            
-            # 새 파일명 생성 ('시각_국명_영명' 형식)
-            if dt:
-                timestamp = dt.strftime("%Y%m%d_%H%M%S")
-                if eng_name_clean and eng_name_clean not in ["N_A", ""]:
-                    new_base = f"{timestamp}_{kor_name_clean}_{eng_name_clean}"
-                else:
-                    new_base = f"{timestamp}_{kor_name_clean}"
-            else: # 날짜 없을 경우
-                if eng_name_clean and eng_name_clean not in ["N_A", ""]:
-                    new_base = f"{kor_name_clean}_{eng_name_clean}"
-                else:
-                    new_base = kor_name_clean
-
-            ext = os.path.splitext(original_filename)[1]
-            new_filename = f"{new_base}{ext}"
-            
-            # 중복 파일명 처리
-            counter = 1
-            final_filename = new_filename
-            while os.path.exists(os.path.join(output_folder, final_filename)):
-                final_filename = f"{new_base}_{counter}{ext}"
-                counter += 1
-            
-            # 원본 파일 복사 (썸네일이 아닌 원본!)
-            dest_path = os.path.join(output_folder, final_filename)
-            os.makedirs(output_folder, exist_ok=True)
-            shutil.copy2(source_path, dest_path)
-            
-            copied_info = {
-                "original_path": source_path, 
-                "new_path": dest_path, 
-                "new_filename": final_filename, 
-                "bird_name": new_bird_name, 
-                "datetime": dt
-            }
-            copied_files.append(copied_info)
-            if log_callback: log_callback(f"  - 복사: {final_filename}")
-                
-        except Exception as e:
-            if log_callback: log_callback(f"  - 복사 실패 ({original_filename}): {e}")
+            if path and os.path.getsize(path) > 0: return path
+        except OSError:
             continue
-    return copied_files
+    if cache is not None:
+        # 원본 경로로 키를 계산하면 stat 색인에 지문이 있어 파일을 다시 읽지 않음 (이동 모드면 복사본 사용)
+        for image_path in (file_info.get('original_path'), file_info['new_path']):
+            if not image_path or not os.path.exists(image_path): continue
+            try:
+                return cache.get(cache.key_for(image_path, size, TIER_FAST_PREVIEW))
+            except OSError:
+                return None
+    return None
+
+def _place_thumbnail(source: str, dest: str) -> bool:
+    """기존 썸네일을 새 이름으로 복사
+
+    하드링크는 쓰지 않음: 캐시 파일과 inode를 공유하면 사용자가 출력 폴더의 썸네일을 고칠 때 캐시도 바뀌고,
+    캐시 정리/갱신이 사용자 파일에 보이게 됨 (썸네일은 작아서 복사 비용이 작음)
+    """
+    try:
+        if os.path.lexists(dest): os.remove(dest)  # 이어서 저장할 때 남아 있는 이전 썸네일
+        shutil.copyfile(source, dest)
+        return True
+    except OSError:
+        return False
 
 def update_thumbnails_for_copied_files(copied_files: List[Dict], thumbnail_folder: str, 
-                                     size: tuple = (200, 200), log_callback=None):
-    """복사된 파일들의 새로운 썸네일 생성 (정사각형 크롭)"""
+                                     size: tuple = (200, 200), log_callback=None, cache=None,
+                                     progress_callback=None):
+    """복사된 파일들의 새로운 썸네일 생성 (정사각형 크롭)
+
+    로딩 때 만든 같은 사진의 썸네일이 있으면 복사만 하고, 없을 때만 원본을 디코딩
+    """
     if log_callback: log_callback(f"🖼️ 새 썸네일 생성 중 (정사각형 크롭)...")
     os.makedirs(thumbnail_folder, exist_ok=True)
     
     success_count = 0
-    for file_info in copied_files:
+    reused_count = 0
+    for index, file_info in enumerate(copied_files, 1):
+        if progress_callback: progress_callback(index, len(copied_files))
         new_path = file_info['new_path']
         name_without_ext = os.path.splitext(file_info['new_filename'])[0]
         new_thumbnail_path = os.path.join(thumbnail_folder, f"{name_without_ext}_thumb.jpg")
         
-        if create_single_thumbnail(new_path, new_thumbnail_path, size):
+        # 복사본은 원본과 내용이 같으므로 로딩 때 만든 썸네일을 그대로 사용
+        existing = _find_existing_thumbnail(file_info, size, cache)
+        if existing and _place_thumbnail(existing, new_thumbnail_path):
+            ok = True
+            reused_count += 1
+        elif cache is not None:
+            image_path = file_info.get('original_path')
+            if not image_path or not os.path.exists(image_path): image_path = new_path
+            created = get_or_create_thumbnail(cache, image_path, size)
+            ok = bool(created) and _place_thumbnail(created, new_thumbnail_path)
+        else:
+            if os.path.lexists(new_thumbnail_path): os.remove(new_thumbnail_path)
+            ok = create_single_thumbnail(new_path, new_thumbnail_path, size)
+
+        if ok:
             file_info['new_thumbnail_path'] = new_thumbnail_path
             success_count += 1
         else:
             file_info['new_thumbnail_path'] = None
             
-    if log_callback: log_callback(f"  - {success_count}/{len(copied_files)}개 썸네일 생성 완료")
\ No newline at end of file
+    if log_callback:
+        log_callback(f"  - {success_count}/{len(copied_files)}개 썸네일 생성 완료 "
+                     f"(기존 썸네일 재사용 {reused_count}개, 새로 디코딩 {success_count - reused_count}개)")
@@ -0,0 +1,101 @@
+# 파일 이름: wiki_cache.py - Wikipedia 조회 결과 영구 캐시 (TTL, 오프라인 모드)
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+CACHE_FILENAME = "wiki_cache.sqlite3"
+POSITIVE_TTL_SEC = 90 * 24 * 3600  # 정보를 찾은 경우 90일
+NEGATIVE_TTL_SEC = 7 * 24 * 3600  # 페이지가 없거나 정보가 없던 경우 7일
+
+
+def get_default_cache_path(csv_dir: str) -> str:
+    """CSV 옆에 캐시 파일 생성 (PyInstaller 실행파일이면 사용자 폴더)"""
+    if getattr(sys, "frozen", False):
+        if sys.platform.startswith("win"):
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+            csv_dir = os.path.join(base, "BirdRenamer")
+        else:
+            csv_dir = os.path.join(os.path.expanduser("~"), ".cache", "bird_renamer")
+        os.makedirs(csv_dir, exist_ok=True)
+    return os.path.join(csv_dir, CACHE_FILENAME)
+
+
+class WikiCache:
+    """국명 → Wikipedia 조회 결과 캐시
+
+    - 찾은 결과와 못 찾은 결과(negative)를 모두 저장하고 항목마다 만료 시각을 둠
+    - offline=True이면 캐시에 있는 결과만 사용하고 네트워크 조회는 하지 않음
+    - 적중/미적중 횟수를 세어 상태 표시줄에 보여줄 수 있음
+    """
+
+    def __init__(self, db_path: str, offline: bool = False,
+                 positive_ttl: float = POSITIVE_TTL_SEC, negative_ttl: float = NEGATIVE_TTL_SEC):
+        self.db_path = db_path
+        self.offline = offline
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                " korean_name TEXT PRIMARY KEY, info TEXT NOT NULL, found INTEGER NOT NULL,"
+                " fetched_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, hit: bool):
+        with self._stats_lock:
+            if hit: self.hits += 1
+            else: self.misses += 1
+
+    def get(self, korean_name: str) -> Tuple[bool, Optional[Dict]]:
+        """(적중 여부, 정보) 반환. 오프라인 모드에서는 만료된 항목도 사용"""
+        try:
+            row = self._conn().execute(
+                "SELECT info, expires_at FROM lookups WHERE korean_name = ?", (korean_name,)
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row and (self.offline or row[1] > time.time()):
+            self._count(True)
+            return True, json.loads(row[0])
+        self._count(False)
+        return False, None
+
+    def put(self, korean_name: str, info: Dict):
+        """조회 결과 저장 (빈 결과는 짧은 TTL의 negative 항목)"""
+        found = any(info.values())
+        now = time.time()
+        ttl = self.positive_ttl if found else self.negative_ttl
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, ?, ?)",
+                    (korean_name, json.dumps(info, ensure_ascii=False), int(found), now, now + ttl),
+                )
+        except sqlite3.Error:
+            pass
+
+    def stats_text(self) -> str:
+        mode = "오프라인" if self.offline else "온라인"
+        return f"Wiki 캐시({mode}): 적중 {self.hits}, 미적중 {self.misses}"
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,208 @@
+# 파일 이름: wiki_client.py - MediaWiki API 일괄 조회 클라이언트 (연결 재사용, 동시 요청 제한, 장애 대응)
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_API_URL = "https://{lang}.wikipedia.org/w/api.php"
+DEFAULT_USER_AGENT = "BirdRenamerApp/1.0"
+TITLES_PER_REQUEST = 20  # prop=extracts는 한 요청에 최대 20개 문서까지 요약을 돌려줌
+DEFAULT_TIMEOUT = (3.05, 10)  # (연결, 응답 읽기) 초
+DEFAULT_MAX_RETRIES = 2  # 요청 하나당 재시도 횟수
+DEFAULT_RETRY_BUDGET = 20  # 세션 전체에서 허용하는 재시도 총량
+DEFAULT_FAILURE_THRESHOLD = 3  # 연속 실패가 이만큼 쌓이면 세션 동안 Wiki 조회 중단
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_MAX_SEC = 5.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """연속 실패로 차단기가 열려 요청을 보내지 않은 경우"""
+
+
+class WikiBatchClient:
+    """여러 문서를 titles=a|b|c 한 요청으로 조회하는 MediaWiki 클라이언트
+
+    - requests.Session 하나를 재사용하여 HTTP keep-alive 연결 풀 사용
+    - 묶음 요청은 최대 max_workers개까지만 동시에 보냄
+    - 요청마다 타임아웃, 지수 백오프 재시도(세션 전체 재시도 예산 한도 내)
+    - 연속 failure_threshold번 실패하면 차단기가 열려 이후 요청은 바로 CircuitOpenError
+    - api_url_template을 바꾸면 로컬 테스트 서버로 요청을 보낼 수 있음
+    """
+
+    def __init__(self, api_url_template: str = DEFAULT_API_URL, user_agent: str = DEFAULT_USER_AGENT,
+                 max_workers: int = 4, timeout=DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES, retry_budget: int = DEFAULT_RETRY_BUDGET,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 session: Optional[requests.Session] = None):
+        self.api_url_template = api_url_template
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+        self.reset_stats()
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+
+    # --- 통계 / 차단기 ---
+    def reset_stats(self):
+        """통계와 차단기 상태 초기화 (재시도 예산도 다시 채움)"""
+        with self._lock:
+            self.request_count = 0
+            self.failure_count = 0
+            self.retry_count = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+            self.consecutive_failures = 0
+            self.retries_left = self.retry_budget
+            self.circuit_open = False
+
+    def _record(self, latency: Optional[float], success: bool):
+        with self._lock:
+            self.request_count += 1
+            if latency is not None:
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+            if success:
+                self.consecutive_failures = 0
+            else:
+                self.failure_count += 1
+
+    def _record_final_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold and not self.circuit_open:
+                self.circuit_open = True
+                print(f"Wiki 연속 {self.consecutive_failures}회 실패: 이번 세션 동안 Wiki 조회를 건너뜁니다.")
+
+    def _take_retry(self) -> bool:
+        with self._lock:
+            if self.retries_left <= 0: return False
+            self.retries_left -= 1
+            self.retry_count += 1
+            return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": self.request_count, "failures": self.failure_count,
+                "retries": self.retry_count, "retries_left": self.retries_left,
+                "avg_latency": self.total_latency / self.request_count if self.request_count else 0.0,
+                "max_latency": self.max_latency, "circuit_open": self.circuit_open,
+            }
+
+    def stats_text(self) -> str:
+        st = self.stats()
+        text = (f"Wiki 요청 {st['requests']}회 (실패 {st['failures']}, 재시도 {st['retries']}), "
+                f"평균 {st['avg_latency'] * 1000:.0f}ms")
+        return text + " - 차단됨" if st["circuit_open"] else text
+
+    # --- 요청 ---
+    def _get(self, lang: str, params: Dict) -> Dict:
+        attempt = 0
+        while True:
+            if self.circuit_open:
+                raise CircuitOpenError("Wiki 연결 차단 중 (연속 실패)")
+            start = time.monotonic()
+            retry_after = None
+            try:
+                response = self.session.get(self.api_url_template.format(lang=lang), params=params, timeout=self.timeout)
+                latency = time.monotonic() - start
+                if response.status_code in RETRY_STATUS_CODES:
+                    retry_after = response.headers.get("Retry-After")
+                    raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+                response.raise_for_status()
+                data = response.json()
+                self._record(latency, True)
+                return data
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError, ValueError) as e:
+                self._record(time.monotonic() - start, False)
+                retryable = not isinstance(e, ValueError) and (
+                    not isinstance(e, requests.HTTPError)
+                    or (e.response is not None and e.response.status_code in RETRY_STATUS_CODES)
+                )
+                if not retryable or attempt >= self.max_retries or not self._take_retry():
+                    self._record_final_failure()
+                    raise
+                attempt += 1
+                delay = min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * 2 ** (attempt - 1)) * (0.5 + random.random() / 2)
+                if retry_after and retry_after.isdigit():
+                    delay = min(BACKOFF_MAX_SEC, max(delay, float(retry_after)))
+                time.sleep(delay)
+
+    def _query_chunk(self, lang: str, titles: List[str]) -> Dict[str, Dict]:
+        """한 묶음 조회. {요청한 제목: {"exists", "extract", "langlinks"}} 반환"""
+        params = {
+            "action": "query", "format": "json", "formatversion": 2, "redirects": 1,
+            "titles": "|".join(titles),
+            "prop": "extracts|langlinks", "exintro": 1, "explaintext": 1,
+            "exlimit": "max", "lllang": "en", "lllimit": "max",
+        }
+        pages: Dict[str, Dict] = {}
+        aliases: Dict[str, str] = {}
+        while True:
+            data = self._get(lang, params)
+            query = data.get("query", {})
+            # 정규화/넘겨주기(redirect) 결과를 요청한 제목으로 되돌리기 위한 매핑
+            for item in query.get("normalized", []) + query.get("redirects", []):
+                aliases[item["from"]] = item["to"]
+            for page in query.get("pages", []):
+                entry = pages.setdefault(page["title"], {"exists": False, "extract": "", "langlinks": {}})
+                entry["exists"] = entry["exists"] or not (page.get("missing") or page.get("invalid"))
+                if page.get("extract"):
+                    entry["extract"] = page["extract"]
+                for link in page.get("langlinks", []):
+                    entry["langlinks"][link["lang"]] = link["title"]
+            # exlimit 등으로 잘린 경우 continue 값으로 이어서 요청
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+        result = {}
+        for title in titles:
+            resolved, seen = title, set()
+            while resolved in aliases and resolved not in seen:
+                seen.add(resolved)
+                resolved = aliases[resolved]
+            result[title] = pages.get(resolved, {"exists": False, "extract": "", "langlinks": {}})
+        return result
+
+    def fetch_pages(self, lang: str, titles: List[str]) -> Tuple[Dict[str, Dict], Set[str]]:
+        """여러 문서를 묶음 요청으로 조회. ({제목: 문서 정보}, 요청이 실패한 제목 집합) 반환"""
+        titles = [t for t in dict.fromkeys(titles) if t]
+        chunks = [titles[i:i + TITLES_PER_REQUEST] for i in range(0, len(titles), TITLES_PER_REQUEST)]
+        pages: Dict[str, Dict] = {}
+        failed: Set[str] = set()
+        if not chunks:
+            return pages, failed
+        if self.circuit_open:
+            return pages, set(titles)
+
+        def run(chunk):
+            try:
+                return chunk, self._query_chunk(lang, chunk)
+            except CircuitOpenError:
+                return chunk, None
+            except (requests.RequestException, ValueError) as e:
+                print(f"Wiki 일괄 조회 실패 ({lang}, {len(chunk)}건): {e}")
+                return chunk, None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            for chunk, chunk_pages in executor.map(run, chunks):
+                if chunk_pages is None:
+                    failed.update(chunk)
+                else:
+                    pages.update(chunk_pages)
+        return pages, failed
+
+    def close(self):
+        self.session.close()